@@ -2,11 +2,12 @@
 Django Admin MCP - Expose Django admin models to MCP clients
 """
 
-from django_admin_mcp.mixin import MCPAdminMixin
+from django_admin_mcp.mixin import MCPAdminMixin, get_registered_models
 
 __version__ = "0.3.0"
 __author__ = "Barbaros Goren"
 __email__ = "gorenbarbaros@gmail.com"
 __all__ = [
     "MCPAdminMixin",
+    "get_registered_models",
 ]
@@ -11,3 +11,25 @@ class DjangoAdminMcpConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_admin_mcp"
     verbose_name = "Django Admin MCP"
+
+    def ready(self):
+        """
+        Register MCP admins found on the admin site and build their tool definitions.
+
+        MCPAdminMixin still registers itself on instantiation, so admins
+        registered after startup keep working; this makes sure the registry
+        and tool schemas are built once in the main process (before servers
+        that preload the app fork their workers) instead of on the first call.
+        Admins are only present here when django.contrib.admin is listed
+        before django_admin_mcp in INSTALLED_APPS.
+        """
+        # Deferred imports: the mixin and tool modules import handlers that use the app registry
+        from django.contrib import admin  # noqa: PLC0415
+
+        from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
+        from django_admin_mcp.tools import get_tools  # noqa: PLC0415
+
+        for model_admin in list(admin.site._registry.values()):
+            if isinstance(model_admin, MCPAdminMixin):
+                MCPAdminMixin.register_model_tools(model_admin)
+        get_tools()
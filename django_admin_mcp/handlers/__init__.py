@@ -11,17 +11,25 @@ from django_admin_mcp.handlers.actions import (
     handle_bulk,
 )
 from django_admin_mcp.handlers.base import (
+    JSONArrayWriter,
     async_check_permission,
     check_permission,
     create_mock_request,
+    encode_json,
     format_form_errors,
     get_admin_form_class,
     get_exposed_models,
     get_model_admin,
     get_model_name,
+    get_serialized_field_names,
+    iter_serialized_queryset,
+    json_dumps,
+    json_dumps_incremental,
     json_response,
     normalize_fk_fields,
     serialize_instance,
+    serialize_queryset,
+    text_response,
 )
 from django_admin_mcp.handlers.crud import (
     handle_create,
@@ -42,17 +50,25 @@ from django_admin_mcp.handlers.relations import (
 
 __all__ = [
     # Base utilities
+    "JSONArrayWriter",
     "async_check_permission",
     "check_permission",
     "create_mock_request",
+    "encode_json",
     "format_form_errors",
     "get_admin_form_class",
     "get_exposed_models",
     "get_model_admin",
     "get_model_name",
+    "get_serialized_field_names",
+    "iter_serialized_queryset",
+    "json_dumps",
+    "json_dumps_incremental",
     "json_response",
     "normalize_fk_fields",
     "serialize_instance",
+    "serialize_queryset",
+    "text_response",
     # Action handlers
     "handle_action",
     "handle_actions",
@@ -10,14 +10,21 @@ from typing import Any
 from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.http import HttpRequest
-from pydantic import TypeAdapter
 
 from django_admin_mcp.handlers.base import (
+    JSONArrayWriter,
+    fetch_in_bulk,
     format_form_errors,
     get_admin_form_class,
+    invalidate_cached_objects,
+    json_dumps_incremental,
     json_response,
+    merge_form_data,
     normalize_fk_fields,
     safe_error_message,
+    save_model_form,
+    serialize_data_for_log,
+    text_response,
 )
 from django_admin_mcp.handlers.decorators import require_permission, require_registered_model
 from django_admin_mcp.protocol.types import TextContent
@@ -43,7 +50,7 @@ def _get_admin_actions(model_admin, request):
     return model_admin.get_actions(request)
 
 
-def _log_action(user, obj, action_flag: int, change_message: str = ""):
+def _log_action(user, obj, action_flag: int, change_message: str = "", content_type_id: int | None = None):
     """
     Log an action to Django's admin LogEntry.
 
@@ -52,19 +59,21 @@ def _log_action(user, obj, action_flag: int, change_message: str = ""):
         obj: The model instance that was affected.
         action_flag: ADDITION (1), CHANGE (2), or DELETION (3).
         change_message: Description of the change.
+        content_type_id: Optional ContentType id for obj's model. Bulk
+            handlers resolve it once per batch instead of once per item.
     """
     if user is None:
         return  # Can't log without a user
 
     # Deferred import: Django models require app registry to be ready
     from django.contrib.admin.models import LogEntry  # noqa: PLC0415
-    from django.contrib.contenttypes.models import ContentType  # noqa: PLC0415
 
-    content_type = ContentType.objects.get_for_model(obj)
+    if content_type_id is None:
+        content_type_id = _get_content_type_id(obj)
 
     LogEntry.objects.create(
         user_id=user.pk,
-        content_type_id=content_type.pk,
+        content_type_id=content_type_id,
         object_id=str(obj.pk),
         object_repr=str(obj)[:200],
         action_flag=action_flag,
@@ -72,6 +81,14 @@ def _log_action(user, obj, action_flag: int, change_message: str = ""):
     )
 
 
+def _get_content_type_id(model_or_obj) -> int:
+    """Return the ContentType id used to log actions on a model or instance."""
+    # Deferred import: Django models require app registry to be ready
+    from django.contrib.contenttypes.models import ContentType  # noqa: PLC0415
+
+    return ContentType.objects.get_for_model(model_or_obj).pk
+
+
 @require_registered_model
 @require_permission("view")
 async def handle_actions(
@@ -103,7 +120,8 @@ async def handle_actions(
         actions_info = []
 
         if model_admin:
-            actions_dict = _get_admin_actions(model_admin, request)
+            # get_actions() runs permission checks that can query the database
+            actions_dict = await sync_to_async(_get_admin_actions)(model_admin, request)
             for name, (_func, name, description) in actions_dict.items():
                 actions_info.append({"name": name, "description": str(description)})
 
@@ -163,13 +181,14 @@ async def handle_action(
 
             # Handle built-in delete_selected directly (it renders HTML in Django)
             if action_name == "delete_selected":
-                deleted_count = queryset.count()
+                # The count above already covers the selection; don't re-query it
                 queryset.delete()
+                invalidate_cached_objects()
                 return {
                     "success": True,
                     "action": action_name,
-                    "affected_count": deleted_count,
-                    "message": f"Deleted {deleted_count} {model._meta.verbose_name_plural}",
+                    "affected_count": count,
+                    "message": f"Deleted {count} {model._meta.verbose_name_plural}",
                 }
 
             # Look up custom action via Django's get_actions
@@ -178,6 +197,8 @@ async def handle_action(
                 if action_name in actions_dict:
                     func, name, description = actions_dict[action_name]
                     result = func(model_admin, request, queryset)
+                    # Custom actions may change any row, of this model or others
+                    invalidate_cached_objects()
                     return {
                         "success": True,
                         "action": action_name,
@@ -202,9 +223,14 @@ def _get_bulk_user(request):
     return user
 
 
+def _new_bulk_results() -> dict[str, JSONArrayWriter]:
+    """Create success/error result arrays that encode each entry as it is recorded."""
+    return {"success": JSONArrayWriter(), "errors": JSONArrayWriter()}
+
+
 def _bulk_response(operation, items, results):
     """Build standardized bulk operation response."""
-    return json_response(
+    text = json_dumps_incremental(
         {
             "operation": operation,
             "total_items": len(items),
@@ -213,6 +239,7 @@ def _bulk_response(operation, items, results):
             "results": results,
         }
     )
+    return text_response(text)
 
 
 @require_registered_model
@@ -233,29 +260,38 @@ async def handle_bulk_create(
 
         items = arguments.get("items", [])
         user = _get_bulk_user(request)
-        results: dict[str, list] = {"success": [], "errors": []}
+        results = _new_bulk_results()
         form_class = get_admin_form_class(model, model_admin, request, obj=None)
-
-        for i, item_data in enumerate(items):
-            try:
-                normalized_data = normalize_fk_fields(model, item_data)
-                form = form_class(data=normalized_data)
-                if not form.is_valid():
-                    results["errors"].append(
-                        {
-                            "index": i,
-                            "error": "Validation failed",
-                            "validation_errors": format_form_errors(form.errors),
-                        }
-                    )
-                    continue
-
-                with transaction.atomic():
-                    obj = form.save()
-                    _log_action(user=user, obj=obj, action_flag=ADDITION, change_message="Bulk created via MCP")
-                results["success"].append({"index": i, "id": obj.pk, "created": True})
-            except Exception as e:
-                results["errors"].append({"index": i, "error": safe_error_message(e)})
+        content_type_id = _get_content_type_id(model) if user is not None else None
+
+        # Commit the batch once; each item still rolls back alone through its savepoint
+        with transaction.atomic():
+            for i, item_data in enumerate(items):
+                try:
+                    normalized_data = normalize_fk_fields(model, item_data)
+                    form = form_class(data=normalized_data)
+                    if not form.is_valid():
+                        results["errors"].append(
+                            {
+                                "index": i,
+                                "error": "Validation failed",
+                                "validation_errors": format_form_errors(form.errors),
+                            }
+                        )
+                        continue
+
+                    with transaction.atomic():
+                        obj = form.save()
+                        _log_action(
+                            user=user,
+                            obj=obj,
+                            action_flag=ADDITION,
+                            change_message="Bulk created via MCP",
+                            content_type_id=content_type_id,
+                        )
+                    results["success"].append({"index": i, "id": obj.pk, "created": True})
+                except Exception as e:
+                    results["errors"].append({"index": i, "error": safe_error_message(e)})
 
         return items, results
 
@@ -278,57 +314,61 @@ async def handle_bulk_update(
     @sync_to_async
     def execute():
         from django.contrib.admin.models import CHANGE  # noqa: PLC0415
-        from django.forms.models import model_to_dict  # noqa: PLC0415
 
         items = arguments.get("items", [])
         user = _get_bulk_user(request)
-        results: dict[str, list] = {"success": [], "errors": []}
-        data_adapter = TypeAdapter(dict[str, Any])
-
-        for i, item in enumerate(items):
-            try:
-                obj_id = item.get("id")
-                data = item.get("data", {})
-                if not obj_id:
-                    results["errors"].append({"index": i, "error": "id is required for update"})
-                    continue
-
-                obj = model.objects.get(pk=obj_id)
-
-                normalized_data = normalize_fk_fields(model, data)
-                form_class = get_admin_form_class(model, model_admin, request, obj=obj)
-
-                existing_data = model_to_dict(obj)
-                merged_data = {**existing_data, **normalized_data}
-
-                form = form_class(data=merged_data, instance=obj)
-                if not form.is_valid():
-                    results["errors"].append(
-                        {
-                            "index": i,
-                            "error": "Validation failed",
-                            "validation_errors": format_form_errors(form.errors),
-                        }
-                    )
-                    continue
-
-                with transaction.atomic():
-                    obj = form.save()
-                    serialized_data = data_adapter.dump_json(data, fallback=str).decode()
-                    max_length = 500
-                    if len(serialized_data) > max_length:
-                        serialized_data = serialized_data[:max_length] + '... (truncated)"'
-                    _log_action(
-                        user=user,
-                        obj=obj,
-                        action_flag=CHANGE,
-                        change_message=f"Bulk updated via MCP: {serialized_data}",
-                    )
-                results["success"].append({"index": i, "id": obj_id, "updated": True})
-            except model.DoesNotExist:
-                results["errors"].append({"index": i, "error": f"Object with id {obj_id} not found"})
-            except Exception as e:
-                results["errors"].append({"index": i, "error": safe_error_message(e)})
+        results = _new_bulk_results()
+        content_type_id = _get_content_type_id(model) if user is not None else None
+
+        # Fetch every target row with one query instead of one per item
+        objects = fetch_in_bulk(model, [item.get("id") for item in items if isinstance(item, dict) and item.get("id")])
+
+        # Commit the batch once; each item still rolls back alone through its savepoint
+        with transaction.atomic():
+            for i, item in enumerate(items):
+                try:
+                    obj_id = item.get("id")
+                    data = item.get("data", {})
+                    if not obj_id:
+                        results["errors"].append({"index": i, "error": "id is required for update"})
+                        continue
+
+                    obj = objects.get(obj_id)
+                    if obj is None:
+                        results["errors"].append({"index": i, "error": f"Object with id {obj_id} not found"})
+                        continue
+
+                    normalized_data = normalize_fk_fields(model, data)
+                    form_class = get_admin_form_class(model, model_admin, request, obj=obj)
+
+                    merged_data = merge_form_data(obj, form_class, normalized_data)
+
+                    form = form_class(data=merged_data, instance=obj)
+                    if not form.is_valid():
+                        results["errors"].append(
+                            {
+                                "index": i,
+                                "error": "Validation failed",
+                                "validation_errors": format_form_errors(form.errors),
+                            }
+                        )
+                        continue
+
+                    with transaction.atomic():
+                        obj = save_model_form(form)
+                        serialized_data = serialize_data_for_log(data)
+                        _log_action(
+                            user=user,
+                            obj=obj,
+                            action_flag=CHANGE,
+                            change_message=f"Bulk updated via MCP: {serialized_data}",
+                            content_type_id=content_type_id,
+                        )
+                    results["success"].append({"index": i, "id": obj_id, "updated": True})
+                except Exception as e:
+                    results["errors"].append({"index": i, "error": safe_error_message(e)})
+
+        invalidate_cached_objects(model)
 
         return items, results
 
@@ -354,20 +394,38 @@ async def handle_bulk_delete(
 
         items = arguments.get("items", [])
         user = _get_bulk_user(request)
-        results: dict[str, list] = {"success": [], "errors": []}
+        results = _new_bulk_results()
         ids = items if isinstance(items, list) else []
-
-        for i, obj_id in enumerate(ids):
-            try:
-                obj = model.objects.get(pk=obj_id)
-                with transaction.atomic():
-                    _log_action(user=user, obj=obj, action_flag=DELETION, change_message="Bulk deleted via MCP")
-                    obj.delete()
-                results["success"].append({"index": i, "id": obj_id, "deleted": True})
-            except model.DoesNotExist:
-                results["errors"].append({"index": i, "error": f"Object with id {obj_id} not found"})
-            except Exception as e:
-                results["errors"].append({"index": i, "error": safe_error_message(e)})
+        content_type_id = _get_content_type_id(model) if user is not None else None
+
+        # Fetch every target row with one query instead of one per item
+        objects = fetch_in_bulk(model, ids)
+
+        # Commit the batch once; each item still rolls back alone through its savepoint
+        with transaction.atomic():
+            for i, obj_id in enumerate(ids):
+                try:
+                    obj = objects.get(obj_id)
+                    # A cleared pk means the same id was already deleted earlier in this batch
+                    if obj is None or obj.pk is None:
+                        results["errors"].append({"index": i, "error": f"Object with id {obj_id} not found"})
+                        continue
+
+                    with transaction.atomic():
+                        _log_action(
+                            user=user,
+                            obj=obj,
+                            action_flag=DELETION,
+                            change_message="Bulk deleted via MCP",
+                            content_type_id=content_type_id,
+                        )
+                        obj.delete()
+                    results["success"].append({"index": i, "id": obj_id, "deleted": True})
+                except Exception as e:
+                    results["errors"].append({"index": i, "error": safe_error_message(e)})
+
+        # Deletes can cascade to other models, so drop every cached object
+        invalidate_cached_objects()
 
         return items, results
 
@@ -5,17 +5,23 @@ This module provides shared utilities extracted from the mixin module
 for use across handler implementations.
 """
 
+import functools
 import logging
-from collections.abc import Mapping, Sequence
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
 from typing import Any
 
+import django
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.admin.sites import site
 from django.core.exceptions import FieldError
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import IntegrityError, OperationalError, models
+from django.db import IntegrityError, OperationalError, connections, models
+from django.db.models import signals
 from django.forms import ModelForm
-from django.forms.models import model_to_dict, modelform_factory
+from django.forms.models import BaseModelForm, model_to_dict, modelform_factory
 from django.http import HttpRequest
 from pydantic import TypeAdapter
 
@@ -26,6 +32,33 @@ logger = logging.getLogger("django_admin_mcp")
 # Pydantic TypeAdapter for JSON serialization - reused across all json_response calls
 _JSON_ADAPTER = TypeAdapter(dict[str, Any])
 
+# Pydantic TypeAdapter for encoding single JSON values, e.g. items of a JSONArrayWriter
+_JSON_VALUE_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
+
+# Rows fetched per database round-trip when streaming querysets, see iter_serialized_queryset()
+_ITERATOR_CHUNK_SIZE = 500
+
+# Serialized field names per (model, include, exclude), see get_serialized_field_names()
+_SERIALIZED_FIELDS_CACHE: dict[tuple, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+# FK column name -> field name per model, see normalize_fk_fields()
+_FK_ATTNAMES_CACHE: dict[type[models.Model], dict[str, str]] = {}
+
+# Fallback ModelForm class per model, see get_admin_form_class()
+_DEFAULT_FORM_CLASS_CACHE: dict[type[models.Model], type[ModelForm]] = {}
+
+# Editable private field names (e.g. GenericForeignKey) per model, see _get_editable_private_field_names()
+_PRIVATE_FIELDS_CACHE: dict[type[models.Model], tuple[str, ...]] = {}
+
+# Serialized get_<model> objects as (expiry, data) keyed by (model label, pk), see get_cached_object()
+_OBJECT_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+
+# Most objects kept in _OBJECT_CACHE; the oldest entries are evicted first
+_OBJECT_CACHE_MAXSIZE = 10_000
+
+# Value types that are never model instances; checked with type() before the costlier isinstance()
+_PRIMITIVE_TYPES = frozenset({int, str, float, bool, type(None)})
+
 
 class MCPRequest(HttpRequest):
     """
@@ -45,6 +78,178 @@ class MCPRequest(HttpRequest):
         self.POST = {}
 
 
+def json_dumps(data: dict, *, indent: int | None = None) -> str:
+    """
+    Serialize a dictionary to a JSON string.
+
+    Uses the shared Pydantic TypeAdapter, whose serializer runs in
+    pydantic-core, instead of building an adapter or using the stdlib
+    encoder per call. Values without a JSON representation fall back to str().
+
+    Args:
+        data: Dictionary to serialize.
+        indent: Optional indentation level for pretty-printed output.
+
+    Returns:
+        The JSON document as a string.
+    """
+    return _JSON_ADAPTER.dump_json(data, indent=indent, by_alias=True, fallback=str).decode("utf-8")
+
+
+def encode_json(func: Callable[..., dict]) -> Callable[..., str]:
+    """
+    Make a function that builds a response dictionary return its JSON text.
+
+    Stack under @sync_to_async so large results are encoded in the worker
+    thread along with the queries, instead of blocking the event loop.
+
+    Args:
+        func: Function returning a dictionary.
+
+    Returns:
+        Wrapped function returning the compact json_dumps() output.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        return json_dumps(func(*args, **kwargs))
+
+    return wrapper
+
+
+class JSONArrayWriter:
+    """
+    JSON array that is encoded incrementally as items are appended.
+
+    Only the encoded bytes of each item are kept, so large result lists
+    (e.g. bulk operations over thousands of rows) aren't held as Python
+    objects and then copied again by a final serialization pass. Use
+    json_dumps_incremental() to embed writers in a response document.
+    """
+
+    __slots__ = ("_buffer", "_count")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._count = 0
+
+    def append(self, item: Any) -> None:
+        """
+        Encode an item and add it to the array.
+
+        Args:
+            item: JSON-serializable value; unsupported values fall back to str().
+        """
+        if self._count:
+            self._buffer += b","
+        self._buffer += _JSON_VALUE_ADAPTER.dump_json(item, by_alias=True, fallback=str)
+        self._count += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Encode and add every item from an iterable, consuming it lazily.
+
+        Items are encoded in batches of up to _ITERATOR_CHUNK_SIZE with one
+        serializer call per batch, so long row streams don't pay the
+        per-call setup of the encoder for every row.
+
+        Args:
+            items: JSON-serializable values.
+        """
+        iterator = iter(items)
+        while batch := list(islice(iterator, _ITERATOR_CHUNK_SIZE)):
+            if self._count:
+                self._buffer += b","
+            # Splice the encoded list's items in without its surrounding brackets
+            self._buffer += _JSON_VALUE_ADAPTER.dump_json(batch, by_alias=True, fallback=str)[1:-1]
+            self._count += len(batch)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write_to(self, buffer: bytearray) -> None:
+        """
+        Write the encoded array, brackets included, to a buffer.
+
+        Args:
+            buffer: The bytearray to append to.
+        """
+        buffer += b"["
+        buffer += self._buffer
+        buffer += b"]"
+
+
+def _write_json_value(buffer: bytearray, value: Any) -> None:
+    """Append value to buffer as JSON, splicing in JSONArrayWriter contents as-is."""
+    if isinstance(value, JSONArrayWriter):
+        value.write_to(buffer)
+    elif isinstance(value, Mapping):
+        buffer += b"{"
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                buffer += b","
+            buffer += _JSON_VALUE_ADAPTER.dump_json(str(key))
+            buffer += b":"
+            _write_json_value(buffer, item)
+        buffer += b"}"
+    else:
+        buffer += _JSON_VALUE_ADAPTER.dump_json(value, by_alias=True, fallback=str)
+
+
+def json_dumps_incremental(data: Mapping[str, Any]) -> str:
+    """
+    Serialize a dictionary that may contain JSONArrayWriter values.
+
+    Writers are spliced into the output without being decoded, so their
+    items are never re-materialized. The output is compact, like json_dumps().
+
+    Args:
+        data: Dictionary to serialize; nested mappings may hold writers too.
+
+    Returns:
+        The JSON document as a string.
+    """
+    buffer = bytearray()
+    _write_json_value(buffer, data)
+    return buffer.decode("utf-8")
+
+
+def serialize_data_for_log(data: Mapping[str, Any], max_length: int = 500) -> str:
+    """
+    Serialize request data for a Django admin log message with a size limit.
+
+    Entries are encoded one at a time and encoding stops once the limit is
+    reached, so large payloads aren't serialized in full only to be cut.
+    The result matches truncating the compact json_dumps() output.
+
+    Args:
+        data: Dictionary to serialize for logging.
+        max_length: Maximum length of the serialized string (default 500).
+
+    Returns:
+        Serialized JSON string, truncated if necessary with ellipsis.
+    """
+    parts = ["{"]
+    length = 1
+    for index, (key, value) in enumerate(data.items()):
+        key_json = _JSON_VALUE_ADAPTER.dump_json(str(key)).decode("utf-8")
+        value_json = _JSON_VALUE_ADAPTER.dump_json(value, by_alias=True, fallback=str).decode("utf-8")
+        fragment = f"{',' if index else ''}{key_json}:{value_json}"
+        parts.append(fragment)
+        length += len(fragment)
+        if length > max_length:
+            break
+    else:
+        parts.append("}")
+        length += 1
+
+    data_json = "".join(parts)
+    if length > max_length:
+        return data_json[: max_length - 3] + "..."
+
+    return data_json
+
+
 def json_response(data: dict) -> list[TextContent]:
     """
     Wrap response data in TextContent list.
@@ -55,9 +260,23 @@ def json_response(data: dict) -> list[TextContent]:
     Returns:
         List containing a single TextContent with JSON-serialized data.
     """
-    # Use Pydantic TypeAdapter for JSON serialization with better type safety
-    json_bytes = _JSON_ADAPTER.dump_json(data, by_alias=True)
-    return [TextContent(text=json_bytes.decode("utf-8"))]
+    return text_response(json_dumps(data))
+
+
+def text_response(text: str) -> list[TextContent]:
+    """
+    Wrap an already-serialized JSON string in a TextContent list.
+
+    The text comes straight from a serializer, so the content model is
+    constructed without re-running pydantic validation on it.
+
+    Args:
+        text: JSON document to return.
+
+    Returns:
+        List containing a single TextContent with the given text.
+    """
+    return [TextContent.model_construct(text=text)]
 
 
 def safe_error_message(exc: Exception) -> str:
@@ -107,8 +326,8 @@ def get_model_admin(model_name: str) -> tuple[type[models.Model] | None, Any | N
     # Late import to avoid circular dependency: mixin imports handlers, handlers need mixin
     from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
 
-    if model_name in MCPAdminMixin._registered_models:
-        info = MCPAdminMixin._registered_models[model_name]
+    info = MCPAdminMixin._registered_models.get(model_name)
+    if info is not None:
         return info["model"], info.get("admin")
 
     return None, None
@@ -127,6 +346,15 @@ def create_mock_request(user=None) -> HttpRequest:
     return MCPRequest(user)
 
 
+# ModelAdmin permission method per action, see check_permission()
+_PERMISSION_METHODS = {
+    "view": "has_view_permission",
+    "add": "has_add_permission",
+    "change": "has_change_permission",
+    "delete": "has_delete_permission",
+}
+
+
 def check_permission(request: HttpRequest, model_admin: Any, action: str) -> bool:
     """
     Check Django admin permission for action (synchronous version).
@@ -147,14 +375,7 @@ def check_permission(request: HttpRequest, model_admin: Any, action: str) -> boo
     if user is None:
         return True
 
-    permission_methods = {
-        "view": "has_view_permission",
-        "add": "has_add_permission",
-        "change": "has_change_permission",
-        "delete": "has_delete_permission",
-    }
-
-    method_name = permission_methods.get(action)
+    method_name = _PERMISSION_METHODS.get(action)
     if not method_name:
         return True  # Unknown action = allow by default
 
@@ -170,6 +391,8 @@ async def async_check_permission(request: HttpRequest, model_admin: Any, action:
     Check Django admin permission for action (async version).
 
     Wraps the synchronous permission check to be safe in async context.
+    Checks that can't reach the ModelAdmin or the database are answered
+    directly, without a hop to the worker thread.
 
     Args:
         request: HttpRequest with user set.
@@ -179,6 +402,8 @@ async def async_check_permission(request: HttpRequest, model_admin: Any, action:
     Returns:
         True if permission granted, False otherwise.
     """
+    if model_admin is None or getattr(request, "user", None) is None or action not in _PERMISSION_METHODS:
+        return check_permission(request, model_admin, action)
     return await sync_to_async(check_permission)(request, model_admin, action)
 
 
@@ -198,26 +423,16 @@ def get_exposed_models() -> list[tuple[str, Any]]:
     ]
 
 
-def serialize_instance(instance: models.Model, model_admin: Any = None) -> dict:
+def _get_field_filters(model_admin: Any) -> tuple[Any, Any]:
     """
-    Serialize a Django model instance to dict with field filtering.
-
-    Respects field visibility configuration from ModelAdmin:
-    1. mcp_fields: MCP-specific list of fields to include (takes precedence)
-    2. mcp_exclude_fields: MCP-specific list of fields to exclude (takes precedence)
-    3. fields: Django admin's fields list (fallback if mcp_fields not set)
-    4. exclude: Django admin's exclude list (fallback if mcp_exclude_fields not set)
-
-    Field filtering prevents sensitive data exposure in MCP responses.
+    Resolve the field include/exclude lists configured on a ModelAdmin.
 
     Args:
-        instance: The Django model instance to serialize.
-        model_admin: Optional ModelAdmin with field configuration.
+        model_admin: ModelAdmin with field configuration, or None.
 
     Returns:
-        Dictionary representation of the model instance with filtered fields.
+        Tuple of (fields_to_include, fields_to_exclude); either may be None.
     """
-    # Determine which fields to include/exclude
     fields_to_include = None
     fields_to_exclude = None
 
@@ -235,22 +450,533 @@ def serialize_instance(instance: models.Model, model_admin: Any = None) -> dict:
             # 2. Fallback to Django admin's exclude
             fields_to_exclude = model_admin.exclude
 
-    # Use model_to_dict with fields/exclude parameters
-    obj_dict = model_to_dict(instance, fields=fields_to_include, exclude=fields_to_exclude)
+    return fields_to_include, fields_to_exclude
+
+
+def serialize_instance(
+    instance: models.Model,
+    model_admin: Any = None,
+    m2m_values: Mapping[str, Iterable[Any]] | None = None,
+) -> dict:
+    """
+    Serialize a Django model instance to dict with field filtering.
+
+    Respects field visibility configuration from ModelAdmin:
+    1. mcp_fields: MCP-specific list of fields to include (takes precedence)
+    2. mcp_exclude_fields: MCP-specific list of fields to exclude (takes precedence)
+    3. fields: Django admin's fields list (fallback if mcp_fields not set)
+    4. exclude: Django admin's exclude list (fallback if mcp_exclude_fields not set)
+
+    Field filtering prevents sensitive data exposure in MCP responses.
 
-    # Convert non-serializable fields
-    serialized = {}
-    for key, value in obj_dict.items():
+    Args:
+        instance: The Django model instance to serialize.
+        model_admin: Optional ModelAdmin with field configuration.
+        m2m_values: Optional mapping of M2M field names to the related objects
+            (or primary keys) already known for them, e.g. the values a form
+            just saved. These fields are serialized without querying the database.
+
+    Returns:
+        Dictionary representation of the model instance with filtered fields.
+    """
+    # Determine which fields to include/exclude
+    fields_to_include, fields_to_exclude = _get_field_filters(model_admin)
+
+    # M2M values supplied by the caller don't need to be fetched again
+    known_m2m = dict(m2m_values) if m2m_values else {}
+    model_exclude = [*(fields_to_exclude or []), *known_m2m] if known_m2m else fields_to_exclude
+
+    # Use model_to_dict with fields/exclude parameters
+    obj_dict = model_to_dict(instance, fields=fields_to_include, exclude=model_exclude)
+    for name, values in known_m2m.items():
+        if fields_to_include is not None and name not in fields_to_include:
+            continue
+        if fields_to_exclude and name in fields_to_exclude:
+            continue
+        obj_dict[name] = list(values)
+
+    # model_to_dict() returns concrete fields as column values (FKs as ids), so only
+    # M2M and editable private fields can hold model instances that need converting
+    _concrete_names, m2m_names = get_serialized_field_names(type(instance), fields_to_include, fields_to_exclude)
+    for key in (*m2m_names, *_get_editable_private_field_names(type(instance))):
+        if key not in obj_dict:
+            continue
+        value = obj_dict[key]
+        if type(value) in _PRIMITIVE_TYPES:
+            continue
         if isinstance(value, models.Model):
             # Related object - convert to PK
-            serialized[key] = value.pk
+            obj_dict[key] = value.pk
         elif isinstance(value, list | models.QuerySet):
-            # M2M fields - convert to list of PKs
-            serialized[key] = [item.pk if isinstance(item, models.Model) else item for item in value]
-        else:
-            serialized[key] = value
+            # M2M fields - convert to list of PKs, skipping the subclass check for ids
+            obj_dict[key] = [
+                item if type(item) in _PRIMITIVE_TYPES or not isinstance(item, models.Model) else item.pk
+                for item in value
+            ]
+
+    return obj_dict
+
+
+def _get_editable_private_field_names(model: type[models.Model]) -> tuple[str, ...]:
+    """
+    Get the names of a model's editable private fields, cached per model.
+
+    Args:
+        model: The Django model class.
+
+    Returns:
+        Tuple of field names that model_to_dict() may return model instances for.
+    """
+    names = _PRIVATE_FIELDS_CACHE.get(model)
+    if names is None:
+        names = _PRIVATE_FIELDS_CACHE[model] = tuple(
+            f.name for f in model._meta.private_fields if getattr(f, "editable", False)
+        )
+    return names
+
+
+def get_serialized_field_names(
+    model: type[models.Model],
+    fields_to_include: Sequence[Any] | None = None,
+    fields_to_exclude: Sequence[Any] | None = None,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Get the field names serialize_instance() outputs for a model.
+
+    Mirrors model_to_dict(): only editable fields, in concrete-then-M2M
+    order, filtered by the include/exclude lists. Results are cached per
+    model and filter combination since model metadata doesn't change.
+
+    Args:
+        model: The Django model class.
+        fields_to_include: Optional list of field names to include.
+        fields_to_exclude: Optional list of field names to exclude.
+
+    Returns:
+        Tuple of (concrete field names, M2M field names).
+    """
+    key = (
+        model,
+        None if fields_to_include is None else tuple(fields_to_include),
+        None if fields_to_exclude is None else tuple(fields_to_exclude),
+    )
+    try:
+        cached = _SERIALIZED_FIELDS_CACHE.get(key)
+        cacheable = True
+    except TypeError:
+        # Unhashable field configuration (e.g. nested lists) - compute without caching
+        cached = None
+        cacheable = False
+    if cached is not None:
+        return cached
+
+    def is_serialized(field) -> bool:
+        if not getattr(field, "editable", False):
+            return False
+        if fields_to_include is not None and field.name not in fields_to_include:
+            return False
+        return not (fields_to_exclude and field.name in fields_to_exclude)
+
+    opts = model._meta
+    names = (
+        tuple(f.name for f in opts.concrete_fields if is_serialized(f)),
+        tuple(f.name for f in opts.many_to_many if is_serialized(f)),
+    )
+    if cacheable:
+        _SERIALIZED_FIELDS_CACHE[key] = names
+    return names
+
+
+def serialize_queryset(
+    queryset: models.QuerySet, model_admin: Any = None, fields: Iterable[str] | None = None
+) -> list[dict]:
+    """
+    Serialize every row of a queryset the same way as serialize_instance().
+
+    Rows are read with values() straight from the database cursor, so no
+    model instances are built. Models whose serialized fields include M2M
+    relations (or editable private fields) fall back to model instances,
+    with the M2M relations prefetched in one query each.
 
-    return serialized
+    Args:
+        queryset: The queryset to serialize (may be sliced).
+        model_admin: Optional ModelAdmin with field configuration.
+        fields: Optional field names to limit each row to; see iter_serialized_queryset().
+
+    Returns:
+        List of serialized row dictionaries.
+    """
+    return list(iter_serialized_queryset(queryset, model_admin, fields=fields))
+
+
+def _can_read_m2m_as_values(model: type[models.Model], m2m_names: Iterable[str]) -> bool:
+    """
+    Check whether M2M fields can be read from the related model by reverse lookup.
+
+    Relations declared with a hidden related_name (ending in '+', as used by
+    symmetrical self-references) have no reverse query name to filter on.
+
+    Args:
+        model: The Django model class.
+        m2m_names: Names of ManyToMany fields on the model.
+
+    Returns:
+        True if every field exposes a reverse query name.
+    """
+    opts = model._meta
+    for name in m2m_names:
+        remote_field = opts.get_field(name).remote_field
+        # Read related_name directly: ForeignObjectRel.is_hidden() became the hidden property in Django 5.1
+        if remote_field is None or (remote_field.related_name or "").endswith("+"):
+            return False
+    return True
+
+
+def _iter_values_with_m2m(
+    queryset: models.QuerySet,
+    concrete_names: Sequence[str],
+    m2m_names: Sequence[str],
+    chunk_size: int,
+) -> Iterator[dict]:
+    """
+    Yield rows with M2M primary keys without building model instances.
+
+    Concrete columns come from QuerySet.values(); each M2M field is then
+    resolved for a whole chunk with one values_list() query over the
+    related model's default manager, so its default ordering matches what
+    model_to_dict() would return.
+
+    Args:
+        queryset: The queryset to serialize (may be sliced).
+        concrete_names: Concrete field names to select.
+        m2m_names: ManyToMany field names to resolve.
+        chunk_size: Number of rows fetched from the cursor at a time.
+
+    Yields:
+        Serialized row dictionaries.
+    """
+    opts = queryset.model._meta
+    relations = [(name, opts.get_field(name)) for name in m2m_names]
+    rows_iter = queryset.values("pk", *concrete_names).iterator(chunk_size=chunk_size)
+    while rows := list(islice(rows_iter, chunk_size)):
+        pks = [row["pk"] for row in rows]
+        related_pks: dict[str, dict[Any, list]] = {}
+        for name, field in relations:
+            query_name = field.related_query_name()
+            by_source: dict[Any, list] = {}
+            pairs = field.related_model._default_manager.filter(**{f"{query_name}__in": pks}).values_list(
+                query_name, "pk"
+            )
+            for source_pk, target_pk in pairs:
+                by_source.setdefault(source_pk, []).append(target_pk)
+            related_pks[name] = by_source
+        for row in rows:
+            pk = row.pop("pk")
+            for name, _field in relations:
+                row[name] = related_pks[name].get(pk, [])
+            yield row
+
+
+def iter_serialized_queryset(
+    queryset: models.QuerySet,
+    model_admin: Any = None,
+    chunk_size: int = _ITERATOR_CHUNK_SIZE,
+    fields: Iterable[str] | None = None,
+) -> Iterator[dict]:
+    """
+    Yield serialized rows of a queryset one at a time.
+
+    Like serialize_queryset(), but rows are streamed with
+    QuerySet.iterator() rather than loaded into the queryset's result
+    cache, so callers that encode rows as they go (see JSONArrayWriter)
+    hold at most chunk_size rows as Python objects, however large the page.
+
+    Args:
+        queryset: The queryset to serialize (may be sliced).
+        model_admin: Optional ModelAdmin with field configuration.
+        chunk_size: Number of rows fetched from the cursor at a time.
+        fields: Optional field names to limit each row to. Only the matching
+            columns are selected; names the admin's field configuration hides
+            are still left out.
+
+    Yields:
+        Serialized row dictionaries.
+    """
+    model = queryset.model
+    fields_to_include, fields_to_exclude = _get_field_filters(model_admin)
+    concrete_names, m2m_names = get_serialized_field_names(model, fields_to_include, fields_to_exclude)
+    private_names = _get_editable_private_field_names(model)
+    wanted = None
+    if fields is not None:
+        wanted = set(fields)
+        concrete_names = tuple(name for name in concrete_names if name in wanted)
+        m2m_names = tuple(name for name in m2m_names if name in wanted)
+        private_names = tuple(name for name in private_names if name in wanted)
+
+    if m2m_names and not private_names and _can_read_m2m_as_values(model, m2m_names):
+        yield from _iter_values_with_m2m(queryset, concrete_names, m2m_names, chunk_size)
+    elif m2m_names or private_names:
+        queryset = queryset.prefetch_related(*m2m_names)
+        # iterator() only honours prefetch_related() from Django 4.1, earlier versions load the page at once
+        objs = queryset.iterator(chunk_size=chunk_size) if django.VERSION >= (4, 1) else queryset
+        for obj in objs:
+            row = serialize_instance(obj, model_admin)
+            yield row if wanted is None else {key: value for key, value in row.items() if key in wanted}
+    elif not concrete_names:
+        # values() with no arguments would select every field
+        for _pk in queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size):
+            yield {}
+    else:
+        yield from queryset.values(*concrete_names).iterator(chunk_size=chunk_size)
+
+
+def fetch_in_bulk(model: type[models.Model], ids: Iterable[Any]) -> dict[Any, models.Model]:
+    """
+    Fetch model instances for a batch of primary keys with a single query.
+
+    Identifiers are converted with the primary key field's to_python() so
+    that string and integer forms of the same key resolve to one row.
+    Identifiers that cannot be converted are skipped, so callers report
+    them the same way as missing rows.
+
+    Args:
+        model: The Django model class.
+        ids: Primary key values as supplied by the client.
+
+    Returns:
+        Dictionary mapping each supplied identifier to its instance.
+        Identifiers without a matching row are omitted.
+    """
+    pk_field = model._meta.pk
+    lookup: dict[Any, Any] = {}
+    for value in ids:
+        try:
+            lookup[value] = pk_field.to_python(value)
+        except (DjangoValidationError, TypeError):
+            continue
+
+    if not lookup:
+        return {}
+
+    instances = model._default_manager.in_bulk(set(lookup.values()))
+    return {value: instances[pk] for value, pk in lookup.items() if pk in instances}
+
+
+def _get_object_cache_key(model: type[models.Model], pk: Any) -> tuple[str, str] | None:
+    """Build the _OBJECT_CACHE key for a primary key, or None if it can't be converted."""
+    try:
+        return model._meta.label, str(model._meta.pk.to_python(pk))
+    except (DjangoValidationError, TypeError):
+        return None
+
+
+def get_cached_object(model: type[models.Model], pk: Any) -> dict | None:
+    """
+    Look up a serialized object stored by cache_object().
+
+    Caching is opt-in: it is disabled unless the MCP_GET_CACHE_TTL setting
+    is a positive number of seconds. Writes made through MCP invalidate
+    entries; changes made elsewhere (e.g. the admin site) are visible once
+    the entry expires.
+
+    Args:
+        model: The Django model class.
+        pk: Primary key as supplied by the client.
+
+    Returns:
+        A shallow copy of the cached dictionary, or None on a miss.
+    """
+    if not _OBJECT_CACHE or getattr(settings, "MCP_GET_CACHE_TTL", 0) <= 0:
+        return None
+    key = _get_object_cache_key(model, pk)
+    if key is None:
+        return None
+    entry = _OBJECT_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, data = entry
+    if expires_at <= time.monotonic():
+        _OBJECT_CACHE.pop(key, None)
+        return None
+    return dict(data)
+
+
+def cache_object(model: type[models.Model], pk: Any, data: dict) -> None:
+    """
+    Store a serialized object for get_cached_object(), if caching is enabled.
+
+    Args:
+        model: The Django model class.
+        pk: Primary key of the object.
+        data: Serialized object; a shallow copy is stored.
+    """
+    ttl = getattr(settings, "MCP_GET_CACHE_TTL", 0)
+    if ttl <= 0:
+        return
+    key = _get_object_cache_key(model, pk)
+    if key is None:
+        return
+    _OBJECT_CACHE[key] = (time.monotonic() + ttl, dict(data))
+    while len(_OBJECT_CACHE) > _OBJECT_CACHE_MAXSIZE:
+        try:
+            _OBJECT_CACHE.pop(next(iter(_OBJECT_CACHE)), None)
+        except (StopIteration, RuntimeError):
+            break
+
+
+def invalidate_cached_objects(model: type[models.Model] | None = None, pks: Iterable[Any] | None = None) -> None:
+    """
+    Drop cached objects after they were changed through MCP.
+
+    Args:
+        model: The Django model class, or None to clear every model.
+        pks: Primary keys to drop, or None for all objects of the model.
+    """
+    if not _OBJECT_CACHE:
+        return
+    if model is None:
+        _OBJECT_CACHE.clear()
+    elif pks is None:
+        label = model._meta.label
+        for key in [key for key in list(_OBJECT_CACHE) if key[0] == label]:
+            _OBJECT_CACHE.pop(key, None)
+    else:
+        for pk in pks:
+            # A pk that can't be converted was never cached
+            pk_key = _get_object_cache_key(model, pk)
+            if pk_key is not None:
+                _OBJECT_CACHE.pop(pk_key, None)
+
+
+def select_for_update_self(queryset: models.QuerySet) -> models.QuerySet:
+    """
+    Lock the rows of a queryset for the rest of the current transaction.
+
+    Uses SELECT ... FOR UPDATE OF on backends that support it, so rows of
+    tables joined in (e.g. through a manager's select_related()) aren't
+    locked along with the target rows.
+
+    Args:
+        queryset: The queryset whose rows should be locked.
+
+    Returns:
+        The queryset with select_for_update() applied.
+    """
+    locked = queryset.select_for_update()
+    if connections[locked.db].features.has_select_for_update_of:
+        return queryset.select_for_update(of=("self",))
+    return locked
+
+
+def has_save_hooks(model: type[models.Model]) -> bool:
+    """
+    Check whether saving a model runs code beyond Django's default save().
+
+    Args:
+        model: The Django model class.
+
+    Returns:
+        True if the model overrides save() or has pre_save/post_save receivers.
+    """
+    return (
+        model.save is not models.Model.save
+        or signals.pre_save.has_listeners(model)
+        or signals.post_save.has_listeners(model)
+    )
+
+
+def has_clean_hooks(form: ModelForm) -> bool:
+    """
+    Check whether validating a form can set values beyond the submitted changes.
+
+    Values that a form or model clean() method derives, such as a slug
+    computed from a title, land on the instance without appearing in
+    form.changed_data, so callers writing only changed columns must fall
+    back to form.save() for them.
+
+    Args:
+        form: The ModelForm instance.
+
+    Returns:
+        True if the form overrides clean() or defines a clean_<field>() method,
+        or the model overrides clean(), clean_fields() or full_clean().
+    """
+    form_class = type(form)
+    model = type(form.instance)
+    return (
+        form_class.clean is not BaseModelForm.clean
+        or any(name.startswith("clean_") for name in dir(form_class))
+        or model.clean is not models.Model.clean
+        or model.clean_fields is not models.Model.clean_fields
+        or model.full_clean is not models.Model.full_clean
+    )
+
+
+def save_model_form(form: ModelForm) -> models.Model:
+    """
+    Save a validated ModelForm, writing only the changed columns when possible.
+
+    For an existing instance whose form only changed concrete, non-primary-key
+    fields, and when neither the form nor the model hooks into cleaning or
+    saving, the changed columns (plus auto_now fields) are written with one
+    QuerySet.update() instead of a save() that rewrites every column and
+    re-assigns M2M fields. Everything else goes through form.save().
+
+    Args:
+        form: A ModelForm on which is_valid() has returned True.
+
+    Returns:
+        The saved model instance.
+    """
+    instance = form.instance
+    model = type(instance)
+    if (
+        instance._state.adding
+        or type(form).save is not BaseModelForm.save
+        or has_save_hooks(model)
+        or has_clean_hooks(form)
+    ):
+        return form.save()
+
+    opts = model._meta
+    concrete_fields = {field.name: field for field in opts.concrete_fields if not field.primary_key}
+    changed = set(form.changed_data)
+    if not changed <= concrete_fields.keys():
+        return form.save()
+
+    # Cleaned values are already on the instance; pre_save() also refreshes auto_now fields
+    fields = [field for name, field in concrete_fields.items() if name in changed or getattr(field, "auto_now", False)]
+    values = {}
+    for field in fields:
+        value = field.pre_save(instance, add=False)
+        setattr(instance, field.attname, value)
+        values[field.attname] = value
+    if values:
+        model._base_manager.filter(pk=instance.pk).update(**values)
+    return instance
+
+
+def merge_form_data(instance: models.Model, form_class: type, data: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Build bound form data for a partial update of an existing instance.
+
+    The instance's current values fill in every field the payload leaves
+    out. M2M values cost a query each, so they are only read for fields
+    the form has and the payload doesn't replace.
+
+    Args:
+        instance: The existing model instance.
+        form_class: The ModelForm class the data will be bound to.
+        data: The fields being updated.
+
+    Returns:
+        Dictionary of current values overlaid with data.
+    """
+    skip = set(data)
+    form_fields = getattr(form_class, "base_fields", None)
+    if form_fields is not None:
+        skip.update(field.name for field in instance._meta.many_to_many if field.name not in form_fields)
+    return {**model_to_dict(instance, exclude=skip), **data}
 
 
 def get_model_name(model: type[models.Model]) -> str:
@@ -305,7 +1031,11 @@ def get_admin_form_class(
             if form_class is not ModelForm and issubclass(form_class, ModelForm):
                 return form_class
 
-    return modelform_factory(model, fields="__all__")
+    # Form classes are stateless, so the generated fallback is built once per model
+    form_class = _DEFAULT_FORM_CLASS_CACHE.get(model)
+    if form_class is None:
+        form_class = _DEFAULT_FORM_CLASS_CACHE[model] = modelform_factory(model, fields="__all__")
+    return form_class
 
 
 def normalize_fk_fields(model: type[models.Model], data: dict) -> dict:
@@ -324,12 +1054,15 @@ def normalize_fk_fields(model: type[models.Model], data: dict) -> dict:
         New dictionary with normalized field names.
     """
     # Get FK field names and their db column names
-    fk_fields = {}
-    for field in model._meta.get_fields():
-        if hasattr(field, "attname") and hasattr(field, "name"):
-            # FK fields have attname like 'author_id' and name like 'author'
-            if field.attname != field.name:
-                fk_fields[field.attname] = field.name
+    fk_fields = _FK_ATTNAMES_CACHE.get(model)
+    if fk_fields is None:
+        fk_fields = {}
+        for field in model._meta.get_fields():
+            if hasattr(field, "attname") and hasattr(field, "name"):
+                # FK fields have attname like 'author_id' and name like 'author'
+                if field.attname != field.name:
+                    fk_fields[field.attname] = field.name
+        _FK_ATTNAMES_CACHE[model] = fk_fields
 
     # Normalize the data
     normalized = {}
@@ -8,44 +8,102 @@ Delete operations extracted from the mixin module.
 from typing import Any
 
 from asgiref.sync import sync_to_async
+from django.contrib.admin import ModelAdmin
 from django.db import models, transaction
 from django.db.models import Q
 from django.forms import ModelForm
-from django.forms.models import model_to_dict, modelform_factory
+from django.forms.models import BaseModelForm, modelform_factory
 from django.http import HttpRequest
-from pydantic import TypeAdapter
 
 from django_admin_mcp.handlers.base import (
+    JSONArrayWriter,
+    cache_object,
     check_inline_permission,
+    fetch_in_bulk,
     format_form_errors,
     get_admin_form_class,
+    get_cached_object,
+    has_clean_hooks,
+    has_save_hooks,
+    invalidate_cached_objects,
+    iter_serialized_queryset,
+    json_dumps,
+    json_dumps_incremental,
     json_response,
+    merge_form_data,
     normalize_fk_fields,
     safe_error_message,
+    save_model_form,
+    select_for_update_self,
+    serialize_data_for_log,
     serialize_instance,
+    serialize_queryset,
+    text_response,
 )
 from django_admin_mcp.handlers.decorators import require_permission, require_registered_model
 from django_admin_mcp.protocol.types import CreateResponse, ListResponse, TextContent, UpdateResponse
 
 
-def _serialize_data_for_log(data: dict[str, Any], max_length: int = 500) -> str:
+def _uses_default_admin_method(model_admin: Any, name: str) -> bool:
     """
-    Serialize data for Django admin log message with size limit.
+    Check whether a ModelAdmin uses Django's default implementation of a method.
 
     Args:
-        data: Dictionary to serialize for logging.
-        max_length: Maximum length of the serialized string (default 500).
+        model_admin: The ModelAdmin instance.
+        name: Method name, e.g. 'save_model' or 'delete_model'.
 
     Returns:
-        Serialized JSON string, truncated if necessary with ellipsis.
+        True if neither the class nor the instance overrides the method.
     """
-    adapter = TypeAdapter(dict[str, Any])
-    data_json = adapter.dump_json(data).decode("utf-8")
+    if name in getattr(model_admin, "__dict__", {}):
+        return False
+    return getattr(type(model_admin), name, None) is getattr(ModelAdmin, name)
 
-    if len(data_json) > max_length:
-        return data_json[: max_length - 3] + "..."
 
-    return data_json
+def _get_saved_m2m_values(form: ModelForm) -> dict[str, Any]:
+    """
+    Collect the M2M values a validated model form saves.
+
+    After save_m2m() these match the database, so the response can be built
+    from them instead of re-querying each M2M relation.
+
+    Args:
+        form: A validated ModelForm that has been saved.
+
+    Returns:
+        Dictionary mapping M2M field names to their cleaned values.
+    """
+    m2m_names = {field.name for field in form._meta.model._meta.many_to_many}
+    return {name: value for name, value in form.cleaned_data.items() if name in m2m_names}
+
+
+# Field names per model class, see _get_field_names()
+_FIELD_NAMES_CACHE: dict[type[models.Model], frozenset[str]] = {}
+
+# Accepted order_by values per model class, see _get_valid_ordering_fields()
+_ORDERING_FIELDS_CACHE: dict[type[models.Model], frozenset[str]] = {}
+
+# Lookups for ModelAdmin.search_fields prefixes, see _construct_search_lookup()
+_SEARCH_PREFIX_LOOKUPS = {"^": "istartswith", "=": "iexact", "@": "search"}
+
+
+def _get_field_names(model: type[models.Model]) -> frozenset[str]:
+    """
+    Get the names of all fields on a model, including reverse relations.
+
+    Model _meta doesn't change at runtime, so get_fields() is walked once
+    per model.
+
+    Args:
+        model: The Django model class.
+
+    Returns:
+        Frozenset of field names.
+    """
+    names = _FIELD_NAMES_CACHE.get(model)
+    if names is None:
+        names = _FIELD_NAMES_CACHE[model] = frozenset(f.name for f in model._meta.get_fields() if hasattr(f, "name"))
+    return names
 
 
 def _build_filter_query(model: type[models.Model], filters: dict[str, Any]) -> Q:
@@ -68,7 +126,7 @@ def _build_filter_query(model: type[models.Model], filters: dict[str, Any]) -> Q
         Q object for filtering queryset.
     """
     q = Q()
-    valid_fields = {f.name for f in model._meta.get_fields() if hasattr(f, "name")}
+    valid_fields = _get_field_names(model)
 
     for key, value in filters.items():
         # Extract field name from lookup (e.g., "name__icontains" -> "name")
@@ -97,30 +155,82 @@ def _build_search_query(model: type[models.Model], search_fields: list[str], sea
 
     q = Q()
     for field in search_fields:
-        # Use icontains for text search
-        lookup = f"{field}__icontains"
-        q |= Q(**{lookup: search_term})
+        q |= Q(**{_construct_search_lookup(field): search_term})
     return q
 
 
-def _get_valid_ordering_fields(model: type[models.Model]) -> set:
+def _construct_search_lookup(field_name: str) -> str:
     """
-    Get the set of valid field names for ordering.
+    Build the lookup for a search_fields entry, honouring admin prefixes.
+
+    Mirrors ModelAdmin.get_search_results(): '^' searches with istartswith
+    and '=' with iexact, both of which the database can answer from an index
+    on the column, '@' uses full-text search, and anything else falls back
+    to icontains (a leading-wildcard LIKE that always scans the table).
+
+    Args:
+        field_name: Entry from ModelAdmin.search_fields.
+
+    Returns:
+        Lookup string suitable for a Q object keyword.
+    """
+    prefix = field_name[:1]
+    if prefix in _SEARCH_PREFIX_LOOKUPS:
+        return f"{field_name[1:]}__{_SEARCH_PREFIX_LOOKUPS[prefix]}"
+    return f"{field_name}__icontains"
+
+
+def _get_valid_ordering_fields(model: type[models.Model]) -> frozenset[str]:
+    """
+    Get the set of valid field names for ordering, cached per model.
 
     Args:
         model: The Django model class.
 
     Returns:
-        Set of valid field names including descending order variants.
+        Frozenset of valid field names including descending order variants.
     """
-    valid_fields = set()
-    for field in model._meta.get_fields():
-        if hasattr(field, "name"):
-            valid_fields.add(field.name)
-            valid_fields.add(f"-{field.name}")  # Allow descending order
+    valid_fields = _ORDERING_FIELDS_CACHE.get(model)
+    if valid_fields is None:
+        names = _get_field_names(model)
+        # Allow descending order
+        valid_fields = _ORDERING_FIELDS_CACHE[model] = names | {f"-{name}" for name in names}
     return valid_fields
 
 
+# Inline FK field per (inline model, parent model, fk_name), see _get_inline_fk_field()
+_INLINE_FK_CACHE: dict[tuple[type[models.Model], type[models.Model], str | None], Any] = {}
+
+
+def _get_inline_fk_field(
+    inline_model: type[models.Model], parent_model: type[models.Model], fk_name: str | None = None
+) -> Any:
+    """
+    Find the field on an inline model that relates it to the parent model.
+
+    The result is cached, so each inline's fields are walked once.
+
+    Args:
+        inline_model: The inline model class.
+        parent_model: The parent model class the inline is edited from.
+        fk_name: Optional name of the field to use when several relate to the parent.
+
+    Returns:
+        The first matching field, or None if the inline has no relation to the parent.
+    """
+    key = (inline_model, parent_model, fk_name)
+    if key not in _INLINE_FK_CACHE:
+        _INLINE_FK_CACHE[key] = next(
+            (
+                field
+                for field in inline_model._meta.get_fields()
+                if getattr(field, "related_model", None) is parent_model and (fk_name is None or field.name == fk_name)
+            ),
+            None,
+        )
+    return _INLINE_FK_CACHE[key]
+
+
 def _get_inline_data(obj: models.Model, admin: Any) -> dict[str, list[dict[str, Any]]]:
     """
     Get inline related objects for a model instance.
@@ -146,25 +256,82 @@ def _get_inline_data(obj: models.Model, admin: Any) -> dict[str, list[dict[str,
         fk_name = getattr(inline_class, "fk_name", None)
 
         # Find the FK field that points to our parent model
-        fk_field = None
-        for field in inline_model._meta.get_fields():
-            if hasattr(field, "related_model") and field.related_model is type(obj):
-                if fk_name is None or field.name == fk_name:
-                    fk_field = field
-                    break
+        fk_field = _get_inline_fk_field(inline_model, type(obj), fk_name)
 
         if fk_field:
             # Get related objects
             related_name = fk_field.name
             filter_kwargs = {related_name: obj}
             related_objects = inline_model.objects.filter(**filter_kwargs)
-            inlines_data[inline_model._meta.model_name] = [
-                serialize_instance(related_obj) for related_obj in related_objects
-            ]
+            inlines_data[inline_model._meta.model_name] = serialize_queryset(related_objects)
 
     return inlines_data
 
 
+def _save_inline_forms(inline_model: type[models.Model], forms: list[ModelForm]) -> list[Exception | None]:
+    """
+    Persist validated inline change forms, batching plain field updates.
+
+    Forms that only change concrete, non-primary-key fields are written with a
+    single bulk_update() call. Forms with a custom save() or clean hooks,
+    changes to M2M or non-model fields, and models that override save() or
+    have save signal receivers are saved one by one so that their hooks, and
+    any values derived while cleaning, still take effect.
+
+    Each save runs in its own savepoint, so a failing form doesn't undo the
+    others or break the surrounding transaction.
+
+    Args:
+        inline_model: The inline model class the forms edit.
+        forms: Validated ModelForm instances bound to existing objects.
+
+    Returns:
+        One entry per form, in order: None if it was saved, otherwise the
+        exception that prevented it.
+    """
+    concrete_fields = {field.name: field for field in inline_model._meta.concrete_fields}
+    batchable_fields = concrete_fields.keys() - {inline_model._meta.pk.name}
+    can_batch = not has_save_hooks(inline_model)
+
+    # auto_now fields are refreshed by save(), so bulk_update() must write them too
+    update_fields = {name for name, field in concrete_fields.items() if getattr(field, "auto_now", False)}
+    errors: list[Exception | None] = [None] * len(forms)
+    batch: list[int] = []
+    for index, form in enumerate(forms):
+        changed = set(form.changed_data)
+        if (
+            can_batch
+            and type(form).save is BaseModelForm.save
+            and not has_clean_hooks(form)
+            and changed <= batchable_fields
+        ):
+            batch.append(index)
+            update_fields |= changed
+            continue
+        try:
+            with transaction.atomic():
+                form.save()
+        except Exception as e:
+            errors[index] = e
+
+    if not batch or not update_fields:
+        return errors
+
+    fields = [concrete_fields[name] for name in sorted(update_fields)]
+    instances = [forms[index].instance for index in batch]
+    try:
+        with transaction.atomic():
+            for instance in instances:
+                for field in fields:
+                    setattr(instance, field.attname, field.pre_save(instance, add=False))
+            inline_model._default_manager.bulk_update(instances, [field.name for field in fields])
+    except Exception as e:
+        # bulk_update() writes the batch as a whole, so every form in it failed
+        for index in batch:
+            errors[index] = e
+    return errors
+
+
 def _update_inlines(
     obj: models.Model,
     admin: Any,
@@ -204,11 +371,7 @@ def _update_inlines(
             continue
 
         # Find the FK field
-        fk_field = None
-        for field in inline_model._meta.get_fields():
-            if hasattr(field, "related_model") and field.related_model is type(obj):
-                fk_field = field
-                break
+        fk_field = _get_inline_fk_field(inline_model, type(obj))
 
         if not fk_field:
             continue
@@ -221,6 +384,18 @@ def _update_inlines(
             inline_form_class = modelform_factory(inline_model, fields="__all__")
 
         inline_items = inlines_data[inline_model_name]
+
+        # Fetch every row targeted by an update with one query instead of one per item
+        existing_objects = fetch_in_bulk(
+            inline_model,
+            [
+                item.get("id")
+                for item in inline_items
+                if isinstance(item, dict) and item.get("id") and not item.get("_delete", False)
+            ],
+        )
+        pending_updates: list[tuple[Any, ModelForm]] = []
+
         for item in inline_items:
             try:
                 item_id = item.get("id")
@@ -257,17 +432,25 @@ def _update_inlines(
                         continue
 
                     # Update existing inline with form validation
-                    inline_obj = inline_model.objects.get(pk=item_id)
+                    inline_obj = existing_objects.get(item_id)
+                    if inline_obj is None:
+                        results["errors"].append(
+                            {
+                                "model": inline_model_name,
+                                "id": item_id,
+                                "error": f"{inline_model_name} not found",
+                            }
+                        )
+                        continue
 
                     # Merge existing data with updates
-                    existing_data = model_to_dict(inline_obj)
                     update_data = {k: v for k, v in item_data.items() if k not in ["id", "_delete"]}
-                    merged_data = {**existing_data, **update_data}
+                    merged_data = merge_form_data(inline_obj, inline_form_class, update_data)
 
                     form = inline_form_class(data=merged_data, instance=inline_obj)
                     if form.is_valid():
-                        form.save()
-                        results["updated"].append({"model": inline_model_name, "id": item_id})
+                        # Saved together with the other updates once all items are validated
+                        pending_updates.append((item_id, form))
                     else:
                         results["errors"].append(
                             {
@@ -316,6 +499,16 @@ def _update_inlines(
                     }
                 )
 
+        if pending_updates:
+            save_errors = _save_inline_forms(inline_model, [form for _item_id, form in pending_updates])
+            for (item_id, _form), error in zip(pending_updates, save_errors, strict=True):
+                if error is None:
+                    results["updated"].append({"model": inline_model_name, "id": item_id})
+                else:
+                    results["errors"].append(
+                        {"model": inline_model_name, "id": item_id, "error": safe_error_message(error)}
+                    )
+
     return results
 
 
@@ -364,6 +557,8 @@ async def handle_list(
             - filters: dict of field:value filter criteria
             - search: str search term
             - order_by: list of field names (prefix with - for descending)
+            - fields: list of field names to return (default: all serialized fields)
+            - pretty: bool (default False) - Indent the JSON response
         request: HttpRequest with user for permission checking.
         model: Resolved Django model class (injected by decorator).
         model_admin: Resolved ModelAdmin instance (injected by decorator).
@@ -377,6 +572,13 @@ async def handle_list(
         filters = arguments.get("filters", {})
         search = arguments.get("search", "")
         order_by = arguments.get("order_by", [])
+        fields = arguments.get("fields")
+        pretty = arguments.get("pretty", False)
+
+        if fields is not None:
+            unknown_fields = [name for name in fields if name not in _get_field_names(model)]
+            if unknown_fields:
+                return json_response({"error": f"Unknown fields: {', '.join(map(str, unknown_fields))}"})
 
         # Get search fields from admin or use empty list
         search_fields = getattr(model_admin, "search_fields", []) if model_admin else []
@@ -414,19 +616,19 @@ async def handle_list(
             # Get total count before pagination
             total_count = queryset.count()
 
-            # Apply pagination
-            queryset = queryset[offset : offset + limit]
-            return total_count, [serialize_instance(obj) for obj in queryset]
+            # Apply pagination, reading rows as plain dicts instead of building model instances
+            page = queryset[offset : offset + limit]
+            if pretty:
+                rows = serialize_queryset(page, fields=fields)
+                return ListResponse(count=len(rows), total_count=total_count, results=rows).model_dump_json(indent=2)
 
-        total_count, results = await get_objects()
+            # Encode rows as they stream from the cursor instead of buffering the page
+            results = JSONArrayWriter()
+            # Only the requested columns are selected, so wide TEXT/JSON columns can be skipped
+            results.extend(iter_serialized_queryset(page, fields=fields))
+            return json_dumps_incremental({"count": len(results), "total_count": total_count, "results": results})
 
-        response = ListResponse(
-            count=len(results),
-            total_count=total_count,
-            results=results,
-        )
-
-        return [TextContent(text=response.model_dump_json(indent=2))]
+        return text_response(await get_objects())
     except Exception as e:
         return json_response({"error": safe_error_message(e)})
 
@@ -445,6 +647,7 @@ async def handle_get(
             - id: int or str (primary key) - Required
             - include_inlines: bool (default False) - Include inline related objects
             - include_related: bool (default False) - Include reverse FK/M2M objects
+            - pretty: bool (default False) - Indent the JSON response
         request: HttpRequest with user for permission checking.
         model: Resolved Django model class (injected by decorator).
         model_admin: Resolved ModelAdmin instance (injected by decorator).
@@ -456,14 +659,23 @@ async def handle_get(
         obj_id = arguments.get("id")
         include_inlines = arguments.get("include_inlines", False)
         include_related = arguments.get("include_related", False)
+        pretty = arguments.get("pretty", False)
 
         if not obj_id:
             return json_response({"error": "id parameter is required"})
 
         @sync_to_async
         def get_object():
+            # Plain lookups may be served from the opt-in object cache (see MCP_GET_CACHE_TTL)
+            if not include_inlines and not include_related:
+                cached = get_cached_object(model, obj_id)
+                if cached is not None:
+                    return json_dumps(cached, indent=2 if pretty else None)
+
             obj = model.objects.get(pk=obj_id)
             result = serialize_instance(obj, model_admin)
+            if not include_inlines and not include_related:
+                cache_object(model, obj.pk, result)
 
             # Include inlines if requested
             if include_inlines and model_admin:
@@ -480,20 +692,15 @@ async def handle_get(
                             if hasattr(obj, accessor_name):
                                 related_manager = getattr(obj, accessor_name)
                                 if hasattr(related_manager, "all"):
-                                    related_data[accessor_name] = [
-                                        serialize_instance(r)
-                                        for r in related_manager.all()[:10]  # Limit to 10
-                                    ]
+                                    # Limit to 10; read as rows so M2M fields aren't queried per object
+                                    related_data[accessor_name] = serialize_queryset(related_manager.all()[:10])
                 if related_data:
                     result["_related"] = related_data
 
-            return result
+            # Encode in the worker thread too, so large inline/related payloads don't block the event loop
+            return json_dumps(result, indent=2 if pretty else None)
 
-        obj_dict = await get_object()
-
-        # Use Pydantic's JSON encoder for proper serialization
-        adapter = TypeAdapter(dict[str, Any])
-        return [TextContent(text=adapter.dump_json(obj_dict, indent=2).decode("utf-8"))]
+        return text_response(await get_object())
     except model.DoesNotExist:  # type: ignore[attr-defined]
         return json_response({"error": f"{model_name} not found"})
     except Exception as e:
@@ -515,6 +722,7 @@ async def handle_create(
         model_name: The lowercase name of the model.
         arguments: Dictionary containing:
             - data: dict of field:value pairs for the new instance
+            - pretty: bool (default False) - Indent the JSON response
         request: HttpRequest with user for permission checking and logging.
         model: Resolved Django model class (injected by decorator).
         model_admin: Resolved ModelAdmin instance (injected by decorator).
@@ -526,6 +734,7 @@ async def handle_create(
     """
     try:
         data = arguments.get("data", {})
+        pretty = arguments.get("pretty", False)
         user = getattr(request, "user", None)
         if user and not user.is_authenticated:
             user = None
@@ -535,21 +744,22 @@ async def handle_create(
             # Deferred import: Django models require app registry to be ready
             from django.contrib.admin.models import ADDITION  # noqa: PLC0415
 
-            # Normalize FK field names (convert field_id to field)
-            normalized_data = normalize_fk_fields(model, data)
+            # Run validation, save, and logging in one transaction so the
+            # whole create commits once
+            with transaction.atomic():
+                # Normalize FK field names (convert field_id to field)
+                normalized_data = normalize_fk_fields(model, data)
 
-            # Get the form class from ModelAdmin or generate one
-            form_class = get_admin_form_class(model, model_admin, request, obj=None)
+                # Get the form class from ModelAdmin or generate one
+                form_class = get_admin_form_class(model, model_admin, request, obj=None)
 
-            # Instantiate form with submitted data
-            form = form_class(data=normalized_data)
+                # Instantiate form with submitted data
+                form = form_class(data=normalized_data)
 
-            # Validate the form
-            if not form.is_valid():
-                return None, format_form_errors(form.errors)
+                # Validate the form
+                if not form.is_valid():
+                    return None, format_form_errors(form.errors)
 
-            # Wrap save and logging in transaction for atomicity
-            with transaction.atomic():
                 # Save the form to create the object
                 # Use ModelAdmin.save_model() when available for the standard Django admin pipeline
                 if model_admin is not None:
@@ -560,7 +770,7 @@ async def handle_create(
                     obj = form.save()
 
                 # Log the action - use Pydantic for serialization (truncated for log size)
-                data_json = _serialize_data_for_log(data)
+                data_json = serialize_data_for_log(data)
                 _log_action(
                     user=user,
                     obj=obj,
@@ -568,7 +778,7 @@ async def handle_create(
                     change_message=f"Created via MCP: {data_json}",
                 )
 
-            return obj.pk, serialize_instance(obj, model_admin)
+            return obj.pk, serialize_instance(obj, model_admin, m2m_values=_get_saved_m2m_values(form))
 
         result_id, result_data = await create_object()
 
@@ -588,7 +798,7 @@ async def handle_create(
             object=result_data,
         )
 
-        return [TextContent(text=response.model_dump_json(indent=2))]
+        return text_response(response.model_dump_json(indent=2 if pretty else None))
     except Exception as e:
         return json_response({"error": safe_error_message(e)})
 
@@ -610,6 +820,7 @@ async def handle_update(
             - id: int or str (primary key) - Required
             - data: dict of field:value pairs to update
             - inlines: optional dict for inline updates
+            - pretty: bool (default False) - Indent the JSON response
         request: HttpRequest with user for permission checking and logging.
         model: Resolved Django model class (injected by decorator).
         model_admin: Resolved ModelAdmin instance (injected by decorator).
@@ -623,20 +834,22 @@ async def handle_update(
         obj_id = arguments.get("id")
         data = arguments.get("data", {})
         inlines_data = arguments.get("inlines", {})
+        pretty = arguments.get("pretty", False)
 
         if not obj_id:
             return json_response({"error": "id parameter is required"})
 
-        # Validate that only model fields are being updated (protect against mass assignment)
-        valid_fields = {f.name for f in model._meta.get_fields() if hasattr(f, "name")}
-        for key in data.keys():
-            if key not in valid_fields:
-                return json_response({"error": f"Invalid field: {key}"})
+        # Validate that only model fields are being updated (protect against mass assignment).
+        # The subset test runs as one set operation; the key loop only runs to name an invalid field.
+        valid_fields = _get_field_names(model)
+        if not data.keys() <= valid_fields:
+            invalid_key = next(key for key in data if key not in valid_fields)
+            return json_response({"error": f"Invalid field: {invalid_key}"})
 
         # Check for readonly_fields - prevent updating them
         if model_admin:
             readonly_fields = set(getattr(model_admin, "readonly_fields", []))
-            readonly_attempted = set(data.keys()) & readonly_fields
+            readonly_attempted = data.keys() & readonly_fields
             if readonly_attempted:
                 return json_response(
                     {
@@ -654,35 +867,36 @@ async def handle_update(
             # Deferred import: Django models require app registry to be ready
             from django.contrib.admin.models import CHANGE  # noqa: PLC0415
 
-            obj = model.objects.get(pk=obj_id)
+            # Run the fetch, save, inline updates, and logging in one transaction.
+            # The row lock keeps concurrent updates from interleaving with inline writes.
+            with transaction.atomic():
+                obj = select_for_update_self(model.objects.all()).get(pk=obj_id)
 
-            # Normalize FK field names (convert field_id to field)
-            normalized_data = normalize_fk_fields(model, data)
+                # Normalize FK field names (convert field_id to field)
+                normalized_data = normalize_fk_fields(model, data)
 
-            # Get the form class from ModelAdmin
-            form_class = get_admin_form_class(model, model_admin, request, obj=obj)
+                # Get the form class from ModelAdmin
+                form_class = get_admin_form_class(model, model_admin, request, obj=obj)
 
-            # For partial updates, merge existing data with new data
-            existing_data = model_to_dict(obj)
-            merged_data = {**existing_data, **normalized_data}
+                # For partial updates, merge existing data with new data
+                merged_data = merge_form_data(obj, form_class, normalized_data)
 
-            # Instantiate form with merged data and existing instance
-            form = form_class(data=merged_data, instance=obj)
+                # Instantiate form with merged data and existing instance
+                form = form_class(data=merged_data, instance=obj)
 
-            # Validate the form
-            if not form.is_valid():
-                return None, format_form_errors(form.errors), {}
+                # Validate the form
+                if not form.is_valid():
+                    return None, format_form_errors(form.errors), {}
 
-            # Wrap save, inline updates, and logging in transaction for atomicity
-            with transaction.atomic():
                 # Save the form to update the object
-                # Use ModelAdmin.save_model() when available for the standard Django admin pipeline
-                if model_admin is not None:
+                # Use ModelAdmin.save_model() when customized for the standard Django admin pipeline;
+                # the default one only calls save(), so write just the changed columns instead
+                if model_admin is not None and not _uses_default_admin_method(model_admin, "save_model"):
                     obj = form.save(commit=False)
                     model_admin.save_model(request, obj, form, change=True)
                     form.save_m2m()
                 else:
-                    obj = form.save()
+                    obj = save_model_form(form)
 
                 # Handle inlines if provided
                 inlines_result = {}
@@ -692,7 +906,7 @@ async def handle_update(
                 # Log the action - use Pydantic for serialization (truncated for log size)
                 change_message = []
                 if data:
-                    data_json = _serialize_data_for_log(data)
+                    data_json = serialize_data_for_log(data)
                     change_message.append(f"Changed via MCP: {data_json}")
                 if inlines_data:
                     change_message.append(f"Updated inlines: {list(inlines_data.keys())}")
@@ -703,7 +917,13 @@ async def handle_update(
                     change_message=(" | ".join(change_message) if change_message else "Updated via MCP"),
                 )
 
-            return serialize_instance(obj, model_admin), None, inlines_result
+            # Inline saves change rows of other models, so drop every cached object then
+            if inlines_data:
+                invalidate_cached_objects()
+            else:
+                invalidate_cached_objects(model, [obj.pk])
+            obj_dict = serialize_instance(obj, model_admin, m2m_values=_get_saved_m2m_values(form))
+            return obj_dict, None, inlines_result
 
         obj_dict, validation_errors, inlines_result = await update_object()
 
@@ -723,7 +943,7 @@ async def handle_update(
             inlines=inlines_result if inlines_result and any(inlines_result.values()) else None,
         )
 
-        return [TextContent(text=response.model_dump_json(indent=2))]
+        return text_response(response.model_dump_json(indent=2 if pretty else None))
     except model.DoesNotExist:  # type: ignore[attr-defined]
         return json_response({"error": f"{model_name} not found"})
     except Exception as e:
@@ -764,11 +984,24 @@ async def handle_delete(
             # Deferred import: Django models require app registry to be ready
             from django.contrib.admin.models import DELETION  # noqa: PLC0415
 
-            obj = model.objects.get(pk=obj_id)
-            obj_repr = str(obj)
-
-            # Wrap logging and deletion in transaction for atomicity
+            # Without a user to log for, a custom delete_model() or an overridden Model.delete(),
+            # nothing needs the instance, so let the DELETE find the row instead of fetching and locking it first
+            if (
+                user is None
+                and model.delete is models.Model.delete
+                and (model_admin is None or _uses_default_admin_method(model_admin, "delete_model"))
+            ):
+                deleted, _ = model.objects.filter(pk=obj_id).delete()
+                if not deleted:
+                    raise model.DoesNotExist
+                invalidate_cached_objects()
+                return None
+
+            # Wrap the fetch, logging, and deletion in one transaction for atomicity
             with transaction.atomic():
+                obj = select_for_update_self(model.objects.all()).get(pk=obj_id)
+                obj_repr = str(obj)
+
                 # Log the action BEFORE deleting (so we still have the object)
                 _log_action(
                     user=user,
@@ -782,6 +1015,8 @@ async def handle_delete(
                     model_admin.delete_model(request, obj)
                 else:
                     obj.delete()
+            # Deletes can cascade to other models, so drop every cached object
+            invalidate_cached_objects()
             return obj_repr
 
         await delete_object()
@@ -6,24 +6,33 @@ This module provides handlers for model metadata and discovery operations:
 - handle_find_models: Discover MCP-exposed models
 """
 
+import weakref
+from dataclasses import dataclass
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.db import models
 from django.http import HttpRequest
 
 from django_admin_mcp.handlers.base import (
-    async_check_permission,
+    check_permission,
     json_response,
     safe_error_message,
 )
 from django_admin_mcp.handlers.decorators import require_permission, require_registered_model
 from django_admin_mcp.protocol.types import TextContent
 
+# Field metadata keyed by id(field); the field is stored alongside so a reused id can't return stale data
+_FIELD_METADATA_CACHE: dict[int, tuple[Any, dict[str, Any]]] = {}
+
 
 def _get_field_metadata(field) -> dict[str, Any]:
     """
     Extract comprehensive metadata from a Django model field.
 
+    Fields live on model _meta for the life of the process, so the
+    metadata is computed once per field and a copy is returned.
+
     Args:
         field: A Django model field instance.
 
@@ -35,6 +44,25 @@ def _get_field_metadata(field) -> dict[str, Any]:
         - relationship info (related_model, on_delete)
         - primary_key, unique, editable flags
     """
+    cached = _FIELD_METADATA_CACHE.get(id(field))
+    if cached is not None and cached[0] is field:
+        return dict(cached[1])
+
+    metadata = _build_field_metadata(field)
+    _FIELD_METADATA_CACHE[id(field)] = (field, metadata)
+    return dict(metadata)
+
+
+def _build_field_metadata(field) -> dict[str, Any]:
+    """
+    Build the metadata dict for a Django model field.
+
+    Args:
+        field: A Django model field instance.
+
+    Returns:
+        Dictionary containing field metadata (see _get_field_metadata).
+    """
     metadata = {
         "name": field.name,
         "type": getattr(field, "get_internal_type", lambda: "Unknown")(),
@@ -47,31 +75,36 @@ def _get_field_metadata(field) -> dict[str, Any]:
     has_default = getattr(field, "has_default", lambda: False)()
     metadata["required"] = not null_allowed and not blank_allowed and not has_default
 
-    # Common field attributes
-    if hasattr(field, "max_length") and field.max_length:
-        metadata["max_length"] = field.max_length
+    # Common field attributes; each is read once since reverse relations lack most of them
+    max_length = getattr(field, "max_length", None)
+    if max_length:
+        metadata["max_length"] = max_length
 
-    if hasattr(field, "help_text") and field.help_text:
-        metadata["help_text"] = str(field.help_text)
+    help_text = getattr(field, "help_text", None)
+    if help_text:
+        metadata["help_text"] = str(help_text)
 
-    if hasattr(field, "choices") and field.choices:
-        metadata["choices"] = [{"value": choice[0], "label": str(choice[1])} for choice in field.choices]
+    choices = getattr(field, "choices", None)
+    if choices:
+        metadata["choices"] = [{"value": choice[0], "label": str(choice[1])} for choice in choices]
 
-    if hasattr(field, "default") and field.default is not models.fields.NOT_PROVIDED:
+    default_val = getattr(field, "default", models.fields.NOT_PROVIDED)
+    if default_val is not models.fields.NOT_PROVIDED:
         # Handle callable defaults
-        default_val = field.default
         if callable(default_val):
             metadata["has_default"] = True
         else:
             metadata["default"] = default_val
 
     # Relationship info
-    if hasattr(field, "related_model") and field.related_model:
-        metadata["related_model"] = field.related_model._meta.model_name
-        metadata["related_app"] = field.related_model._meta.app_label
-
-    if hasattr(field, "remote_field") and field.remote_field:
-        on_delete = getattr(field.remote_field, "on_delete", None)
+    related_model = getattr(field, "related_model", None)
+    if related_model:
+        metadata["related_model"] = related_model._meta.model_name
+        metadata["related_app"] = related_model._meta.app_label
+
+    remote_field = getattr(field, "remote_field", None)
+    if remote_field:
+        on_delete = getattr(remote_field, "on_delete", None)
         if on_delete is not None:
             metadata["on_delete"] = on_delete.__name__
 
@@ -84,20 +117,25 @@ def _get_field_metadata(field) -> dict[str, Any]:
         metadata["unique"] = True
 
     # Editable
-    if hasattr(field, "editable"):
-        metadata["editable"] = field.editable
+    editable = getattr(field, "editable", None)
+    if editable is not None:
+        metadata["editable"] = editable
 
     return metadata
 
 
-def _model_matches_query(query: str | None, model_name: str, verbose_name: str) -> bool:
+# Joins the searchable names of a model; never appears in model or verbose names
+_HAYSTACK_SEPARATOR = "\x00"
+
+
+def _model_matches_query(query: str | None, haystack: str) -> bool:
     """
     Check if a model matches the search query.
 
     Args:
         query: Search query string (case-insensitive).
-        model_name: The model's internal name.
-        verbose_name: The model's verbose/display name.
+        haystack: The model's lowercased model_name and verbose_name joined
+            by a separator (see _get_search_haystack).
 
     Returns:
         True if query is empty or matches model_name/verbose_name.
@@ -105,7 +143,318 @@ def _model_matches_query(query: str | None, model_name: str, verbose_name: str)
     if not query:
         return True
     query_lower = query.lower()
-    return query_lower in model_name.lower() or query_lower in verbose_name.lower()
+    # A query containing the separator could otherwise match across both names
+    return _HAYSTACK_SEPARATOR not in query_lower and query_lower in haystack
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelRecord:
+    """Precomputed find_models entry for a registered model."""
+
+    model_admin: Any
+    haystack: str
+    info: dict[str, Any]
+
+
+# Records for the registered models, keyed by MCPAdminMixin._registry_version
+_MODEL_RECORDS_CACHE: dict[int, list[_ModelRecord]] = {}
+
+
+def _build_model_record(model_name: str, info: dict[str, Any]) -> _ModelRecord:
+    """
+    Build the find_models record for a registered model.
+
+    The model name and verbose name are lowercased and joined into one
+    haystack so a query needs a single substring scan, and the response
+    entry is built up front so matching models can be returned as-is.
+
+    Args:
+        model_name: The registry key (lowercase model name).
+        info: The model's registry entry.
+
+    Returns:
+        _ModelRecord with the admin, search haystack, and response entry.
+    """
+    model = info["model"]
+    verbose_name = str(model._meta.verbose_name)
+    return _ModelRecord(
+        model_admin=info.get("admin"),
+        haystack=f"{model_name.lower()}{_HAYSTACK_SEPARATOR}{verbose_name.lower()}",
+        info={
+            "model_name": model_name,
+            "verbose_name": verbose_name,
+            "verbose_name_plural": str(model._meta.verbose_name_plural),
+            "app_label": model._meta.app_label,
+            "tools_exposed": True,
+        },
+    )
+
+
+def _get_model_records() -> list[_ModelRecord]:
+    """
+    Get find_models records for all registered models.
+
+    Records are rebuilt only when a model is registered, so searches
+    don't re-read model metadata or re-stringify names on every call.
+
+    Returns:
+        List of _ModelRecord in registration order.
+    """
+    # Late import to avoid circular dependency: mixin imports handlers, handlers need mixin
+    from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
+
+    version = MCPAdminMixin._registry_version
+    records = _MODEL_RECORDS_CACHE.get(version)
+    if records is None:
+        records = [_build_model_record(name, info) for name, info in MCPAdminMixin._registered_models.items()]
+        _MODEL_RECORDS_CACHE.clear()
+        _MODEL_RECORDS_CACHE[version] = records
+    return records
+
+
+# Registries larger than this are searched through a bigram index instead of a full scan
+_BIGRAM_INDEX_THRESHOLD = 128
+
+# Bigram -> records whose haystack contains it, keyed by MCPAdminMixin._registry_version
+_BIGRAM_INDEX_CACHE: dict[int, dict[str, list[_ModelRecord]]] = {}
+
+
+def _get_bigram_index(version: int, records: list[_ModelRecord]) -> dict[str, list[_ModelRecord]]:
+    """
+    Get the bigram index for the registered model records.
+
+    Every distinct two-character substring of a record's haystack maps to
+    the records containing it, kept in registration order.
+
+    Args:
+        version: The registry version the records were built for.
+        records: The registry records for that version.
+
+    Returns:
+        Dictionary mapping bigrams to the records that contain them.
+    """
+    index = _BIGRAM_INDEX_CACHE.get(version)
+    if index is None:
+        index = {}
+        for record in records:
+            haystack = record.haystack
+            for bigram in {haystack[i : i + 2] for i in range(len(haystack) - 1)}:
+                index.setdefault(bigram, []).append(record)
+        _BIGRAM_INDEX_CACHE.clear()
+        _BIGRAM_INDEX_CACHE[version] = index
+    return index
+
+
+def _find_matching_records(query: str | None) -> list[_ModelRecord]:
+    """
+    Get the registry records whose names match a find_models query.
+
+    Small registries are scanned in full. For large ones, only the records
+    that contain the query's rarest bigram are substring-tested, since any
+    match must contain every bigram of the query.
+
+    Args:
+        query: Search query string (case-insensitive), or empty for all models.
+
+    Returns:
+        Matching records in registration order.
+    """
+    # Late import to avoid circular dependency: mixin imports handlers, handlers need mixin
+    from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
+
+    records = _get_model_records()
+    if not query:
+        return records
+
+    query_lower = query.lower()
+    pool = records
+    if len(records) > _BIGRAM_INDEX_THRESHOLD and len(query_lower) >= 2:
+        index = _get_bigram_index(MCPAdminMixin._registry_version, records)
+        pool = min((index.get(query_lower[i : i + 2], []) for i in range(len(query_lower) - 1)), key=len)
+    return [record for record in pool if _model_matches_query(query, record.haystack)]
+
+
+# Serialized find_models responses, keyed by registry version and listed model names
+_MODELS_CONTENT_CACHE: dict[tuple[int, tuple[str, ...]], TextContent] = {}
+
+# Distinct model lists seen before the cache is reset
+_MODELS_CONTENT_CACHE_SIZE = 128
+
+
+def _get_models_content(records: list[_ModelRecord]) -> TextContent:
+    """
+    Get the serialized find_models response listing the given records.
+
+    The response only varies with the registry and the set of models it
+    lists, whatever query selected them. It is serialized once per
+    distinct set of visible models and reused.
+
+    Args:
+        records: The permission-filtered records, in registration order.
+
+    Returns:
+        TextContent with the JSON-serialized count and models list.
+    """
+    # Late import to avoid circular dependency: mixin imports handlers, handlers need mixin
+    from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
+
+    key = (MCPAdminMixin._registry_version, tuple(record.info["model_name"] for record in records))
+    content = _MODELS_CONTENT_CACHE.get(key)
+    if content is None:
+        models_info = [record.info for record in records]
+        content = json_response({"count": len(models_info), "models": models_info})[0]
+        if len(_MODELS_CONTENT_CACHE) >= _MODELS_CONTENT_CACHE_SIZE:
+            _MODELS_CONTENT_CACHE.clear()
+        _MODELS_CONTENT_CACHE[key] = content
+    return content
+
+
+# Admin configuration per ModelAdmin instance; admins are created once per AdminSite registration
+_ADMIN_CONFIG_CACHE: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_admin_config(model_admin: Any) -> dict[str, Any]:
+    """
+    Get the describe admin_config for a ModelAdmin.
+
+    The admin's list, search, ordering, fieldset and inline options are
+    read once per admin instance; callers receive a shallow copy.
+
+    Args:
+        model_admin: The ModelAdmin instance.
+
+    Returns:
+        Dictionary with the admin's list_display, list_filter, search_fields,
+        ordering, readonly_fields and, when set, fieldsets, date_hierarchy
+        and inlines.
+    """
+    try:
+        cached = _ADMIN_CONFIG_CACHE.get(model_admin)
+    except TypeError:
+        # Unhashable or non-weakrefable admin stand-ins are described without caching
+        return _build_admin_config(model_admin)
+    if cached is None:
+        cached = _build_admin_config(model_admin)
+        _ADMIN_CONFIG_CACHE[model_admin] = cached
+    return dict(cached)
+
+
+def _build_admin_config(model_admin: Any) -> dict[str, Any]:
+    """
+    Build the describe admin_config by reading a ModelAdmin's options.
+
+    Args:
+        model_admin: The ModelAdmin instance.
+
+    Returns:
+        Dictionary of admin configuration (see _get_admin_config).
+    """
+    admin_config: dict[str, Any] = {
+        "list_display": list(getattr(model_admin, "list_display", [])),
+        "list_filter": list(getattr(model_admin, "list_filter", [])),
+        "search_fields": list(getattr(model_admin, "search_fields", [])),
+        "ordering": list(getattr(model_admin, "ordering", [])),
+        "readonly_fields": list(getattr(model_admin, "readonly_fields", [])),
+    }
+
+    # Get fieldsets if defined
+    fieldsets = getattr(model_admin, "fieldsets", None)
+    if fieldsets:
+        admin_config["fieldsets"] = [
+            {
+                "name": fs[0] or "General",
+                "fields": list(fs[1].get("fields", [])),
+                "classes": list(fs[1].get("classes", [])),
+            }
+            for fs in fieldsets
+        ]
+
+    # Get date_hierarchy if defined
+    date_hierarchy = getattr(model_admin, "date_hierarchy", None)
+    if date_hierarchy:
+        admin_config["date_hierarchy"] = date_hierarchy
+
+    # Get inlines info
+    inlines = getattr(model_admin, "inlines", [])
+    if inlines:
+        admin_config["inlines"] = [
+            {
+                "model": inline.model._meta.model_name,
+                "fk_name": getattr(inline, "fk_name", None),
+            }
+            for inline in inlines
+            if hasattr(inline, "model")
+        ]
+
+    return admin_config
+
+
+def _build_describe_payload(model_name: str, model: type[models.Model], model_admin: Any) -> dict[str, Any]:
+    """
+    Build the describe payload for a model by walking its _meta and admin.
+
+    Args:
+        model_name: The lowercase model name.
+        model: The Django model class.
+        model_admin: The ModelAdmin instance, or None.
+
+    Returns:
+        Dictionary with model names, fields, relationships, and admin configuration.
+    """
+    # Collect field metadata
+    fields = []
+    relationships = []
+
+    for field in model._meta.get_fields():
+        field_meta = _get_field_metadata(field)
+
+        # Categorize as regular field or relationship
+        if field_meta.get("related_model"):
+            relationships.append(field_meta)
+        elif hasattr(field, "get_internal_type"):
+            fields.append(field_meta)
+
+    admin_config = _get_admin_config(model_admin) if model_admin else {}
+
+    return {
+        "model_name": model_name,
+        "verbose_name": str(model._meta.verbose_name),
+        "verbose_name_plural": str(model._meta.verbose_name_plural),
+        "app_label": model._meta.app_label,
+        "fields": fields,
+        "relationships": relationships,
+        "admin_config": admin_config,
+    }
+
+
+def _get_describe_content(model_name: str, model: type[models.Model], model_admin: Any) -> TextContent:
+    """
+    Get the serialized describe response for a model.
+
+    Model schemas and admin configuration don't change at runtime, so the
+    payload is built once and stored on the model's registry entry. It is
+    built lazily rather than at registration because admins are instantiated
+    during autodiscovery, before translated verbose names can be resolved.
+
+    Args:
+        model_name: The lowercase model name.
+        model: The Django model class.
+        model_admin: The ModelAdmin instance, or None.
+
+    Returns:
+        TextContent with the JSON-serialized describe payload.
+    """
+    # Late import to avoid circular dependency: mixin imports handlers, handlers need mixin
+    from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
+
+    info = MCPAdminMixin._registered_models.get(model_name)
+    if info is None or info["model"] is not model or info.get("admin") is not model_admin:
+        # Not the registered model/admin pair, so there is no registry entry to cache on
+        return json_response(_build_describe_payload(model_name, model, model_admin))[0]
+
+    if "describe_content" not in info:
+        info["describe_content"] = json_response(_build_describe_payload(model_name, model, model_admin))[0]
+    return info["describe_content"]
 
 
 @require_registered_model
@@ -138,68 +487,7 @@ async def handle_describe(
         List containing TextContent with JSON-serialized model metadata.
     """
     try:
-        # Collect field metadata
-        fields = []
-        relationships = []
-
-        for field in model._meta.get_fields():
-            field_meta = _get_field_metadata(field)
-
-            # Categorize as regular field or relationship
-            if field_meta.get("related_model"):
-                relationships.append(field_meta)
-            elif hasattr(field, "get_internal_type"):
-                fields.append(field_meta)
-
-        # Collect admin configuration
-        admin_config = {}
-        if model_admin:
-            admin_config["list_display"] = list(getattr(model_admin, "list_display", []))
-            admin_config["list_filter"] = list(getattr(model_admin, "list_filter", []))
-            admin_config["search_fields"] = list(getattr(model_admin, "search_fields", []))
-            admin_config["ordering"] = list(getattr(model_admin, "ordering", []))
-            admin_config["readonly_fields"] = list(getattr(model_admin, "readonly_fields", []))
-
-            # Get fieldsets if defined
-            fieldsets = getattr(model_admin, "fieldsets", None)
-            if fieldsets:
-                admin_config["fieldsets"] = [
-                    {
-                        "name": fs[0] or "General",
-                        "fields": list(fs[1].get("fields", [])),
-                        "classes": list(fs[1].get("classes", [])),
-                    }
-                    for fs in fieldsets
-                ]
-
-            # Get date_hierarchy if defined
-            date_hierarchy = getattr(model_admin, "date_hierarchy", None)
-            if date_hierarchy:
-                admin_config["date_hierarchy"] = date_hierarchy
-
-            # Get inlines info
-            inlines = getattr(model_admin, "inlines", [])
-            if inlines:
-                admin_config["inlines"] = [
-                    {
-                        "model": inline.model._meta.model_name,
-                        "fk_name": getattr(inline, "fk_name", None),
-                    }
-                    for inline in inlines
-                    if hasattr(inline, "model")
-                ]
-
-        result = {
-            "model_name": model_name,
-            "verbose_name": str(model._meta.verbose_name),
-            "verbose_name_plural": str(model._meta.verbose_name_plural),
-            "app_label": model._meta.app_label,
-            "fields": fields,
-            "relationships": relationships,
-            "admin_config": admin_config,
-        }
-
-        return json_response(result)
+        return [_get_describe_content(model_name, model, model_admin)]
     except Exception as e:
         return json_response({"error": safe_error_message(e)})
 
@@ -230,53 +518,18 @@ async def handle_find_models(
             - app_label, tools_exposed
     """
     try:
-        from django_admin_mcp.mixin import MCPAdminMixin  # noqa: PLC0415
-
         query = arguments.get("query", "")
 
-        # Collect candidate models from MCPAdminMixin registry
-        candidates = []
-        for model_name_lower, info in MCPAdminMixin._registered_models.items():
-            model = info["model"]
-            model_admin = info.get("admin")
-            verbose_name = str(model._meta.verbose_name)
-            verbose_name_plural = str(model._meta.verbose_name_plural)
-
-            # Filter by query if provided
-            if not _model_matches_query(query, model_name_lower, verbose_name):
-                continue
-
-            candidates.append(
-                {
-                    "model_admin": model_admin,
-                    "model_name": model_name_lower,
-                    "verbose_name": verbose_name,
-                    "verbose_name_plural": verbose_name_plural,
-                    "app_label": model._meta.app_label,
-                    "tools_exposed": True,
-                }
-            )
-
-        # Filter by user permissions (async operation)
-        models_info = []
-        for candidate in candidates:
-            if await async_check_permission(request, candidate["model_admin"], "view"):
-                # Remove model_admin before adding to response
-                models_info.append(
-                    {
-                        "model_name": candidate["model_name"],
-                        "verbose_name": candidate["verbose_name"],
-                        "verbose_name_plural": candidate["verbose_name_plural"],
-                        "app_label": candidate["app_label"],
-                        "tools_exposed": candidate["tools_exposed"],
-                    }
-                )
-
-        return json_response(
-            {
-                "count": len(models_info),
-                "models": models_info,
-            }
-        )
+        # Collect candidate models from the prebuilt registry records
+        candidates = _find_matching_records(query)
+
+        # Filter by user permissions in one thread hop rather than one per candidate model
+        @sync_to_async
+        def filter_visible():
+            return [record for record in candidates if check_permission(request, record.model_admin, "view")]
+
+        visible = await filter_visible() if candidates else []
+
+        return [_get_models_content(visible)]
     except Exception as e:
         return json_response({"error": safe_error_message(e)})
@@ -12,13 +12,65 @@ from django.db.models import Q
 from django.http import HttpRequest
 
 from django_admin_mcp.handlers.base import (
+    encode_json,
     json_response,
     safe_error_message,
     serialize_instance,
+    serialize_queryset,
+    text_response,
 )
 from django_admin_mcp.handlers.decorators import require_permission, require_registered_model
 from django_admin_mcp.protocol.types import TextContent
 
+# Forward FK/OneToOne field names per model, see _get_forward_single_relations()
+_FORWARD_SINGLE_RELATIONS_CACHE: dict[type, frozenset[str]] = {}
+
+# Reverse relation accessor names per model, see _get_reverse_accessors()
+_REVERSE_ACCESSORS_CACHE: dict[type, frozenset[str]] = {}
+
+
+def _get_forward_single_relations(model) -> frozenset[str]:
+    """
+    Get the names of a model's forward ForeignKey and OneToOne fields.
+
+    Args:
+        model: The Django model class.
+
+    Returns:
+        Frozenset of field names that can be passed to select_related().
+    """
+    names = _FORWARD_SINGLE_RELATIONS_CACHE.get(model)
+    if names is None:
+        names = frozenset(
+            field.name
+            for field in model._meta.concrete_fields
+            if field.is_relation and (field.many_to_one or field.one_to_one)
+        )
+        _FORWARD_SINGLE_RELATIONS_CACHE[model] = names
+    return names
+
+
+def _get_reverse_accessors(model) -> frozenset[str]:
+    """
+    Get the accessor names of a model's reverse relations.
+
+    Walks model._meta.get_fields() once per model so relation lookups
+    don't rescan every field on each request.
+
+    Args:
+        model: The Django model class.
+
+    Returns:
+        Frozenset of accessor names (e.g. 'articles' for a reverse FK).
+    """
+    names = _REVERSE_ACCESSORS_CACHE.get(model)
+    if names is None:
+        names = frozenset(
+            field.get_accessor_name() for field in model._meta.get_fields() if hasattr(field, "get_accessor_name")
+        )
+        _REVERSE_ACCESSORS_CACHE[model] = names
+    return names
+
 
 @require_registered_model
 @require_permission("view")
@@ -43,13 +95,15 @@ async def handle_related(
             - relation: str (field name of the relation to fetch)
             - limit: int (default 100, max items for many relations)
             - offset: int (default 0, pagination offset)
+            - include_total: bool (default True, include total_count for many relations)
         request: HttpRequest with user set for permission checking.
         model: Resolved Django model class (injected by decorator).
         model_admin: Resolved ModelAdmin instance (injected by decorator).
 
     Returns:
         List of TextContent with JSON response containing:
-        - For many relations: relation, type, count, total_count, results
+        - For many relations: relation, type, count, total_count (unless
+          include_total is False), results
         - For single relations: relation, type, result
         - For simple values: relation, type, value
         - For errors: error message
@@ -58,6 +112,7 @@ async def handle_related(
     relation = arguments.get("relation")
     limit = arguments.get("limit", 100)
     offset = arguments.get("offset", 0)
+    include_total = arguments.get("include_total", True)
 
     if not obj_id:
         return json_response({"error": "id parameter is required"})
@@ -66,21 +121,20 @@ async def handle_related(
         return json_response({"error": "relation parameter is required"})
 
     @sync_to_async
+    @encode_json
     def get_related():
+        queryset = model.objects.all()
+        # Join forward FK/OneToOne targets into the lookup instead of fetching them separately
+        if relation in _get_forward_single_relations(model):
+            queryset = queryset.select_related(relation)
         try:
-            obj = model.objects.get(pk=obj_id)
+            obj = queryset.get(pk=obj_id)
         except (model.DoesNotExist, ValueError, TypeError):
             return {"error": f"{model_name} not found"}
 
         # Check if the relation exists
-        if not hasattr(obj, relation):
-            # Try to find in related fields
-            for field in model._meta.get_fields():
-                if hasattr(field, "get_accessor_name"):
-                    if field.get_accessor_name() == relation:
-                        break
-            else:
-                return {"error": f"Relation '{relation}' not found on model"}
+        if not hasattr(obj, relation) and relation not in _get_reverse_accessors(model):
+            return {"error": f"Relation '{relation}' not found on model"}
 
         related_attr = getattr(obj, relation)
 
@@ -88,15 +142,21 @@ async def handle_related(
         if hasattr(related_attr, "all"):
             # Many relation (ManyToMany, reverse FK)
             queryset = related_attr.all()
-            total_count = queryset.count()
-            related_objects = queryset[offset : offset + limit]
-            return {
+            # Read the page as plain dicts instead of building model instances
+            results = serialize_queryset(queryset[offset : offset + limit])
+            response = {
                 "relation": relation,
                 "type": "many",
-                "count": len(related_objects),
-                "total_count": total_count,
-                "results": [serialize_instance(r) for r in related_objects],
+                "count": len(results),
+                "results": results,
             }
+            if include_total:
+                # A short first page already holds every row, so COUNT(*) would add nothing
+                if offset == 0 and len(results) < limit:
+                    response["total_count"] = len(results)
+                else:
+                    response["total_count"] = queryset.count()
+            return response
         elif hasattr(related_attr, "_meta"):
             # Single relation (FK, OneToOne)
             return {
@@ -112,8 +172,8 @@ async def handle_related(
                 "value": str(related_attr),
             }
 
-    result = await get_related()
-    return json_response(result)
+    # The JSON is encoded in the worker thread, off the event loop
+    return text_response(await get_related())
 
 
 @require_registered_model
@@ -156,6 +216,7 @@ async def handle_history(
         return json_response({"error": "id parameter is required"})
 
     @sync_to_async
+    @encode_json
     def get_history():
         # Deferred import: Django models require app registry to be ready
         from django.contrib.admin.models import (  # noqa: PLC0415
@@ -175,11 +236,16 @@ async def handle_history(
         # Get content type for this model
         content_type = ContentType.objects.get_for_model(model)
 
-        # Get log entries for this object
-        log_entries = LogEntry.objects.filter(
-            content_type=content_type,
-            object_id=str(obj_id),
-        ).order_by("-action_time")[:limit]
+        # Get log entries for this object, joining users instead of loading each one separately
+        log_entries = (
+            LogEntry.objects.filter(
+                content_type=content_type,
+                object_id=str(obj_id),
+            )
+            .select_related("user")
+            .only("action_flag", "action_time", "change_message", "object_repr", "user", "user__username")
+            .order_by("-action_time")[:limit]
+        )
 
         action_names = {
             ADDITION: "created",
@@ -209,8 +275,7 @@ async def handle_history(
             "history": history,
         }
 
-    result = await get_history()
-    return json_response(result)
+    return text_response(await get_history())
 
 
 @require_registered_model
@@ -251,6 +316,7 @@ async def handle_autocomplete(
     limit = arguments.get("limit", 10)
 
     @sync_to_async
+    @encode_json
     def search_autocomplete():
         queryset = model.objects.all()
 
@@ -302,7 +368,6 @@ async def handle_autocomplete(
         }
 
     try:
-        result = await search_autocomplete()
-        return json_response(result)
+        return text_response(await search_autocomplete())
     except Exception as e:
         return json_response({"error": safe_error_message(e)})
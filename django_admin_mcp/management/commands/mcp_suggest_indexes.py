@@ -0,0 +1,139 @@
+"""
+Suggest database indexes for the queries issued by MCP list tools.
+
+list_<model> orders by the ModelAdmin (or model) ordering and clients
+commonly filter on the admin's list_filter fields. Without a matching
+index those queries scan the whole table, so this command prints
+models.Index declarations for every such column set that no existing
+index, unique constraint or db_index field already covers.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+
+from django_admin_mcp.mixin import MCPAdminMixin
+
+
+def _get_field(model, name: str):
+    """Return the concrete local field for a plain field name, or None."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field if getattr(field, "concrete", False) and not field.many_to_many else None
+
+
+def _get_ordering_fields(model, model_admin) -> list[str]:
+    """Return the plain field names (with '-' prefixes) list_<model> orders by."""
+    ordering = getattr(model_admin, "ordering", None) or model._meta.ordering or []
+    fields: list[str] = []
+    for entry in ordering:
+        # Expressions, random ordering and related lookups can't be expressed as fields=[...]
+        if not isinstance(entry, str) or entry == "?" or "__" in entry:
+            return fields
+        if _get_field(model, entry.lstrip("-")) is None:
+            return fields
+        fields.append(entry)
+    return fields
+
+
+def _get_filter_fields(model, model_admin) -> list[str]:
+    """Return the concrete field names listed in the admin's list_filter."""
+    names = []
+    for entry in getattr(model_admin, "list_filter", None) or ():
+        # (field_name, FilterClass) tuples filter on field_name; SimpleListFilter classes are opaque
+        name = entry[0] if isinstance(entry, list | tuple) else entry
+        if isinstance(name, str) and "__" not in name and _get_field(model, name) is not None:
+            names.append(name)
+    return names
+
+
+def _get_covered_prefixes(model) -> list[tuple[str, ...]]:
+    """Return the column name sequences that existing indexes can answer lookups for."""
+    meta = model._meta
+    covered: list[tuple[str, ...]] = []
+    for field in meta.concrete_fields:
+        # ForeignKeys default to db_index=True, and unique fields get an index from their constraint
+        if field.primary_key or field.unique or field.db_index:
+            covered.append((field.name,))
+    for index in meta.indexes:
+        if index.fields:
+            covered.append(tuple(name.lstrip("-") for name in index.fields))
+    for fields in [*meta.unique_together, *getattr(meta, "index_together", ())]:
+        covered.append(tuple(fields))
+    for constraint in meta.constraints:
+        fields = getattr(constraint, "fields", None)
+        if fields and getattr(constraint, "condition", None) is None:
+            covered.append(tuple(fields))
+    return covered
+
+
+def suggest_indexes(model, model_admin) -> list[list[str]]:
+    """
+    Suggest index field lists for a model exposed through MCP.
+
+    Args:
+        model: The Django model class.
+        model_admin: The model's ModelAdmin instance.
+
+    Returns:
+        List of fields=[...] lists, each not yet covered by an existing index.
+    """
+    covered = _get_covered_prefixes(model)
+    candidates = []
+    ordering = _get_ordering_fields(model, model_admin)
+    if ordering:
+        candidates.append(ordering)
+    candidates.extend([name] for name in _get_filter_fields(model, model_admin))
+
+    suggestions: list[list[str]] = []
+    for fields in candidates:
+        names = tuple(name.lstrip("-") for name in fields)
+        # An index can serve a lookup on any leading run of its columns
+        if any(existing[: len(names)] == names for existing in covered):
+            continue
+        suggestions.append(fields)
+        covered.append(names)
+    return suggestions
+
+
+class Command(BaseCommand):
+    """Print models.Index suggestions for models registered with MCPAdminMixin."""
+
+    help = "Suggest Meta.indexes for the ordering and list_filter columns used by MCP list tools"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "model_names",
+            nargs="*",
+            help="Lowercase model names to check (default: every model registered with MCPAdminMixin)",
+        )
+
+    def handle(self, *args, **options):
+        registered = MCPAdminMixin._registered_models
+        model_names = options["model_names"] or sorted(registered)
+        unknown = [name for name in model_names if name not in registered]
+        if unknown:
+            raise CommandError(f"Models not registered with MCPAdminMixin: {', '.join(unknown)}")
+
+        found = False
+        for model_name in model_names:
+            model = registered[model_name]["model"]
+            suggestions = suggest_indexes(model, registered[model_name]["admin"])
+            if not suggestions:
+                continue
+            found = True
+            self.stdout.write(f"# {model._meta.label}: add to Meta.indexes")
+            for fields in suggestions:
+                self.stdout.write(f"models.Index(fields={fields!r}),")
+            self.stdout.write("")
+
+        if not found:
+            self.stdout.write("Existing indexes already cover the ordering and list_filter fields.")
+            return
+
+        self.stdout.write(
+            "# Then run makemigrations. On large PostgreSQL tables, build the index with\n"
+            "# django.contrib.postgres.operations.AddIndexConcurrently in a non-atomic\n"
+            "# migration: a plain CREATE INDEX blocks writes to the table until it finishes."
+        )
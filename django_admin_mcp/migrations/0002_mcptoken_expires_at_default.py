@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-16
+
+import django_admin_mcp.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_admin_mcp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="mcptoken",
+            name="expires_at",
+            field=models.DateTimeField(
+                blank=True,
+                default=django_admin_mcp.models.default_expires_at,
+                help_text="Token expiration date (leave empty for indefinite tokens)",
+                null=True,
+            ),
+        ),
+    ]
@@ -5,6 +5,8 @@ This mixin enables MCP (Model Context Protocol) functionality for Django admin c
 When added to a ModelAdmin class, it exposes the model's CRUD operations through MCP tools.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from django.db import models
@@ -55,6 +57,9 @@ class MCPAdminMixin:
     # Class-level registry to track registered models
     _registered_models: dict[str, dict[str, Any]] = {}
 
+    # Incremented on every registration so derived caches know when to rebuild
+    _registry_version: int = 0
+
     @classmethod
     def register_model_tools(cls, model_admin_instance):
         """Register MCP tools for a model admin instance."""
@@ -69,6 +74,7 @@ class MCPAdminMixin:
             "model": model,
             "admin": model_admin_instance,
         }
+        MCPAdminMixin._registry_version += 1
 
     @classmethod
     async def handle_tool_call(cls, name: str, arguments: dict[str, Any], user=None) -> list[TextContent]:
@@ -121,3 +127,16 @@ class MCPAdminMixin:
         super().__init__(*args, **kwargs)
         # Register tools for this model
         self.__class__.register_model_tools(self)
+
+
+def get_registered_models() -> Mapping[str, dict[str, Any]]:
+    """
+    Get the models registered via MCPAdminMixin.
+
+    Returns a read-only view of the registry rather than a copy, so it costs
+    nothing per call and reflects models registered later.
+
+    Returns:
+        Read-only mapping of lowercase model name to {"model", "admin"} info.
+    """
+    return MappingProxyType(MCPAdminMixin._registered_models)
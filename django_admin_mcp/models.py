@@ -6,13 +6,31 @@ import hashlib
 import hmac
 import secrets
 from datetime import timedelta
+from typing import Any
 
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 
+def default_expires_at():
+    """
+    Default expiry for new tokens, MCP_TOKEN_DEFAULT_EXPIRY_DAYS (default 90) days from now.
+
+    Passing expires_at=None explicitly creates a token that never expires, as
+    does setting MCP_TOKEN_DEFAULT_EXPIRY_DAYS to None.
+
+    Returns:
+        Aware datetime in the future, or None for no default expiry.
+    """
+    days = getattr(settings, "MCP_TOKEN_DEFAULT_EXPIRY_DAYS", 90)
+    if days is None:
+        return None
+    return timezone.now() + timedelta(days=days)
+
+
 class MCPToken(models.Model):
     """
     Authentication token for MCP HTTP interface.
@@ -30,13 +48,20 @@ class MCPToken(models.Model):
     # - secret: hashed with salt for security
     # Note: We use '.' as separator because '_' and '-' are valid in token_urlsafe output
     TOKEN_PREFIX = "mcp_"
+    # Length of generated keys: secrets.token_urlsafe(12) encodes 12 bytes as 16 characters
+    TOKEN_KEY_LENGTH = 16
+    # Columns loaded by get_by_key(): key lookup, secret check, validity, last_used_at throttle and user
+    AUTH_FIELDS = ("token_key", "token_hash", "salt", "is_active", "expires_at", "last_used_at", "user")
+
+    # Plaintext token, kept after the first save until get_plaintext_token() returns it
+    _plaintext_token: str | None = None
 
     name = models.CharField(
         max_length=200,
         help_text="A descriptive name for this token (e.g., 'Production API', 'Dev Testing')",
     )
     token_key = models.CharField(
-        max_length=16,
+        max_length=TOKEN_KEY_LENGTH,
         unique=True,
         editable=False,
         db_index=True,
@@ -64,6 +89,7 @@ class MCPToken(models.Model):
     is_active = models.BooleanField(default=True, help_text="Whether this token is currently active")
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField(
+        default=default_expires_at,
         null=True,
         blank=True,
         help_text="Token expiration date (leave empty for indefinite tokens)",
@@ -90,14 +116,6 @@ class MCPToken(models.Model):
             models.Index(fields=["is_active", "token_key"], name="mcp_token_active_key_idx"),
         ]
 
-    def __init__(self, *args, **kwargs):
-        """Track if expires_at is explicitly set."""
-        # Check if expires_at is in kwargs before calling super
-        self._expires_at_explicit = "expires_at" in kwargs
-        # Store the plaintext token temporarily for return after save
-        self._plaintext_token = None
-        super().__init__(*args, **kwargs)
-
     def __str__(self):
         # Use token key for display (safe since it's already public)
         if self.token_key:
@@ -105,7 +123,7 @@ class MCPToken(models.Model):
         return f"{self.name}"
 
     def save(self, *args, **kwargs):
-        """Generate token, hash it with salt, and set default expiry on first save."""
+        """Generate token and hash it with salt on first save."""
         if not self.token_key:
             # Generate token key (public, for lookup) and secret (hashed)
             # Token format: mcp_<key>.<secret>
@@ -121,10 +139,6 @@ class MCPToken(models.Model):
             # Store full plaintext token temporarily so it can be returned to user once
             self._plaintext_token = f"{self.TOKEN_PREFIX}{self.token_key}.{token_secret}"
 
-        # Set default expiry to 90 days only for new tokens where expires_at wasn't explicitly set
-        if self._should_set_default_expiry():
-            self.expires_at = timezone.now() + timedelta(days=90)
-
         super().save(*args, **kwargs)
 
     @staticmethod
@@ -139,9 +153,11 @@ class MCPToken(models.Model):
         Returns:
             Hexadecimal hash string
         """
-        # Combine salt and token, then hash
-        salted_token = f"{salt}{token}".encode()
-        return hashlib.sha256(salted_token).hexdigest()
+        # Feed salt then token to the hash, rather than building the salted string first.
+        # The digest is the same as hashing their concatenation, so stored hashes stay valid.
+        digest = hashlib.sha256(salt.encode())
+        digest.update(token.encode())
+        return digest.hexdigest()
 
     @classmethod
     def parse_token(cls, full_token: str) -> tuple[str, str] | None:
@@ -165,7 +181,8 @@ class MCPToken(models.Model):
             return None
 
         key, secret = parts
-        if not key or not secret:
+        # A key of any other length can't match a stored one, so skip the database lookup
+        if len(key) != cls.TOKEN_KEY_LENGTH or not secret:
             return None
 
         return key, secret
@@ -182,9 +199,14 @@ class MCPToken(models.Model):
             MCPToken instance if found, None otherwise
         """
         try:
-            return cls.objects.select_related("user").get(
-                token_key=token_key,
-                is_active=True,
+            # Only the columns authentication reads; name and created_at load on access
+            return (
+                cls.objects.select_related("user")
+                .only(*cls.AUTH_FIELDS)
+                .get(
+                    token_key=token_key,
+                    is_active=True,
+                )
             )
         except cls.DoesNotExist:
             return None
@@ -208,6 +230,35 @@ class MCPToken(models.Model):
         # Use constant-time comparison to prevent timing attacks
         return hmac.compare_digest(self.token_hash, provided_hash)
 
+    @classmethod
+    def verify_many(cls, candidates: list[tuple["MCPToken", str]]) -> list[bool]:
+        """
+        Verify the secrets provided for a batch of tokens.
+
+        The salt is hashed once per distinct salt and the hash state is
+        copied for each candidate, instead of rehashing the salt for every
+        secret. Comparisons are constant-time, as in verify_secret().
+
+        Args:
+            candidates: (token, provided_secret) pairs to check
+
+        Returns:
+            List of booleans, True where the secret matches its token
+        """
+        salted: dict[str, Any] = {}
+        results = []
+        for token, provided_secret in candidates:
+            if not token.token_hash or not token.salt:
+                results.append(False)
+                continue
+            base = salted.get(token.salt)
+            if base is None:
+                base = salted[token.salt] = hashlib.sha256(token.salt.encode())
+            digest = base.copy()
+            digest.update(provided_secret.encode())
+            results.append(hmac.compare_digest(token.token_hash, digest.hexdigest()))
+        return results
+
     def verify_token(self, provided_token: str) -> bool:
         """
         Verify a full token (key + secret) against this token instance.
@@ -231,10 +282,6 @@ class MCPToken(models.Model):
         # Verify the secret
         return self.verify_secret(secret)
 
-    def _should_set_default_expiry(self):
-        """Check if default expiry should be set for new token."""
-        return self.pk is None and not self._expires_at_explicit and self.expires_at is None
-
     def get_plaintext_token(self) -> str | None:
         """
         Get the plaintext token. Only available immediately after creation or regeneration.
@@ -276,20 +323,23 @@ class MCPToken(models.Model):
 
         return f"{self.TOKEN_PREFIX}{self.token_key}.{token_secret}"
 
-    def mark_used(self):
-        """Mark token as recently used."""
-        self.last_used_at = timezone.now()
-        self.save(update_fields=["last_used_at"])
+    def mark_used(self, now=None):
+        """Mark token as used at now (default: the current time)."""
+        # A single UPDATE: nothing in save() applies to an existing token's usage timestamp
+        if now is None:
+            now = timezone.now()
+        type(self)._base_manager.filter(pk=self.pk).update(last_used_at=now)
+        self.last_used_at = now
 
-    def is_expired(self):
-        """Check if token has expired."""
+    def is_expired(self, now=None):
+        """Check if token has expired as of now (default: the current time)."""
         if self.expires_at is None:
             return False  # Indefinite tokens never expire
-        return timezone.now() > self.expires_at
+        return (timezone.now() if now is None else now) > self.expires_at
 
-    def is_valid(self):
-        """Check if token is valid (active and not expired)."""
-        return self.is_active and not self.is_expired()
+    def is_valid(self, now=None):
+        """Check if token is valid (active and not expired) as of now (default: the current time)."""
+        return self.is_active and not self.is_expired(now)
 
     def has_perm(self, perm):
         """
@@ -313,19 +363,13 @@ class MCPToken(models.Model):
             app_label = perm.content_type.app_label
             codename = perm.codename
 
-        # Check direct permissions
-        if self.permissions.filter(content_type__app_label=app_label, codename=codename).exists():
-            return True
-
-        # Check group permissions
-        if self.groups.filter(
-            permissions__content_type__app_label=app_label,
-            permissions__codename=codename,
-        ).exists():
-            return True
-
-        # Default: deny access (principle of least privilege)
-        return False
+        # Check direct and group permissions in one query; anything else is denied
+        # (principle of least privilege)
+        return Permission.objects.filter(
+            Q(mcp_tokens=self) | Q(group__mcp_tokens=self),
+            content_type__app_label=app_label,
+            codename=codename,
+        ).exists()
 
     def has_perms(self, perm_list):
         """
@@ -337,7 +381,29 @@ class MCPToken(models.Model):
         Returns:
             bool: True if token has all permissions, False otherwise
         """
-        return all(self.has_perm(perm) for perm in perm_list)
+        needed = set()
+        for perm in perm_list:
+            if isinstance(perm, str):
+                if "." not in perm:
+                    # If no app_label, we can't check it
+                    return False
+                needed.add(tuple(perm.split(".", 1)))
+            else:
+                needed.add((perm.content_type.app_label, perm.codename))
+
+        if not needed:
+            return True
+
+        # Look up every requested permission the token holds in one query
+        requested = Q()
+        for app_label, codename in needed:
+            requested |= Q(content_type__app_label=app_label, codename=codename)
+        found = set(
+            Permission.objects.filter(requested)
+            .filter(Q(mcp_tokens=self) | Q(group__mcp_tokens=self))
+            .values_list("content_type__app_label", "codename")
+        )
+        return needed <= found
 
     def get_all_permissions(self):
         """
@@ -346,15 +412,10 @@ class MCPToken(models.Model):
         Returns:
             set: Set of permission strings in 'app_label.codename' format
         """
-        perms = set()
-
-        # Add direct permissions
-        for perm in self.permissions.select_related("content_type").all():
-            perms.add(f"{perm.content_type.app_label}.{perm.codename}")
-
-        # Add group permissions
-        for group in self.groups.prefetch_related("permissions__content_type").all():
-            for perm in group.permissions.all():
-                perms.add(f"{perm.content_type.app_label}.{perm.codename}")
-
-        return perms
+        # Direct and group permissions in one query, reading only the two columns needed
+        permissions = (
+            Permission.objects.filter(Q(mcp_tokens=self) | Q(group__mcp_tokens=self))
+            .values_list("content_type__app_label", "codename")
+            .distinct()
+        )
+        return {f"{app_label}.{codename}" for app_label, codename in permissions}
@@ -38,3 +38,8 @@ class JsonRpcResponse(BaseModel):
         """Override to exclude None values by default."""
         kwargs.setdefault("exclude_none", True)
         return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        """Override to exclude None values by default, like model_dump()."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
@@ -8,6 +8,7 @@ for MCP tool calls.
 from django_admin_mcp.tools.registry import (
     HANDLERS,
     call_tool,
+    get_batch_execute_tool,
     get_find_models_tool,
     get_model_tools,
     get_tools,
@@ -16,6 +17,7 @@ from django_admin_mcp.tools.registry import (
 __all__ = [
     "HANDLERS",
     "call_tool",
+    "get_batch_execute_tool",
     "get_find_models_tool",
     "get_model_tools",
     "get_tools",
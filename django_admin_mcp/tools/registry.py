@@ -5,6 +5,8 @@ This module provides tool registration, schema generation, and routing
 for MCP tool calls.
 """
 
+import asyncio
+import json
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -28,6 +30,7 @@ from django_admin_mcp.handlers import (
     handle_update,
     json_response,
 )
+from django_admin_mcp.handlers.base import safe_error_message
 from django_admin_mcp.protocol.types import TextContent, Tool
 
 # Type alias for handler functions
@@ -52,6 +55,268 @@ HANDLERS: dict[str, HandlerFunc] = {
     "autocomplete": handle_autocomplete,
 }
 
+# Shared schema for the opt-in pretty-printing argument of data-returning tools
+_PRETTY_PROPERTY: dict[str, Any] = {
+    "type": "boolean",
+    "description": "Indent the JSON response for readability (default: false, compact output)",
+    "default": False,
+}
+
+# Model-independent input schema pieces, shared by every model's tools instead of rebuilt per model
+_OFFSET_PROPERTY: dict[str, Any] = {
+    "type": "integer",
+    "description": "Number of items to skip (default: 0)",
+    "default": 0,
+}
+
+_SEARCH_TERM_PROPERTY: dict[str, Any] = {
+    "type": "string",
+    "description": "Search term to match against searchable fields",
+}
+
+_LIST_PROPERTIES: dict[str, Any] = {
+    "limit": {
+        "type": "integer",
+        "description": "Maximum number of items to return (default: 100)",
+        "default": 100,
+    },
+    "offset": _OFFSET_PROPERTY,
+    "filters": {
+        "type": "object",
+        "description": (
+            "Filter criteria. Keys are field names with optional lookups "
+            "(e.g., {'status': 'published', 'created_at__gte': '2024-01-01'})"
+        ),
+    },
+    "search": _SEARCH_TERM_PROPERTY,
+    "order_by": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Fields to order by. Prefix with '-' for descending (e.g., ['-created_at', 'title'])",
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": (
+            "Fields to include in each result (default: all). Leaving out large text "
+            "columns makes listing wide tables faster"
+        ),
+    },
+    "pretty": _PRETTY_PROPERTY,
+}
+
+_GET_OPTION_PROPERTIES: dict[str, Any] = {
+    "include_inlines": {
+        "type": "boolean",
+        "description": "Include inline related objects (requires admin inlines)",
+        "default": False,
+    },
+    "include_related": {
+        "type": "boolean",
+        "description": "Include reverse FK/M2M related objects",
+        "default": False,
+    },
+    "pretty": _PRETTY_PROPERTY,
+}
+
+_UPDATE_OPTION_PROPERTIES: dict[str, Any] = {
+    "data": {
+        "type": "object",
+        "description": "The fields to update",
+    },
+    "inlines": {
+        "type": "object",
+        "description": "Inline updates: {model_name: [{id, data}, {data for new}, {id, _delete: true}]}",
+    },
+    "pretty": _PRETTY_PROPERTY,
+}
+
+_ACTION_PROPERTIES: dict[str, Any] = {
+    "action": {
+        "type": "string",
+        "description": "The name of the action to execute (e.g., 'delete_selected')",
+    },
+    "ids": {
+        "type": "array",
+        "items": {"type": ["integer", "string"]},
+        "description": "List of IDs to apply the action to",
+    },
+}
+
+_BULK_PROPERTIES: dict[str, Any] = {
+    "operation": {
+        "type": "string",
+        "enum": ["create", "update", "delete"],
+        "description": "The bulk operation to perform",
+    },
+    "items": {
+        "type": "array",
+        "description": "Items to process (format depends on operation)",
+    },
+}
+
+_RELATED_OPTION_PROPERTIES: dict[str, Any] = {
+    "relation": {
+        "type": "string",
+        "description": "The name of the relation to fetch (e.g., 'articles' for reverse FK)",
+    },
+    "limit": {
+        "type": "integer",
+        "description": "Maximum number of related items to return (default: 100)",
+        "default": 100,
+    },
+    "offset": _OFFSET_PROPERTY,
+    "include_total": {
+        "type": "boolean",
+        "description": "Include total_count of related items; set false to skip the count query",
+        "default": True,
+    },
+}
+
+_HISTORY_LIMIT_PROPERTY: dict[str, Any] = {
+    "type": "integer",
+    "description": "Maximum number of history entries to return (default: 50)",
+    "default": 50,
+}
+
+_AUTOCOMPLETE_PROPERTIES: dict[str, Any] = {
+    "term": _SEARCH_TERM_PROPERTY,
+    "limit": {
+        "type": "integer",
+        "description": "Maximum number of suggestions to return (default: 20)",
+        "default": 20,
+    },
+}
+
+# Formatted field documentation per model class. Model _meta doesn't change
+# at runtime, so the field walk only needs to happen once per model.
+_FIELDS_DOC_CACHE: dict[type[models.Model], str] = {}
+
+# Tool definitions per model class, see get_model_tools()
+_MODEL_TOOLS_CACHE: dict[type[models.Model], list[Tool]] = {}
+
+# The find_models tool definition, see get_find_models_tool()
+_FIND_MODELS_TOOL = Tool(
+    name="find_models",
+    description=(
+        "Discover available Django models registered with MCP. Use this to find which models have tools available."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Optional search query to filter models by name (case-insensitive)",
+            }
+        },
+    },
+)
+
+
+# Most sub-calls accepted by one batch_execute call
+_BATCH_MAX_OPERATIONS = 50
+
+# Upper bound for batch_execute's max_concurrent argument
+_BATCH_MAX_CONCURRENT = 16
+
+# The batch_execute tool definition, see get_batch_execute_tool()
+_BATCH_EXECUTE_TOOL = Tool(
+    name="batch_execute",
+    description=(
+        "Run several tool calls in one request and return their results in call order. "
+        "Calls run concurrently, so only batch calls that don't depend on each other."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operations": {
+                "type": "array",
+                "description": f"Tool calls to run (at most {_BATCH_MAX_OPERATIONS})",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Tool name, e.g. 'get_article'"},
+                        "arguments": {"type": "object", "description": "Arguments for the tool"},
+                    },
+                    "required": ["name"],
+                },
+            },
+            "max_concurrent": {
+                "type": "integer",
+                "description": f"Maximum calls to run at once (default 4, at most {_BATCH_MAX_CONCURRENT})",
+                "default": 4,
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "description": "Skip calls that haven't started once a call returns an error (default false)",
+                "default": False,
+            },
+        },
+        "required": ["operations"],
+    },
+)
+
+
+async def handle_batch_execute(arguments: dict[str, Any], request: HttpRequest) -> list[TextContent]:
+    """
+    Run several tool calls concurrently and combine their results.
+
+    Each call goes through call_tool() with the same request, so it is
+    authorized exactly as if it had been made on its own.
+
+    Args:
+        arguments: Dictionary containing:
+            - operations: list of {name, arguments} tool calls
+            - max_concurrent: int (default 4, max calls running at once)
+            - stop_on_error: bool (default False, skip calls not yet started after an error)
+        request: HttpRequest with user set for permission checking.
+
+    Returns:
+        List of TextContent with JSON response containing:
+        - count: number of operations
+        - results: list of {name, result} in call order, or {name, skipped} for
+          calls skipped by stop_on_error
+        - For errors: error message
+    """
+    operations = arguments.get("operations")
+    if not isinstance(operations, list) or not operations:
+        return json_response({"error": "operations must be a non-empty list"})
+    if len(operations) > _BATCH_MAX_OPERATIONS:
+        return json_response({"error": f"At most {_BATCH_MAX_OPERATIONS} operations can be batched"})
+
+    max_concurrent = arguments.get("max_concurrent", 4)
+    if not isinstance(max_concurrent, int) or max_concurrent < 1:
+        return json_response({"error": "max_concurrent must be a positive integer"})
+    stop_on_error = bool(arguments.get("stop_on_error", False))
+
+    semaphore = asyncio.Semaphore(min(max_concurrent, _BATCH_MAX_CONCURRENT))
+    failed = False
+
+    async def run(operation: Any) -> dict[str, Any]:
+        nonlocal failed
+        name = operation.get("name") if isinstance(operation, dict) else None
+        if not isinstance(name, str):
+            data: Any = {"error": "Each operation needs a 'name' string"}
+        elif name == _BATCH_EXECUTE_TOOL.name:
+            data = {"error": "batch_execute calls can't be nested"}
+        elif not isinstance(operation.get("arguments", {}), dict):
+            data = {"error": "Operation arguments must be an object"}
+        else:
+            async with semaphore:
+                if failed:
+                    return {"name": name, "skipped": True}
+                try:
+                    result = await call_tool(name, operation.get("arguments", {}), request)
+                    data = json.loads(result[0].text) if result else {"error": "No result from tool"}
+                except Exception as e:
+                    data = {"error": safe_error_message(e)}
+        if stop_on_error and isinstance(data, dict) and "error" in data:
+            failed = True
+        return {"name": name, "result": data}
+
+    results = await asyncio.gather(*(run(operation) for operation in operations))
+    return json_response({"count": len(results), "results": results})
+
 
 async def call_tool(name: str, arguments: dict[str, Any], request: HttpRequest) -> list[TextContent]:
     """
@@ -71,15 +336,15 @@ async def call_tool(name: str, arguments: dict[str, Any], request: HttpRequest)
     # Handle the find_models tool specially (no model name)
     if name == "find_models":
         return await handle_find_models("", arguments, request)
+    if name == _BATCH_EXECUTE_TOOL.name:
+        return await handle_batch_execute(arguments, request)
 
     # Parse tool name: operation_modelname
-    parts = name.split("_", 1)
-    if len(parts) != 2:
+    operation, separator, model_name = name.partition("_")
+    if not separator:
         return json_response({"error": "Invalid tool name format"})
 
-    operation, model_name = parts
-
-    # Find handler for operation
+    # Find handler for operation; one dict lookup regardless of how many models are registered
     handler = HANDLERS.get(operation)
     if not handler:
         return json_response({"error": f"Unknown operation: {operation}"})
@@ -96,22 +361,20 @@ def _get_field_info(model: type[models.Model]) -> list[dict[str, Any]]:
 
     Returns:
         List of field info dictionaries with name, type, and required status.
+        Only forward fields are listed; reverse relations can't be set
+        through the model's tools.
     """
     fields = []
-    for field in model._meta.get_fields():
-        if hasattr(field, "get_internal_type"):
-            null_allowed = getattr(field, "null", False)
-            blank_allowed = getattr(field, "blank", False)
-            has_default = getattr(field, "has_default", lambda: False)()
-            required = not null_allowed and not blank_allowed and not has_default
-
-            fields.append(
-                {
-                    "name": field.name,
-                    "type": field.get_internal_type(),
-                    "required": required,
-                }
-            )
+    opts = model._meta
+    for field in (*opts.concrete_fields, *opts.many_to_many):
+        required = not field.null and not field.blank and not field.has_default()
+        fields.append(
+            {
+                "name": field.name,
+                "type": field.get_internal_type(),
+                "required": required,
+            }
+        )
     return fields
 
 
@@ -120,12 +383,46 @@ def _format_fields_doc(fields: list[dict[str, Any]]) -> str:
     return "\n".join([f"  - {f['name']} ({f['type']}){' [required]' if f['required'] else ''}" for f in fields])
 
 
+def _get_fields_doc(model: type[models.Model]) -> str:
+    """
+    Get the formatted field documentation for a model, cached per model.
+
+    Args:
+        model: Django model class.
+
+    Returns:
+        Field documentation string used in tool descriptions.
+    """
+    fields_doc = _FIELDS_DOC_CACHE.get(model)
+    if fields_doc is None:
+        fields_doc = _FIELDS_DOC_CACHE[model] = _format_fields_doc(_get_field_info(model))
+    return fields_doc
+
+
 def get_model_tools(model: type[models.Model]) -> list[Tool]:
     """
-    Generate Tool definitions for a single model.
+    Get Tool definitions for a single model.
 
     Creates tools for all standard operations: list, get, create, update,
     delete, describe, actions, action, bulk, related, history, autocomplete.
+    The definitions only depend on the model class, so they are built once
+    per model and shared; callers receive a new list of the same Tool objects.
+
+    Args:
+        model: Django model class.
+
+    Returns:
+        List of Tool definitions for the model.
+    """
+    tools = _MODEL_TOOLS_CACHE.get(model)
+    if tools is None:
+        tools = _MODEL_TOOLS_CACHE[model] = _build_model_tools(model)
+    return list(tools)
+
+
+def _build_model_tools(model: type[models.Model]) -> list[Tool]:
+    """
+    Build Tool definitions for a single model.
 
     Args:
         model: Django model class.
@@ -136,8 +433,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
     model_name = model._meta.model_name
     verbose_name = model._meta.verbose_name
 
-    fields = _get_field_info(model)
-    fields_doc = _format_fields_doc(fields)
+    fields_doc = _get_fields_doc(model)
 
     return [
         Tool(
@@ -149,39 +445,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                 f"field__lte, field__in, field__isnull\n\n"
                 f"Available fields:\n{fields_doc}"
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (default: 100)",
-                        "default": 100,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of items to skip (default: 0)",
-                        "default": 0,
-                    },
-                    "filters": {
-                        "type": "object",
-                        "description": (
-                            "Filter criteria. Keys are field names with optional lookups "
-                            "(e.g., {'status': 'published', 'created_at__gte': '2024-01-01'})"
-                        ),
-                    },
-                    "search": {
-                        "type": "string",
-                        "description": "Search term to match against searchable fields",
-                    },
-                    "order_by": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Fields to order by. Prefix with '-' for descending (e.g., ['-created_at', 'title'])"
-                        ),
-                    },
-                },
-            },
+            inputSchema={"type": "object", "properties": _LIST_PROPERTIES},
         ),
         Tool(
             name=f"get_{model_name}",
@@ -193,16 +457,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                         "type": ["integer", "string"],
                         "description": f"The ID of the {verbose_name}",
                     },
-                    "include_inlines": {
-                        "type": "boolean",
-                        "description": "Include inline related objects (requires admin inlines)",
-                        "default": False,
-                    },
-                    "include_related": {
-                        "type": "boolean",
-                        "description": "Include reverse FK/M2M related objects",
-                        "default": False,
-                    },
+                    **_GET_OPTION_PROPERTIES,
                 },
                 "required": ["id"],
             },
@@ -216,7 +471,8 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                     "data": {
                         "type": "object",
                         "description": f"The data for the new {verbose_name}",
-                    }
+                    },
+                    "pretty": _PRETTY_PROPERTY,
                 },
                 "required": ["data"],
             },
@@ -231,16 +487,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                         "type": ["integer", "string"],
                         "description": f"The ID of the {verbose_name}",
                     },
-                    "data": {
-                        "type": "object",
-                        "description": "The fields to update",
-                    },
-                    "inlines": {
-                        "type": "object",
-                        "description": (
-                            "Inline updates: {model_name: [{id, data}, {data for new}, {id, _delete: true}]}"
-                        ),
-                    },
+                    **_UPDATE_OPTION_PROPERTIES,
                 },
                 "required": ["id"],
             },
@@ -287,21 +534,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                 f"Execute an admin action on selected {verbose_name} instances. "
                 f"Use actions_{model_name} to discover available actions."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "description": "The name of the action to execute (e.g., 'delete_selected')",
-                    },
-                    "ids": {
-                        "type": "array",
-                        "items": {"type": ["integer", "string"]},
-                        "description": "List of IDs to apply the action to",
-                    },
-                },
-                "required": ["action", "ids"],
-            },
+            inputSchema={"type": "object", "properties": _ACTION_PROPERTIES, "required": ["action", "ids"]},
         ),
         Tool(
             name=f"bulk_{model_name}",
@@ -311,21 +544,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                 f"For 'update': items is a list of {{id, data}} objects\n"
                 f"For 'delete': items is a list of IDs"
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "enum": ["create", "update", "delete"],
-                        "description": "The bulk operation to perform",
-                    },
-                    "items": {
-                        "type": "array",
-                        "description": "Items to process (format depends on operation)",
-                    },
-                },
-                "required": ["operation", "items"],
-            },
+            inputSchema={"type": "object", "properties": _BULK_PROPERTIES, "required": ["operation", "items"]},
         ),
         Tool(
             name=f"related_{model_name}",
@@ -340,20 +559,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                         "type": ["integer", "string"],
                         "description": f"The ID of the {verbose_name}",
                     },
-                    "relation": {
-                        "type": "string",
-                        "description": "The name of the relation to fetch (e.g., 'articles' for reverse FK)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of related items to return (default: 100)",
-                        "default": 100,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of items to skip (default: 0)",
-                        "default": 0,
-                    },
+                    **_RELATED_OPTION_PROPERTIES,
                 },
                 "required": ["id", "relation"],
             },
@@ -371,11 +577,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                         "type": ["integer", "string"],
                         "description": f"The ID of the {verbose_name} to get history for",
                     },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of history entries to return (default: 50)",
-                        "default": 50,
-                    },
+                    "limit": _HISTORY_LIMIT_PROPERTY,
                 },
                 "required": ["id"],
             },
@@ -386,20 +588,7 @@ def get_model_tools(model: type[models.Model]) -> list[Tool]:
                 f"Search {verbose_name} instances for autocomplete suggestions. "
                 f"Useful for populating FK/M2M field widgets."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "term": {
-                        "type": "string",
-                        "description": "Search term to match against searchable fields",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of suggestions to return (default: 20)",
-                        "default": 20,
-                    },
-                },
-            },
+            inputSchema={"type": "object", "properties": _AUTOCOMPLETE_PROPERTIES},
         ),
     ]
 
@@ -408,24 +597,22 @@ def get_find_models_tool() -> Tool:
     """
     Get the find_models tool for discovering available models.
 
+    The definition never changes, so a single shared instance is returned.
+
     Returns:
         Tool definition for find_models.
     """
-    return Tool(
-        name="find_models",
-        description=(
-            "Discover available Django models registered with MCP. Use this to find which models have tools available."
-        ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Optional search query to filter models by name (case-insensitive)",
-                }
-            },
-        },
-    )
+    return _FIND_MODELS_TOOL
+
+
+def get_batch_execute_tool() -> Tool:
+    """
+    Get the batch_execute tool for running several tool calls at once.
+
+    Returns:
+        Tool definition for batch_execute.
+    """
+    return _BATCH_EXECUTE_TOOL
 
 
 def get_tools() -> list[Tool]:
@@ -436,10 +623,10 @@ def get_tools() -> list[Tool]:
     generates tool definitions for each.
 
     Returns:
-        List of all Tool definitions including find_models and
-        per-model operation tools.
+        List of all Tool definitions including find_models, batch_execute
+        and per-model operation tools.
     """
-    tools = [get_find_models_tool()]
+    tools = [get_find_models_tool(), get_batch_execute_tool()]
 
     for _model_name, model_admin in get_exposed_models():
         model = model_admin.model
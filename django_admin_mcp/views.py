@@ -4,11 +4,18 @@ HTTP views for django-admin-mcp
 Provides HTTP interface for MCP protocol with token-based authentication.
 """
 
+import json
+import time
+from datetime import timedelta
 from typing import Any
 
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import DatabaseError, transaction
-from django.http import HttpRequest, JsonResponse
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
@@ -16,22 +23,15 @@ from django.views.decorators.http import require_http_methods
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from django_admin_mcp.handlers.base import sanitize_pydantic_errors
+from django_admin_mcp.mixin import MCPAdminMixin
 from django_admin_mcp.models import MCPToken
 from django_admin_mcp.protocol import (
-    InitializeResponse,
     InitializeResult,
     JsonRpcError,
     JsonRpcResponse,
-    NotificationsInitializedResponse,
     ServerCapabilities,
     ServerInfo,
-    TextContent,
-    Tool,
     ToolsCallRequest,
-    ToolsCallResponse,
-    ToolsCallResult,
-    ToolsListRequest,
-    ToolsListResponse,
     ToolsListResult,
 )
 from django_admin_mcp.tools import call_tool, get_tools
@@ -53,9 +53,154 @@ class RequestBody(BaseModel):
 # TypeAdapter for parsing arbitrary JSON dictionaries
 dict_adapter: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
 
+# Authenticated tokens by key as (expiry on the monotonic clock, token), see MCP_TOKEN_CACHE_TTL
+_TOKEN_CACHE: dict[str, tuple[float, MCPToken]] = {}
 
-@sync_to_async
-def authenticate_token(request):
+# Most tokens kept in _TOKEN_CACHE; the oldest entries are evicted first
+_TOKEN_CACHE_MAXSIZE = 1_000
+
+# Minimum time between last_used_at writes for a token, see _should_mark_used()
+_LAST_USED_UPDATE_INTERVAL = timedelta(seconds=60)
+
+
+def _get_cached_token(token_key: str) -> MCPToken | None:
+    """
+    Look up a token stored by _cache_token().
+
+    Caching is opt-in: it is disabled unless the MCP_TOKEN_CACHE_TTL setting
+    is a positive number of seconds. Saving or deleting a token drops its
+    entry; other changes (e.g. to the linked user) are seen once it expires.
+
+    Args:
+        token_key: The public key portion of the token.
+
+    Returns:
+        The cached MCPToken, or None on a miss.
+    """
+    if not _TOKEN_CACHE or getattr(settings, "MCP_TOKEN_CACHE_TTL", 0) <= 0:
+        return None
+    entry = _TOKEN_CACHE.get(token_key)
+    if entry is None:
+        return None
+    expires_at, token = entry
+    if expires_at <= time.monotonic():
+        _TOKEN_CACHE.pop(token_key, None)
+        return None
+    return token
+
+
+def _cache_token(token: MCPToken) -> None:
+    """
+    Store an authenticated token for _get_cached_token(), if caching is enabled.
+
+    Args:
+        token: The token, with its user loaded.
+    """
+    ttl = getattr(settings, "MCP_TOKEN_CACHE_TTL", 0)
+    if ttl <= 0:
+        return
+    _TOKEN_CACHE[token.token_key] = (time.monotonic() + ttl, token)
+    while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAXSIZE:
+        try:
+            _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)), None)
+        except (StopIteration, RuntimeError):
+            break
+
+
+@receiver(post_save, sender=MCPToken)
+@receiver(post_delete, sender=MCPToken)
+def _invalidate_cached_token(sender, instance, **kwargs):
+    """Drop a saved or deleted token from _TOKEN_CACHE, including under a regenerated key."""
+    for token_key, (_expires_at, token) in list(_TOKEN_CACHE.items()):
+        if token.pk == instance.pk:
+            _TOKEN_CACHE.pop(token_key, None)
+
+
+# Encoded initialize result, identical for every client
+_INITIALIZE_RESULT_JSON = InitializeResult(
+    protocolVersion="2025-11-25",
+    serverInfo=ServerInfo(name="django-admin-mcp", version="0.2.1"),
+    capabilities=ServerCapabilities(),
+).model_dump_json(exclude_none=True)
+
+# Encoded {"tools": [...]} payload for tools/list, keyed by MCPAdminMixin._registry_version
+_TOOLS_LIST_CACHE: dict[int, str] = {}
+
+
+def _get_tools_list_json() -> str:
+    """
+    Get the encoded tools/list payload.
+
+    Tool definitions only change when a model is registered, so the list
+    is built and encoded once per registry version instead of per request.
+
+    Returns:
+        JSON string of the form {"tools": [...]}.
+    """
+    version = MCPAdminMixin._registry_version
+    payload = _TOOLS_LIST_CACHE.get(version)
+    if payload is None:
+        payload = ToolsListResult(tools=get_tools()).model_dump_json(exclude_none=True)
+        _TOOLS_LIST_CACHE.clear()
+        _TOOLS_LIST_CACHE[version] = payload
+    return payload
+
+
+def _jsonrpc_result_response(request_id: str | int | None, result_json: str) -> HttpResponse:
+    """
+    Build a JSON-RPC success response around an already encoded result.
+
+    The body matches JsonRpcResponse(id=request_id, result=...).model_dump_json(),
+    without validating and re-encoding a result that is already JSON.
+
+    Args:
+        request_id: The JSON-RPC request id; omitted from the body when None.
+        result_json: The encoded result object.
+
+    Returns:
+        HttpResponse with an application/json body.
+    """
+    id_member = "" if request_id is None else f'"id":{json.dumps(request_id, ensure_ascii=False)},'
+    return HttpResponse(f'{{"jsonrpc":"2.0",{id_member}"result":{result_json}}}', content_type="application/json")
+
+
+def model_json_response(model: BaseModel, status: int = 200) -> HttpResponse:
+    """
+    Build a JSON HTTP response from a Pydantic model.
+
+    The body is encoded by pydantic-core in one pass, rather than dumping the
+    model to Python objects and re-encoding them with the stdlib encoder
+    behind JsonResponse.
+
+    Args:
+        model: The response model to serialize.
+        status: HTTP status code.
+
+    Returns:
+        HttpResponse with an application/json body.
+    """
+    return HttpResponse(model.model_dump_json(), content_type="application/json", status=status)
+
+
+def _should_mark_used(token: MCPToken, now) -> bool:
+    """
+    Check whether a token's last_used_at is due to be written.
+
+    last_used_at is an audit hint, so it is written at most once per
+    _LAST_USED_UPDATE_INTERVAL per token.
+
+    Args:
+        token: The authenticated token.
+        now: The current time.
+
+    Returns:
+        True if last_used_at is unset or older than the interval.
+    """
+    last_used_at = token.last_used_at
+    return last_used_at is None or now - last_used_at >= _LAST_USED_UPDATE_INTERVAL
+
+
+async def authenticate_token(request):
     """
     Authenticate request using Bearer token with O(1) lookup.
 
@@ -63,6 +208,9 @@ def authenticate_token(request):
     - key: used for indexed database lookup
     - secret: verified against stored hash
 
+    A cached token that needs no last_used_at write is checked on the event
+    loop; every other request goes through the database in a worker thread.
+
     Returns:
         MCPToken if valid, None otherwise
     """
@@ -70,30 +218,57 @@ def authenticate_token(request):
     if not auth_header.startswith("Bearer "):
         return None
 
-    token_value = auth_header[7:]  # Remove 'Bearer ' prefix
+    # Parse token to extract key and secret
+    parsed = MCPToken.parse_token(auth_header[7:])  # Remove 'Bearer ' prefix
+    if not parsed:
+        return None
 
-    try:
-        # Parse token to extract key and secret
-        parsed = MCPToken.parse_token(token_value)
-        if not parsed:
-            return None
+    key, secret = parsed
 
-        key, secret = parsed
+    token = _get_cached_token(key)
+    if token is not None:
+        # One clock read serves both the expiry check and the last_used_at throttle
+        now = timezone.now()
+        if not _should_mark_used(token, now):
+            return token if token.verify_secret(secret) and token.is_valid(now) else None
+    return await _authenticate_token(key, secret)
 
-        # O(1) lookup by key (indexed)
-        token = MCPToken.get_by_key(key)
-        if not token:
-            return None
 
-        # Verify the secret portion
-        if not token.verify_secret(secret):
+@sync_to_async
+def _authenticate_token(key: str, secret: str) -> MCPToken | None:
+    """
+    Authenticate a parsed token, looking it up and recording its use as needed.
+
+    Args:
+        key: The public key portion of the token.
+        secret: The secret portion of the token.
+
+    Returns:
+        MCPToken if valid, None otherwise
+    """
+    try:
+        # Recently authenticated tokens skip the database; the secret is still verified
+        token = _get_cached_token(key)
+        if token is None:
+            # O(1) lookup by key (indexed)
+            token = MCPToken.get_by_key(key)
+            if not token:
+                return None
+
+            # Verify the secret portion
+            if not token.verify_secret(secret):
+                return None
+            _cache_token(token)
+        elif not token.verify_secret(secret):
             return None
 
-        # Check if token is valid (not expired)
-        if not token.is_valid():
+        # Check if token is valid (not expired); the same time is recorded as last_used_at
+        now = timezone.now()
+        if not token.is_valid(now):
             return None
 
-        token.mark_used()
+        if _should_mark_used(token, now):
+            token.mark_used(now)
         return token
     except (DatabaseError, ValueError):
         return None
@@ -115,9 +290,10 @@ class MCPHTTPView(View):
         if not token:
             return JsonResponse({"error": "Invalid or missing authentication token"}, status=401)
 
-        # Parse request body using Pydantic - first parse to determine method
+        # Decode the JSON once; the typed models below validate the decoded dict
         try:
-            body = RequestBody.model_validate_json(request.body)
+            data = dict_adapter.validate_json(request.body)
+            body = RequestBody.model_validate(data)
         except ValidationError:
             return JsonResponse({"error": "Invalid JSON in request body"}, status=400)
 
@@ -125,18 +301,11 @@ class MCPHTTPView(View):
         method = body.method
 
         if method == "tools/list":
-            # Validate with ToolsListRequest using raw body
-            try:
-                _ = ToolsListRequest.model_validate_json(request.body)
-            except ValidationError as e:
-                return JsonResponse(
-                    {"error": "Invalid request", "details": sanitize_pydantic_errors(e.errors())}, status=400
-                )
             return await self.handle_list_tools(request)
         elif method == "tools/call":
-            # Validate with ToolsCallRequest using raw body
+            # Validate with ToolsCallRequest using the decoded body
             try:
-                request_obj = ToolsCallRequest.model_validate_json(request.body)
+                request_obj = ToolsCallRequest.model_validate(data)
             except ValidationError as e:
                 return JsonResponse(
                     {"error": "Invalid request", "details": sanitize_pydantic_errors(e.errors())}, status=400
@@ -147,20 +316,7 @@ class MCPHTTPView(View):
 
     async def handle_list_tools(self, request):
         """Handle tools/list request."""
-        tools = get_tools()
-
-        # Serialize tools to dict format
-        tools_data = []
-        for tool in tools:
-            tools_data.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-            )
-
-        return JsonResponse({"tools": tools_data})
+        return HttpResponse(_get_tools_list_json(), content_type="application/json")
 
     async def handle_call_tool(self, request, request_obj: ToolsCallRequest, token=None):
         """Handle tools/call request."""
@@ -177,9 +333,10 @@ class MCPHTTPView(View):
         # Extract text from result - content.text is a JSON string
         if result and len(result) > 0:
             content = result[0]
-            # Parse JSON string using Pydantic TypeAdapter
-            response_data = dict_adapter.validate_json(content.text)
-            return JsonResponse(response_data)
+            if getattr(settings, "MCP_VALIDATE_TOOL_RESULTS", False):
+                dict_adapter.validate_json(content.text)
+            # Send the tool's JSON object as is rather than decoding and re-encoding it
+            return HttpResponse(content.text, content_type="application/json")
         else:
             return JsonResponse({"error": "No result from tool"}, status=500)
 
@@ -212,40 +369,30 @@ async def mcp_endpoint(request):
     method = body.method
 
     if method == "initialize":
-        # Handle MCP initialization
-        response = InitializeResponse(
-            id=body.id,
-            result=InitializeResult(
-                protocolVersion="2025-11-25",
-                serverInfo=ServerInfo(name="django-admin-mcp", version="0.2.1"),
-                capabilities=ServerCapabilities(),
-            ),
-        )
-        return JsonResponse(response.model_dump())
+        # Handle MCP initialization; the result is the same for every client
+        return _jsonrpc_result_response(body.id, _INITIALIZE_RESULT_JSON)
     elif method == "notifications/initialized":
         # Client acknowledgement - just return success
-        response = NotificationsInitializedResponse(id=body.id)
-        return JsonResponse(response.model_dump())
+        return _jsonrpc_result_response(body.id, "{}")
     elif method == "tools/list":
-        # Validate with ToolsListRequest using raw body
-        try:
-            _ = ToolsListRequest.model_validate_json(request.body)
-        except ValidationError as e:
-            return JsonResponse(
-                {"error": "Invalid request", "details": sanitize_pydantic_errors(e.errors())}, status=400
-            )
         return await handle_list_tools_request(request, body.id)
     elif method == "tools/call":
         # Extract params from JSON-RPC structure
         params = body.params or {}
-        # Build a flat structure for validation
-        call_data = {"method": method, "name": params.get("name"), "arguments": params.get("arguments", {})}
-        try:
-            request_obj = ToolsCallRequest.model_validate(call_data)
-        except ValidationError as e:
-            return JsonResponse(
-                {"error": "Invalid request", "details": sanitize_pydantic_errors(e.errors())}, status=400
-            )
+        name = params.get("name")
+        arguments = params.get("arguments", {})
+        if isinstance(name, str) and isinstance(arguments, dict):
+            # params came out of RequestBody's JSON validation, so well-formed calls need no second pass
+            request_obj = ToolsCallRequest.model_construct(method=method, name=name, arguments=arguments)
+        else:
+            # Validate malformed calls only to report what's wrong with them
+            call_data = {"method": method, "name": name, "arguments": arguments}
+            try:
+                request_obj = ToolsCallRequest.model_validate(call_data)
+            except ValidationError as e:
+                return JsonResponse(
+                    {"error": "Invalid request", "details": sanitize_pydantic_errors(e.errors())}, status=400
+                )
         return await handle_call_tool_request(request, request_obj, token=token, request_id=body.id)
     else:
         return JsonResponse({"error": f"Unknown method: {method}"}, status=400)
@@ -257,16 +404,8 @@ mcp_endpoint.csrf_exempt = True  # type: ignore[attr-defined]
 
 async def handle_list_tools_request(request, request_id=None):
     """Handle tools/list request."""
-    tools = get_tools()
-
-    # Convert to Pydantic Tool models
-    tool_models = [Tool(name=tool.name, description=tool.description, inputSchema=tool.inputSchema) for tool in tools]
-
-    response = ToolsListResponse(
-        id=request_id,
-        result=ToolsListResult(tools=tool_models),
-    )
-    return JsonResponse(response.model_dump())
+    # Only the envelope is formatted per request, matching ToolsListResponse.model_dump_json()
+    return _jsonrpc_result_response(request_id, _get_tools_list_json())
 
 
 async def handle_call_tool_request(request, request_obj: ToolsCallRequest, token=None, request_id=None):
@@ -284,30 +423,28 @@ async def handle_call_tool_request(request, request_obj: ToolsCallRequest, token
     # Extract text from result - content.text is already a JSON string
     if result and len(result) > 0:
         content = result[0]
-        # Validate that content.text is valid JSON using Pydantic TypeAdapter
-        # This provides type safety without the overhead of parse-then-reserialize
-        try:
-            dict_adapter.validate_json(content.text)
-        except ValidationError as e:
-            error_response = JsonRpcResponse(
-                id=request_id,
-                error=JsonRpcError(
-                    code=-32000,
-                    message="Invalid JSON in tool result",
-                    data={"validation_errors": sanitize_pydantic_errors(e.errors())},
-                ),
-            )
-            return JsonResponse(error_response.model_dump(), status=500)
-
-        # Pass through the JSON string as-is
-        response = ToolsCallResponse(
-            id=request_id,
-            result=ToolsCallResult(content=[TextContent(text=content.text)]),
-        )
-        return JsonResponse(response.model_dump())
+        # Tool results are encoded by the handlers themselves, so parsing them again only
+        # to discard the result is opt-in (MCP_VALIDATE_TOOL_RESULTS)
+        if getattr(settings, "MCP_VALIDATE_TOOL_RESULTS", False):
+            try:
+                dict_adapter.validate_json(content.text)
+            except ValidationError as e:
+                error_response = JsonRpcResponse(
+                    id=request_id,
+                    error=JsonRpcError(
+                        code=-32000,
+                        message="Invalid JSON in tool result",
+                        data={"validation_errors": sanitize_pydantic_errors(e.errors())},
+                    ),
+                )
+                return model_json_response(error_response, status=500)
+
+        # Pass through the JSON string as-is, encoded once as the text member of a ToolsCallResult
+        result_json = f'{{"content":[{{"type":"text","text":{json.dumps(content.text, ensure_ascii=False)}}}]}}'
+        return _jsonrpc_result_response(request_id, result_json)
     else:
         error_response = JsonRpcResponse(
             id=request_id,
             error=JsonRpcError(code=-32000, message="No result from tool"),
         )
-        return JsonResponse(error_response.model_dump(), status=500)
+        return model_json_response(error_response, status=500)
@@ -9,6 +9,7 @@ This script:
 """
 
 import asyncio
+import json
 import os
 
 import django
@@ -17,61 +18,67 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'example_project.settings')
 django.setup()
 
-from datetime import datetime
-
 from asgiref.sync import sync_to_async
 from blog.models import Article, Author
+from django.db import transaction
+from django.utils import timezone
 
 from django_admin_mcp import MCPAdminMixin, get_registered_models
 
 
 def create_sample_data():
     """Create sample data in the database."""
-    # Clear existing data
-    Article.objects.all().delete()
-    Author.objects.all().delete()
-
-    # Create authors
-    author1 = Author.objects.create(
-        name="Jane Doe",
-        email="jane@example.com",
-        bio="Technology writer and blogger"
-    )
-    print(f"   ✓ Created author: {author1.name}")
-
-    author2 = Author.objects.create(
-        name="John Smith",
-        email="john@example.com",
-        bio="Science fiction author"
-    )
-    print(f"   ✓ Created author: {author2.name}")
-
-    # Create articles
-    article1 = Article.objects.create(
-        title="Getting Started with Django",
-        content="Django is a high-level Python web framework...",
-        author=author1,
-        is_published=True,
-        published_date=datetime.now()
-    )
-    print(f"   ✓ Created article: {article1.title}")
-
-    article2 = Article.objects.create(
-        title="Introduction to MCP",
-        content="Model Context Protocol enables AI assistants...",
-        author=author1,
-        is_published=True,
-        published_date=datetime.now()
-    )
-    print(f"   ✓ Created article: {article2.title}")
-
-    article3 = Article.objects.create(
-        title="Future of AI",
-        content="The future of artificial intelligence...",
-        author=author2,
-        is_published=False
-    )
-    print(f"   ✓ Created article: {article3.title}")
+    # One timestamp for every published article
+    now = timezone.now()
+
+    # Seed everything in one transaction, inserting each model with a single bulk_create
+    with transaction.atomic():
+        # Clear existing data
+        Article.objects.all().delete()
+        Author.objects.all().delete()
+
+        # Create authors
+        author1, author2 = Author.objects.bulk_create([
+            Author(
+                name="Jane Doe",
+                email="jane@example.com",
+                bio="Technology writer and blogger"
+            ),
+            Author(
+                name="John Smith",
+                email="john@example.com",
+                bio="Science fiction author"
+            ),
+        ])
+
+        # Create articles
+        article1, article2, article3 = Article.objects.bulk_create([
+            Article(
+                title="Getting Started with Django",
+                content="Django is a high-level Python web framework...",
+                author=author1,
+                is_published=True,
+                published_date=now
+            ),
+            Article(
+                title="Introduction to MCP",
+                content="Model Context Protocol enables AI assistants...",
+                author=author1,
+                is_published=True,
+                published_date=now
+            ),
+            Article(
+                title="Future of AI",
+                content="The future of artificial intelligence...",
+                author=author2,
+                is_published=False
+            ),
+        ])
+
+    for author in (author1, author2):
+        print(f"   ✓ Created author: {author.name}")
+    for article in (article1, article2, article3):
+        print(f"   ✓ Created article: {article.title}")
 
     return article1.id, article3.id
 
@@ -99,15 +106,22 @@ async def demonstrate_mcp_tools():
     print("\n3. MCP Tool Demonstrations")
     print("-" * 60)
 
+    # The two reads don't depend on each other, so send them as one batch
+    result = await MCPAdminMixin.handle_tool_call('batch_execute', {
+        'operations': [
+            {'name': 'list_author', 'arguments': {'limit': 10}},
+            {'name': 'get_article', 'arguments': {'id': article1_id}},
+        ],
+    })
+    authors_result, article_result = json.loads(result[0].text)['results']
+
     # List authors
     print("\n   a) List Authors (using MCP tool)")
-    result = await MCPAdminMixin.handle_tool_call('list_author', {'limit': 10})
-    print(f"      {result[0].text}")
+    print(f"      {json.dumps(authors_result['result'])}")
 
     # Get specific article
     print("\n   b) Get Article by ID (using MCP tool)")
-    result = await MCPAdminMixin.handle_tool_call('get_article', {'id': article1_id})
-    print(f"      {result[0].text}")
+    print(f"      {json.dumps(article_result['result'])}")
 
     # Update article
     print("\n   c) Update Article (using MCP tool)")
@@ -10,9 +10,16 @@ import pytest
 from django.contrib import admin
 
 from django_admin_mcp import MCPAdminMixin
+from django_admin_mcp.handlers.meta import _ADMIN_CONFIG_CACHE
 from tests.models import Article, Author
 
 
+def forget_describe_cache(model_name, model_admin):
+    """Drop the cached describe payload and admin_config so describe reads the admin again."""
+    MCPAdminMixin._registered_models[model_name].pop("describe_content", None)
+    _ADMIN_CONFIG_CACHE.pop(model_admin, None)
+
+
 @pytest.mark.django_db
 @pytest.mark.asyncio
 class TestEdgeCasesAndErrors:
@@ -484,6 +491,7 @@ class TestEdgeCasesAndErrors:
             ("Basic Info", {"fields": ("name", "email")}),
             ("Details", {"fields": ("bio",), "classes": ("collapse",)}),
         )
+        forget_describe_cache("author", author_admin)
 
         try:
             result = await MCPAdminMixin.handle_tool_call("describe_author", {})
@@ -492,6 +500,7 @@ class TestEdgeCasesAndErrors:
             assert "fieldsets" in response["admin_config"]
         finally:
             author_admin.fieldsets = original_fieldsets
+            forget_describe_cache("author", author_admin)
 
     async def test_describe_with_date_hierarchy(self):
         """Test describe with date_hierarchy configured."""
@@ -500,6 +509,7 @@ class TestEdgeCasesAndErrors:
         article_admin = admin.site._registry[Article]
         original_date_hierarchy = getattr(article_admin, "date_hierarchy", None)
         article_admin.date_hierarchy = "published_date"
+        forget_describe_cache("article", article_admin)
 
         try:
             result = await MCPAdminMixin.handle_tool_call("describe_article", {})
@@ -508,6 +518,7 @@ class TestEdgeCasesAndErrors:
             assert "date_hierarchy" in response["admin_config"]
         finally:
             article_admin.date_hierarchy = original_date_hierarchy
+            forget_describe_cache("article", article_admin)
 
     async def test_action_with_custom_action(self):
         """Test executing a custom action."""
@@ -609,6 +620,8 @@ class TestEdgeCasesAndErrors:
         def broken_get_fields(**kwargs):
             raise RuntimeError("schema leak")
 
+        # Drop the cached payload so describe has to walk the model again
+        MCPAdminMixin._registered_models["author"].pop("describe_content", None)
         Author._meta.get_fields = broken_get_fields
         try:
             result = await MCPAdminMixin.handle_tool_call("describe_author", {})
@@ -621,7 +634,7 @@ class TestEdgeCasesAndErrors:
     async def test_find_models_exception_returns_safe_error(self):
         """Test that find_models exception handler returns sanitized error."""
         with patch(
-            "django_admin_mcp.handlers.meta.async_check_permission",
+            "django_admin_mcp.handlers.meta.check_permission",
             side_effect=RuntimeError("permission system failure"),
         ):
             result = await MCPAdminMixin.handle_tool_call("find_models", {})
@@ -631,9 +644,9 @@ class TestEdgeCasesAndErrors:
 
     async def test_bulk_create_exception_returns_safe_error(self):
         """Test that bulk create exception handler returns sanitized error."""
-        # Patch transaction.atomic to raise after form.save()
+        # Patch _log_action to raise after form.save(), inside the item's savepoint
         with patch(
-            "django_admin_mcp.handlers.actions.transaction.atomic",
+            "django_admin_mcp.handlers.actions._log_action",
             side_effect=RuntimeError("db connection lost"),
         ):
             result = await MCPAdminMixin.handle_tool_call(
@@ -6,24 +6,49 @@ import json
 import logging
 import uuid
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
-from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.auth.models import AnonymousUser, Group, Permission, User
 from django.core.exceptions import FieldError
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import IntegrityError, OperationalError
+from django.db import IntegrityError, OperationalError, connection
+from django.db.models.signals import pre_save
+from django.forms.models import model_to_dict, modelform_factory
 from django.http import HttpRequest
 
 from django_admin_mcp.handlers import (
+    JSONArrayWriter,
     check_permission,
     create_mock_request,
+    encode_json,
+    get_admin_form_class,
     get_exposed_models,
     get_model_admin,
     get_model_name,
+    iter_serialized_queryset,
+    json_dumps,
+    json_dumps_incremental,
     json_response,
+    normalize_fk_fields,
     serialize_instance,
+    serialize_queryset,
+    text_response,
+)
+from django_admin_mcp.handlers.base import (
+    MCPRequest,
+    _get_editable_private_field_names,
+    async_check_permission,
+    cache_object,
+    get_cached_object,
+    invalidate_cached_objects,
+    merge_form_data,
+    safe_error_message,
+    sanitize_pydantic_errors,
+    save_model_form,
+    select_for_update_self,
+    serialize_data_for_log,
 )
-from django_admin_mcp.handlers.base import MCPRequest, safe_error_message, sanitize_pydantic_errors
 from django_admin_mcp.protocol.types import TextContent
 from tests.models import Article, Author
 
@@ -58,6 +83,95 @@ class TestJsonResponse:
         assert "2024-01-15" in parsed["created_at"]
 
 
+class TestTextResponse:
+    """Tests for text_response function."""
+
+    def test_wraps_text_unchanged(self):
+        """Test that the text is returned in a single text TextContent."""
+        result = text_response('{"key": "value"}')
+        assert len(result) == 1
+        assert isinstance(result[0], TextContent)
+        assert result[0].type == "text"
+        assert result[0].text == '{"key": "value"}'
+
+
+class TestEncodeJson:
+    """Tests for encode_json decorator."""
+
+    def test_returns_compact_json_text(self):
+        """Test that the wrapped function's dictionary is returned as json_dumps() text."""
+
+        @encode_json
+        def build(count):
+            """Build a response."""
+            return {"count": count, "when": datetime(2024, 1, 15)}
+
+        assert build(2) == json_dumps({"count": 2, "when": datetime(2024, 1, 15)})
+        assert build.__doc__ == "Build a response."
+
+
+class TestSerializeDataForLog:
+    """Tests for serialize_data_for_log function."""
+
+    def test_short_data_matches_json_dumps(self):
+        """Test that data under the limit is serialized in full."""
+        data = {"name": "Test", "count": 3, "tags": [1, 2]}
+        assert serialize_data_for_log(data) == json_dumps(data)
+
+    def test_empty_data(self):
+        """Test that empty data serializes as an empty object."""
+        assert serialize_data_for_log({}) == "{}"
+
+    def test_long_data_is_truncated(self):
+        """Test that long data matches truncating the full serialization."""
+        data = {f"field_{i}": "x" * 100 for i in range(50)}
+        result = serialize_data_for_log(data, max_length=200)
+        assert len(result) == 200
+        assert result == json_dumps(data)[:197] + "..."
+
+
+class TestJsonDumpsIncremental:
+    """Tests for JSONArrayWriter and json_dumps_incremental."""
+
+    def test_empty_writer_is_empty_array(self):
+        """Test that a writer with no items serializes as []."""
+        assert json.loads(json_dumps_incremental({"items": JSONArrayWriter()})) == {"items": []}
+
+    def test_splices_writer_items(self):
+        """Test that appended items appear in order inside nested mappings."""
+        writer = JSONArrayWriter()
+        writer.append({"index": 0, "id": 1})
+        writer.append({"index": 1, "id": "abc"})
+
+        result = json.loads(json_dumps_incremental({"count": len(writer), "results": {"success": writer}}))
+
+        assert result == {"count": 2, "results": {"success": [{"index": 0, "id": 1}, {"index": 1, "id": "abc"}]}}
+
+    def test_non_serializable_items_fall_back_to_str(self):
+        """Test that items without a JSON representation are stringified."""
+        writer = JSONArrayWriter()
+        writer.append({"created_at": datetime(2024, 1, 15, 10, 30, 0)})
+
+        result = json.loads(json_dumps_incremental({"items": writer}))
+
+        assert "2024-01-15" in result["items"][0]["created_at"]
+
+    def test_extend_matches_append_across_batches(self):
+        """Test that batched extend() writes the same array as appending one at a time."""
+        items = [{"id": n, "name": f"row {n}"} for n in range(1234)]
+        appended = JSONArrayWriter()
+        appended.append({"id": -1})
+        for item in items:
+            appended.append(item)
+        extended = JSONArrayWriter()
+        extended.append({"id": -1})
+        extended.extend(iter(items))
+        extended.extend([])
+
+        assert len(extended) == len(appended) == 1235
+        assert json_dumps_incremental({"items": extended}) == json_dumps_incremental({"items": appended})
+
+
 @pytest.mark.django_db
 class TestGetModelAdmin:
     """Tests for get_model_admin function."""
@@ -158,6 +272,17 @@ class TestCheckPermission:
         # Django admin by default denies anonymous users
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_async_check_without_user_skips_thread_hop(self):
+        """Test that checks that always pass are answered without sync_to_async."""
+        _, model_admin = get_model_admin("author")
+
+        with patch("django_admin_mcp.handlers.base.sync_to_async") as mock_sync_to_async:
+            assert await async_check_permission(create_mock_request(), model_admin, "view") is True
+            assert await async_check_permission(create_mock_request(AnonymousUser()), None, "view") is True
+
+        mock_sync_to_async.assert_not_called()
+
 
 @pytest.mark.django_db
 class TestGetExposedModels:
@@ -207,8 +332,251 @@ class TestSerializeInstance:
         # FK should be serialized (either as ID or string)
         assert "author" in result
 
+    def test_models_without_private_fields(self):
+        """Test that models without GenericForeignKeys have no private names to convert."""
+        assert _get_editable_private_field_names(Article) == ()
+
+
+@pytest.mark.django_db
+class TestSerializeQueryset:
+    """Tests for serialize_queryset function."""
+
+    def test_matches_serialize_instance(self):
+        """Test that rows serialize exactly like serialize_instance."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"QS Author {uid}", email=f"qs_{uid}@example.com")
+        Article.objects.create(title=f"First {uid}", content="One", author=author)
+        Article.objects.create(title=f"Second {uid}", content="Two", author=author)
+        queryset = Article.objects.filter(author=author).order_by("pk")
+
+        result = serialize_queryset(queryset)
+
+        assert result == [serialize_instance(article) for article in queryset]
+
+    def test_iter_matches_list(self):
+        """Test that iter_serialized_queryset yields the same rows as serialize_queryset."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Iter Author {uid}", email=f"iter_{uid}@example.com")
+        Article.objects.create(title=f"Iter {uid}", content="Body", author=author)
+        queryset = Article.objects.filter(author=author)
+
+        assert list(iter_serialized_queryset(queryset)) == serialize_queryset(queryset)
+
+    def test_iter_small_chunk_size_yields_every_row(self):
+        """Test that rows spanning several cursor chunks are all yielded in order."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Chunk Author {uid}", email=f"chunk_{uid}@example.com")
+        for n in range(5):
+            Article.objects.create(title=f"Chunk {n} {uid}", content="Body", author=author)
+        queryset = Article.objects.filter(author=author).order_by("pk")
+
+        assert list(iter_serialized_queryset(queryset, chunk_size=2)) == serialize_queryset(queryset)
+
+    def test_iter_m2m_matches_serialize_instance(self):
+        """Test that M2M rows read without instances match serialize_instance."""
+        uid = unique_id()
+        with_perms = Group.objects.create(name=f"Perms {uid}")
+        with_perms.permissions.add(*Permission.objects.filter(codename__endswith="_article"))
+        Group.objects.create(name=f"Empty {uid}")
+        queryset = Group.objects.filter(name__endswith=uid).order_by("pk")
+
+        result = list(iter_serialized_queryset(queryset, chunk_size=1))
+
+        assert result == [serialize_instance(group) for group in queryset]
+        assert len(result[0]["permissions"]) == 4
+
+    def test_respects_admin_field_filtering(self):
+        """Test that mcp_fields/mcp_exclude_fields apply to queryset rows."""
+
+        class FilteredAdmin:
+            mcp_fields = ["name", "email"]
+            mcp_exclude_fields = ["email"]
+
+        uid = unique_id()
+        Author.objects.create(name=f"Filtered {uid}", email=f"filtered_{uid}@example.com")
+
+        result = serialize_queryset(Author.objects.filter(name=f"Filtered {uid}"), FilteredAdmin())
+
+        assert result == [{"name": f"Filtered {uid}"}]
+
+    def test_empty_field_list_returns_empty_rows(self):
+        """Test that an empty mcp_fields list yields empty dicts, not every field."""
+
+        class NoFieldsAdmin:
+            mcp_fields: list[str] = []
+            mcp_exclude_fields = None
+
+        uid = unique_id()
+        Author.objects.create(name=f"Empty {uid}", email=f"empty_{uid}@example.com")
+
+        result = serialize_queryset(Author.objects.filter(name=f"Empty {uid}"), NoFieldsAdmin())
+
+        assert result == [{}]
+
+
+class TestSelectForUpdateSelf:
+    """Tests for select_for_update_self function."""
+
+    def test_locks_only_own_table_when_supported(self):
+        """Test that FOR UPDATE OF self is used only where the backend supports it."""
+        queryset = select_for_update_self(Article.objects.select_related("author"))
+
+        assert queryset.query.select_for_update
+        expected_of = ("self",) if connection.features.has_select_for_update_of else ()
+        assert queryset.query.select_for_update_of == expected_of
+
+
+class TestObjectCache:
+    """Tests for the get_cached_object/invalidate_cached_objects pair."""
+
+    def test_unconvertible_pks_are_skipped(self, settings):
+        """Test that primary keys that can't be converted are treated as never cached."""
+        settings.MCP_GET_CACHE_TTL = 60
+        invalidate_cached_objects()
+        cache_object(Author, 1, {"name": "Cached"})
+
+        try:
+            assert get_cached_object(Author, "not-a-pk") is None
+            invalidate_cached_objects(Author, ["not-a-pk", "1"])
+            assert get_cached_object(Author, 1) is None
+        finally:
+            invalidate_cached_objects()
+
+
+@pytest.mark.django_db
+class TestSaveModelForm:
+    """Tests for save_model_form function."""
+
+    def _bound_form(self, instance, **changes):
+        form_class = modelform_factory(Article, fields="__all__")
+        form = form_class(data={**model_to_dict(instance), **changes}, instance=instance)
+        assert form.is_valid(), form.errors
+        return form
+
+    def test_updates_changed_fields(self):
+        """Test that changed columns are persisted on an existing instance."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Save Author {uid}", email=f"save_{uid}@example.com")
+        article = Article.objects.create(title=f"Before {uid}", content="Body", author=author)
+
+        saved = save_model_form(self._bound_form(article, title=f"After {uid}"))
+
+        assert saved.pk == article.pk
+        article.refresh_from_db()
+        assert article.title == f"After {uid}"
+        assert article.content == "Body"
+
+    def test_creates_new_instance(self):
+        """Test that unsaved instances are created via form.save()."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"New Author {uid}", email=f"new_{uid}@example.com")
+        form_class = modelform_factory(Article, fields="__all__")
+        form = form_class(data={"title": f"New {uid}", "content": "Body", "author": author.pk})
+        assert form.is_valid(), form.errors
+
+        saved = save_model_form(form)
+
+        assert saved.pk is not None
+        assert Article.objects.filter(pk=saved.pk, title=f"New {uid}").exists()
+
+    def test_runs_save_signals(self):
+        """Test that models with save receivers still go through save()."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Signal Author {uid}", email=f"signal_{uid}@example.com")
+        article = Article.objects.create(title=f"Before {uid}", content="Body", author=author)
+        received = []
+
+        def receiver(sender, instance, **kwargs):
+            received.append(instance.pk)
+
+        pre_save.connect(receiver, sender=Article)
+        try:
+            save_model_form(self._bound_form(article, title=f"After {uid}"))
+        finally:
+            pre_save.disconnect(receiver, sender=Article)
+
+        assert received == [article.pk]
+
+    def test_keeps_values_derived_in_clean(self):
+        """Test that fields a form's clean() sets, but the client didn't change, are saved."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Clean Author {uid}", email=f"clean_{uid}@example.com")
+
+        class DerivedBioForm(modelform_factory(Author, fields="__all__")):
+            def clean(self):
+                cleaned_data = super().clean()
+                cleaned_data["bio"] = f"derived from {cleaned_data['name']}"
+                return cleaned_data
+
+        form = DerivedBioForm(data={**model_to_dict(author), "name": f"Renamed {uid}"}, instance=author)
+        assert form.is_valid(), form.errors
+
+        save_model_form(form)
+
+        author.refresh_from_db()
+        assert author.name == f"Renamed {uid}"
+        assert author.bio == f"derived from Renamed {uid}"
+
+    def test_keeps_values_normalized_in_clean_field(self):
+        """Test that a clean_<field>() normalizing an unchanged field is saved."""
+        uid = unique_id()
+        author = Author.objects.create(name=f"Field Author {uid}", email=f"Field_{uid}@Example.com")
+
+        class LowerEmailForm(modelform_factory(Author, fields="__all__")):
+            def clean_email(self):
+                return self.cleaned_data["email"].lower()
+
+        form = LowerEmailForm(data={**model_to_dict(author), "bio": "Changed"}, instance=author)
+        assert form.is_valid(), form.errors
+
+        save_model_form(form)
+
+        author.refresh_from_db()
+        assert author.bio == "Changed"
+        assert author.email == f"field_{uid}@example.com"
+
+
+class TestNormalizeFkFields:
+    """Tests for normalize_fk_fields function."""
+
+    def test_converts_fk_column_names(self):
+        """Test that FK column names are renamed to field names and other keys kept."""
+        assert normalize_fk_fields(Article, {"author_id": 1, "title": "T"}) == {"author": 1, "title": "T"}
+        assert normalize_fk_fields(Article, {"author": 2}) == {"author": 2}
+
+
+class TestGetAdminFormClass:
+    """Tests for get_admin_form_class function."""
+
+    def test_fallback_form_is_built_once(self):
+        """Test that the generated fallback form class is reused across calls."""
+        first = get_admin_form_class(Article, None, HttpRequest())
+        second = get_admin_form_class(Article, None, HttpRequest(), obj=None)
+
+        assert first is second
+        assert first._meta.model is Article
+
 
 @pytest.mark.django_db
+class TestMergeFormData:
+    """Tests for merge_form_data function."""
+
+    def test_reads_m2m_only_when_form_needs_it(self, django_assert_num_queries):
+        """Test that M2M values are skipped when the form lacks the field or the data replaces it."""
+        group = Group.objects.create(name=f"Merge {unique_id()}")
+        group.permissions.add(*Permission.objects.filter(codename="view_article"))
+        full_form = modelform_factory(Group, fields="__all__")
+
+        with django_assert_num_queries(0):
+            assert merge_form_data(group, modelform_factory(Group, fields=["name"]), {"name": "N"}) == {
+                "id": group.pk,
+                "name": "N",
+            }
+            assert merge_form_data(group, full_form, {"permissions": []})["permissions"] == []
+        with django_assert_num_queries(1):
+            assert len(merge_form_data(group, full_form, {})["permissions"]) == 1
+
+
 class TestGetModelName:
     """Tests for get_model_name function."""
 
@@ -11,6 +11,7 @@ from asgiref.sync import sync_to_async
 from django.contrib.admin.models import ADDITION, CHANGE, DELETION, LogEntry
 from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.contenttypes.models import ContentType
+from django.forms.models import model_to_dict, modelform_factory
 
 from django_admin_mcp.handlers import (
     create_mock_request,
@@ -20,6 +21,13 @@ from django_admin_mcp.handlers import (
     handle_list,
     handle_update,
 )
+from django_admin_mcp.handlers.base import invalidate_cached_objects, save_model_form
+from django_admin_mcp.handlers.crud import (
+    _construct_search_lookup,
+    _get_inline_fk_field,
+    _get_valid_ordering_fields,
+    _save_inline_forms,
+)
 from tests.models import Article, Author
 
 
@@ -28,9 +36,85 @@ def unique_id():
     return uuid.uuid4().hex[:8]
 
 
+class TestGetValidOrderingFields:
+    """Tests for _get_valid_ordering_fields helper."""
+
+    def test_includes_ascending_and_descending(self):
+        """Test that every field is allowed in both directions."""
+        valid = _get_valid_ordering_fields(Article)
+        assert "title" in valid
+        assert "-title" in valid
+        assert "author" in valid
+
+    def test_includes_reverse_relations(self):
+        """Test that reverse relation names are accepted like before."""
+        assert "-articles" in _get_valid_ordering_fields(Author)
+
+
+class TestConstructSearchLookup:
+    """Tests for _construct_search_lookup helper."""
+
+    def test_plain_field_uses_icontains(self):
+        """Test that unprefixed search fields keep the icontains lookup."""
+        assert _construct_search_lookup("name") == "name__icontains"
+
+    def test_admin_prefixes(self):
+        """Test that admin search prefixes map to Django's lookups."""
+        assert _construct_search_lookup("^name") == "name__istartswith"
+        assert _construct_search_lookup("=email") == "email__iexact"
+        assert _construct_search_lookup("@content") == "content__search"
+
+    def test_related_field(self):
+        """Test that related field paths are preserved."""
+        assert _construct_search_lookup("^author__name") == "author__name__istartswith"
+
+
+class TestGetInlineFkField:
+    """Tests for _get_inline_fk_field helper."""
+
+    def test_finds_fk_to_parent(self):
+        """Test that the FK pointing at the parent model is found."""
+        assert _get_inline_fk_field(Article, Author).name == "author"
+
+    def test_respects_fk_name(self):
+        """Test that a non-matching fk_name yields no field."""
+        assert _get_inline_fk_field(Article, Author, "title") is None
+
+    def test_unrelated_models(self):
+        """Test that models without a relation to the parent yield None."""
+        assert _get_inline_fk_field(Article, User) is None
+
+
 class TestHandleList:
     """Tests for handle_list function."""
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_list_selected_fields(self):
+        """Test that the fields argument limits each row to the requested fields."""
+        uid = unique_id()
+        await self._create_author(uid)
+        request = await self._create_superuser_request(uid)
+
+        result = await handle_list(
+            "author", {"filters": {"name": f"Test Author {uid}"}, "fields": ["name", "email"]}, request
+        )
+
+        data = json.loads(result[0].text)
+        assert data["results"] == [{"name": f"Test Author {uid}", "email": f"test_{uid}@example.com"}]
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_list_unknown_fields(self):
+        """Test that unknown field names are reported instead of ignored."""
+        uid = unique_id()
+        request = await self._create_superuser_request(uid)
+
+        result = await handle_list("author", {"fields": ["name", "nonexistent"]}, request)
+
+        data = json.loads(result[0].text)
+        assert data["error"] == "Unknown fields: nonexistent"
+
     @pytest.mark.asyncio
     @pytest.mark.django_db
     async def test_list_returns_results(self):
@@ -50,6 +134,25 @@ class TestHandleList:
         assert "count" in data
         assert "total_count" in data
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_list_pretty_matches_compact(self):
+        """Test that pretty and compact list responses carry the same data."""
+        uid = unique_id()
+        await self._create_author(uid)
+        request = await self._create_superuser_request(uid)
+        arguments = {"filters": {"name": f"Test Author {uid}"}}
+
+        compact = await handle_list("author", arguments, request)
+        pretty = await handle_list("author", {**arguments, "pretty": True}, request)
+
+        assert "\n" not in compact[0].text
+        assert "\n" in pretty[0].text
+        data = json.loads(compact[0].text)
+        assert data == json.loads(pretty[0].text)
+        assert data["count"] == 1
+        assert data["results"][0]["name"] == f"Test Author {uid}"
+
     @pytest.mark.asyncio
     @pytest.mark.django_db
     async def test_list_with_filters(self):
@@ -175,6 +278,44 @@ class TestHandleGet:
         assert data["name"] == f"Test Author {uid}"
         assert data["email"] == f"test_{uid}@example.com"
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_get_compact_by_default(self):
+        """Test that handle_get returns compact JSON unless pretty is requested."""
+        uid = unique_id()
+        author = await self._create_author(uid)
+        request = await self._create_superuser_request(uid)
+
+        compact = await handle_get("author", {"id": author.pk}, request)
+        pretty = await handle_get("author", {"id": author.pk, "pretty": True}, request)
+
+        assert "\n" not in compact[0].text
+        assert "\n" in pretty[0].text
+        assert json.loads(compact[0].text) == json.loads(pretty[0].text)
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_get_cache_serves_until_updated(self, settings):
+        """Test that cached objects are reused until an MCP update invalidates them."""
+        settings.MCP_GET_CACHE_TTL = 60
+        invalidate_cached_objects()
+        uid = unique_id()
+        author = await self._create_author(uid)
+        request = await self._create_superuser_request(uid)
+
+        try:
+            await handle_get("author", {"id": author.pk}, request)
+            # A write that bypasses MCP is not seen while the entry is fresh
+            await sync_to_async(Author.objects.filter(pk=author.pk).update)(name=f"Outside {uid}")
+            cached = json.loads((await handle_get("author", {"id": str(author.pk)}, request))[0].text)
+            await handle_update("author", {"id": author.pk, "data": {"name": f"Updated {uid}"}}, request)
+            fresh = json.loads((await handle_get("author", {"id": author.pk}, request))[0].text)
+        finally:
+            invalidate_cached_objects()
+
+        assert cached["name"] == f"Test Author {uid}"
+        assert fresh["name"] == f"Updated {uid}"
+
     @pytest.mark.asyncio
     @pytest.mark.django_db
     async def test_get_requires_id(self):
@@ -572,6 +713,42 @@ class TestHandleDelete:
         has_log = await check_log()
         assert has_log
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_delete_without_user_skips_fetch(self):
+        """Test that a delete with nothing to log removes the row without loading it first."""
+        uid = unique_id()
+        author = await self._create_author(uid)
+        author_pk = author.pk
+
+        with patch("django_admin_mcp.handlers.crud.select_for_update_self") as mock_select:
+            result = await handle_delete("author", {"id": author_pk}, create_mock_request())
+            missing = await handle_delete("author", {"id": author_pk}, create_mock_request())
+
+        assert json.loads(result[0].text)["success"] is True
+        assert "not found" in json.loads(missing[0].text)["error"]
+        mock_select.assert_not_called()
+        assert not await sync_to_async(Author.objects.filter(pk=author_pk).exists)()
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_delete_without_user_calls_overridden_model_delete(self):
+        """Test that a model overriding delete(), e.g. to soft-delete, is not deleted with a bare DELETE."""
+        uid = unique_id()
+        author = await self._create_author(uid)
+        author_pk = author.pk
+        deleted = []
+
+        def soft_delete(self, *args, **kwargs):
+            deleted.append(self.pk)
+
+        with patch.object(Author, "delete", soft_delete):
+            result = await handle_delete("author", {"id": author_pk}, create_mock_request())
+
+        assert json.loads(result[0].text)["success"] is True
+        assert deleted == [author_pk]
+        assert await sync_to_async(Author.objects.filter(pk=author_pk).exists)()
+
     async def _create_author(self, uid):
         """Helper to create an author."""
 
@@ -877,6 +1054,152 @@ class TestInlinePermissions:
         return await create_user()
 
 
+class TestSaveInlineForms:
+    """Tests for _save_inline_forms helper."""
+
+    def _bound_forms(self, form_class, articles, **changes):
+        forms = []
+        for article in articles:
+            form = form_class(data={**model_to_dict(article), **changes}, instance=article)
+            assert form.is_valid(), form.errors
+            forms.append(form)
+        return forms
+
+    def _create_articles(self, uid, count):
+        author = Author.objects.create(name=f"Inline Author {uid}", email=f"inline_save_{uid}@example.com")
+        return [
+            Article.objects.create(title=f"Before {uid} {index}", content="Body", author=author)
+            for index in range(count)
+        ]
+
+    @pytest.mark.django_db
+    def test_plain_updates_use_one_bulk_update(self, django_assert_num_queries):
+        """Test that forms changing only concrete fields are written with a single UPDATE."""
+        uid = unique_id()
+        articles = self._create_articles(uid, 3)
+        forms = self._bound_forms(modelform_factory(Article, fields="__all__"), articles, content="Changed")
+
+        with django_assert_num_queries(3) as captured:
+            errors = _save_inline_forms(Article, forms)
+
+        assert errors == [None, None, None]
+        updates = [query for query in captured.captured_queries if query["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert set(Article.objects.filter(pk__in=[a.pk for a in articles]).values_list("content", flat=True)) == {
+            "Changed"
+        }
+
+    @pytest.mark.django_db
+    def test_custom_form_save_is_called_per_form(self):
+        """Test that forms overriding save() are saved one by one so the hook runs."""
+        uid = unique_id()
+        articles = self._create_articles(uid, 2)
+        saved = []
+
+        class HookedArticleForm(modelform_factory(Article, fields="__all__")):
+            def save(self, commit=True):
+                saved.append(self.instance.pk)
+                return super().save(commit=commit)
+
+        errors = _save_inline_forms(Article, self._bound_forms(HookedArticleForm, articles, content="Hooked"))
+
+        assert errors == [None, None]
+        assert saved == [article.pk for article in articles]
+        assert not Article.objects.filter(pk__in=saved).exclude(content="Hooked").exists()
+
+    @pytest.mark.django_db
+    def test_keeps_values_derived_in_clean(self):
+        """Test that inline fields set in a form's clean() are saved along with the changes."""
+        uid = unique_id()
+        articles = self._create_articles(uid, 2)
+
+        class DerivedContentForm(modelform_factory(Article, fields="__all__")):
+            def clean(self):
+                cleaned_data = super().clean()
+                cleaned_data["content"] = f"About {cleaned_data['title']}"
+                return cleaned_data
+
+        forms = [
+            DerivedContentForm(data={**model_to_dict(article), "title": f"Renamed {uid} {index}"}, instance=article)
+            for index, article in enumerate(articles)
+        ]
+        assert all(form.is_valid() for form in forms)
+
+        errors = _save_inline_forms(Article, forms)
+
+        assert errors == [None, None]
+        for index, article in enumerate(articles):
+            article.refresh_from_db()
+            assert article.content == f"About Renamed {uid} {index}"
+
+    @pytest.mark.django_db
+    def test_failing_form_only_reports_its_own_error(self):
+        """Test that a form whose save() fails doesn't mark the other forms as failed."""
+        uid = unique_id()
+        articles = self._create_articles(uid, 3)
+        failing_pk = articles[1].pk
+
+        class FlakyArticleForm(modelform_factory(Article, fields="__all__")):
+            def save(self, commit=True):
+                if self.instance.pk == failing_pk:
+                    raise ValueError("save failed")
+                return super().save(commit=commit)
+
+        errors = _save_inline_forms(Article, self._bound_forms(FlakyArticleForm, articles, content="Flaky"))
+
+        assert errors[0] is None
+        assert isinstance(errors[1], ValueError)
+        assert errors[2] is None
+        assert Article.objects.get(pk=articles[0].pk).content == "Flaky"
+        assert Article.objects.get(pk=failing_pk).content == "Body"
+        assert Article.objects.get(pk=articles[2].pk).content == "Flaky"
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_update_reports_missing_inline_as_not_found(self):
+        """Test that an unknown inline id is reported while the other inline updates are saved."""
+        uid = unique_id()
+
+        @sync_to_async
+        def setup():
+            article = self._create_articles(uid, 1)[0]
+            user = User.objects.create_superuser(
+                username=f"admin_inline_save_{uid}",
+                email=f"admin_inline_save_{uid}@example.com",
+                password="admin",
+            )
+            return article, create_mock_request(user)
+
+        article, request = await setup()
+        missing_id = article.pk + 100000
+
+        result = await handle_update(
+            "author",
+            {
+                "id": article.author_id,
+                "data": {},
+                "inlines": {
+                    "article": [
+                        {"id": article.pk, "data": {"title": f"Updated {uid}"}},
+                        {"id": missing_id, "data": {"title": f"Ghost {uid}"}},
+                    ]
+                },
+            },
+            request,
+        )
+
+        data = json.loads(result[0].text)
+        assert data["success"] is True
+        assert data["inlines"]["updated"] == [{"model": "article", "id": article.pk}]
+        assert data["inlines"]["errors"] == [{"model": "article", "id": missing_id, "error": "article not found"}]
+
+        @sync_to_async
+        def get_title():
+            return Article.objects.get(pk=article.pk).title
+
+        assert await get_title() == f"Updated {uid}"
+
+
 class TestSaveModelIntegration:
     """Tests that CRUD handlers call ModelAdmin.save_model() and delete_model()."""
 
@@ -936,6 +1259,24 @@ class TestSaveModelIntegration:
             else:
                 assert mock_save.call_args[0][-1] is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_update_with_default_save_model_writes_changed_columns(self):
+        """Test that handle_update skips the default save_model() for a column-only update."""
+        uid = unique_id()
+        author = await self._create_author(uid)
+        request = await self._create_superuser_request(uid)
+
+        with patch("django_admin_mcp.handlers.crud.save_model_form", wraps=save_model_form) as mock_save:
+            result = await handle_update("author", {"id": author.pk, "data": {"bio": f"Bio {uid}"}}, request)
+
+        data = json.loads(result[0].text)
+        assert data["success"] is True
+        assert data["object"]["bio"] == f"Bio {uid}"
+        mock_save.assert_called_once()
+        refreshed = await sync_to_async(Author.objects.get)(pk=author.pk)
+        assert refreshed.bio == f"Bio {uid}"
+
     @pytest.mark.asyncio
     @pytest.mark.django_db
     async def test_delete_calls_delete_model(self):
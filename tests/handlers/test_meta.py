@@ -7,6 +7,7 @@ Tests metadata operation handlers:
 """
 
 import json
+from unittest.mock import patch
 
 import pytest
 from asgiref.sync import sync_to_async
@@ -18,6 +19,8 @@ from django_admin_mcp.handlers import (
     handle_find_models,
 )
 from django_admin_mcp.handlers.meta import (
+    _find_matching_records,
+    _get_admin_config,
     _get_field_metadata,
     _model_matches_query,
 )
@@ -31,21 +34,25 @@ class TestModelMatchesQuery:
 
     def test_empty_query_matches_everything(self):
         """Test that empty query matches any model."""
-        assert _model_matches_query("", "author", "Author") is True
-        assert _model_matches_query("", "article", "Article") is True
+        assert _model_matches_query("", "author\x00author") is True
+        assert _model_matches_query("", "article\x00article") is True
 
     def test_matches_model_name(self):
         """Test matching against model name."""
-        assert _model_matches_query("auth", "author", "Author") is True
-        assert _model_matches_query("AUTHOR", "author", "Author") is True
+        assert _model_matches_query("auth", "author\x00author") is True
+        assert _model_matches_query("AUTHOR", "author\x00author") is True
 
     def test_matches_verbose_name(self):
         """Test matching against verbose name."""
-        assert _model_matches_query("Auth", "author", "Author") is True
+        assert _model_matches_query("Blog", "article\x00blog post") is True
 
     def test_no_match(self):
         """Test query that doesn't match."""
-        assert _model_matches_query("xyz", "author", "Author") is False
+        assert _model_matches_query("xyz", "author\x00author") is False
+
+    def test_query_does_not_span_names(self):
+        """Test that a query can't match across the name separator."""
+        assert _model_matches_query("r\x00a", "author\x00author") is False
 
 
 class TestGetFieldMetadata:
@@ -105,6 +112,41 @@ class TestGetFieldMetadata:
         meta = _get_field_metadata(field)
         assert meta.get("default") is False
 
+    def test_returns_independent_copies(self):
+        """Test that mutating returned metadata doesn't affect later calls."""
+        field = Author._meta.get_field("name")
+        meta = _get_field_metadata(field)
+        meta["name"] = "mutated"
+        assert _get_field_metadata(field)["name"] == "name"
+
+
+class TestGetAdminConfig:
+    """Tests for _get_admin_config helper function."""
+
+    def test_reads_admin_options(self):
+        """Test that admin options are collected into the config."""
+
+        class FakeAdmin:
+            list_display = ("name", "email")
+            search_fields = ("name",)
+            date_hierarchy = "created_at"
+
+        config = _get_admin_config(FakeAdmin())
+        assert config["list_display"] == ["name", "email"]
+        assert config["search_fields"] == ["name"]
+        assert config["ordering"] == []
+        assert config["date_hierarchy"] == "created_at"
+
+    def test_returns_independent_copies(self):
+        """Test that mutating a returned config doesn't affect later calls."""
+
+        class FakeAdmin:
+            list_display = ("name",)
+
+        admin = FakeAdmin()
+        _get_admin_config(admin)["list_display"] = ["mutated"]
+        assert _get_admin_config(admin)["list_display"] == ["name"]
+
 
 @pytest.mark.django_db
 @pytest.mark.asyncio
@@ -219,6 +261,22 @@ class TestHandleFindModels:
         assert "tools_exposed" in author_info
         assert author_info["tools_exposed"] is True
 
+    async def test_empty_query_reuses_serialized_response(self):
+        """Test that repeated empty-query calls share one serialized response."""
+        request = create_mock_request()
+        first = await handle_find_models("", {}, request)
+        second = await handle_find_models("", {}, request)
+
+        assert second[0] is first[0]
+
+    async def test_query_reuses_serialized_response(self):
+        """Test that queries listing the same models share one serialized response."""
+        request = create_mock_request()
+        first = await handle_find_models("", {"query": "author"}, request)
+        second = await handle_find_models("", {"query": "AUTHOR"}, request)
+
+        assert second[0] is first[0]
+
     async def test_filters_by_query(self):
         """Test filtering models by query string."""
         request = create_mock_request()
@@ -231,6 +289,24 @@ class TestHandleFindModels:
         assert "article" not in model_names
 
 
+class TestFindMatchingRecords:
+    """Tests for _find_matching_records helper function."""
+
+    def test_index_matches_full_scan(self):
+        """Test that the bigram index returns the same records as a full scan."""
+        for query in ("auth", "ARTI", "a", "thor", "zz", "r\x00a"):
+            scanned = _find_matching_records(query)
+            with patch("django_admin_mcp.handlers.meta._BIGRAM_INDEX_THRESHOLD", 0):
+                indexed = _find_matching_records(query)
+            assert [r.info["model_name"] for r in indexed] == [r.info["model_name"] for r in scanned]
+
+    def test_empty_query_returns_all_records(self):
+        """Test that an empty query returns every record."""
+        names = [r.info["model_name"] for r in _find_matching_records("")]
+        assert "author" in names
+        assert "article" in names
+
+
 # Unique counter for test isolation
 _counter = 0
 
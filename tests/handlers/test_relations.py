@@ -17,6 +17,7 @@ from django_admin_mcp.handlers import (
     handle_related,
 )
 from django_admin_mcp.handlers.base import create_mock_request
+from django_admin_mcp.handlers.relations import _get_forward_single_relations, _get_reverse_accessors
 from tests.models import Article, Author
 
 
@@ -62,6 +63,34 @@ def get_content_type(model):
     return ContentType.objects.get_for_model(model)
 
 
+class TestGetForwardSingleRelations:
+    """Tests for _get_forward_single_relations helper."""
+
+    def test_includes_forward_foreign_key(self):
+        """Test that forward ForeignKey fields are included."""
+        assert "author" in _get_forward_single_relations(Article)
+
+    def test_excludes_reverse_and_plain_fields(self):
+        """Test that reverse relations and non-relation fields are excluded."""
+        relations = _get_forward_single_relations(Author)
+        assert "articles" not in relations
+        assert "name" not in relations
+
+
+class TestGetReverseAccessors:
+    """Tests for _get_reverse_accessors helper."""
+
+    def test_includes_reverse_foreign_key(self):
+        """Test that reverse FK accessor names are included."""
+        assert "articles" in _get_reverse_accessors(Author)
+
+    def test_excludes_forward_fields(self):
+        """Test that forward fields are not reported as reverse accessors."""
+        accessors = _get_reverse_accessors(Article)
+        assert "author" not in accessors
+        assert "title" not in accessors
+
+
 class TestHandleRelated:
     """Tests for handle_related function."""
 
@@ -221,6 +250,41 @@ class TestHandleRelated:
         assert data["count"] == 2
         assert data["total_count"] == 5
 
+    @pytest.mark.django_db
+    @pytest.mark.asyncio
+    async def test_many_relation_with_offset_counts_total(self):
+        """Test that total_count covers all rows when paging past the first page."""
+        uid = unique_id()
+        author = await create_author(f"Test Author {uid}", f"test_{uid}@example.com")
+        for i in range(3):
+            await create_article(f"Article {i} {uid}", f"Content {i}", author)
+        request = create_mock_request()
+        result = await handle_related(
+            "author",
+            {"id": author.pk, "relation": "articles", "limit": 2, "offset": 2},
+            request,
+        )
+        data = json.loads(result[0].text)
+        assert data["count"] == 1
+        assert data["total_count"] == 3
+
+    @pytest.mark.django_db
+    @pytest.mark.asyncio
+    async def test_many_relation_without_total(self):
+        """Test that include_total=False omits total_count."""
+        uid = unique_id()
+        author = await create_author(f"Test Author {uid}", f"test_{uid}@example.com")
+        await create_article(f"Article {uid}", "Content", author)
+        request = create_mock_request()
+        result = await handle_related(
+            "author",
+            {"id": author.pk, "relation": "articles", "include_total": False},
+            request,
+        )
+        data = json.loads(result[0].text)
+        assert data["count"] == 1
+        assert "total_count" not in data
+
     @pytest.mark.django_db
     @pytest.mark.asyncio
     async def test_single_relation_fk(self):
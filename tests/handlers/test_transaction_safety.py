@@ -13,15 +13,18 @@ import pytest
 from asgiref.sync import sync_to_async
 from django.contrib.admin.models import LogEntry
 from django.contrib.auth.models import User
+from django.db import connection
 
 from django_admin_mcp.handlers import (
     create_mock_request,
+    crud,
     handle_bulk,
     handle_create,
     handle_delete,
     handle_update,
 )
-from tests.models import Author
+from django_admin_mcp.handlers.base import select_for_update_self
+from tests.models import Article, Author
 
 
 def unique_id():
@@ -61,6 +64,22 @@ def get_author_count():
     return Author.objects.count()
 
 
+@sync_to_async
+def get_atomic_depth():
+    """Get the number of atomic blocks open on the handlers' connection."""
+    return len(connection.atomic_blocks)
+
+
+def record_atomic_depth(calls):
+    """Build a select_for_update_self stand-in recording the atomic depth it runs at."""
+
+    def lock(queryset):
+        calls.append(len(connection.atomic_blocks))
+        return select_for_update_self(queryset)
+
+    return lock
+
+
 class TestCreateTransactionSafety:
     """Tests for transaction safety in create operations."""
 
@@ -146,6 +165,71 @@ class TestUpdateTransactionSafety:
         final_log_count = await get_log_count()
         assert final_log_count == initial_log_count
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_update_rollback_on_inline_failure(self):
+        """Test that a failure after the parent and inline saves rolls both back."""
+        uid = unique_id()
+        author = await create_author(uid)
+        user = await create_superuser(uid)
+        request = create_mock_request(user=user)
+
+        @sync_to_async
+        def create_article():
+            return Article.objects.create(title=f"Original {uid}", content="Body", author=author)
+
+        article = await create_article()
+        original_name = author.name
+        initial_log_count = await get_log_count()
+        update_inlines = crud._update_inlines
+
+        def failing_update_inlines(*args, **kwargs):
+            # Write the inline rows, then fail before the change is logged
+            update_inlines(*args, **kwargs)
+            raise Exception("Inline failure")
+
+        with patch("django_admin_mcp.handlers.crud._update_inlines", side_effect=failing_update_inlines):
+            result = await handle_update(
+                "author",
+                {
+                    "id": author.id,
+                    "data": {"name": "Updated Name"},
+                    "inlines": {"article": [{"id": article.pk, "data": {"title": f"Updated {uid}"}}]},
+                },
+                request,
+            )
+
+            data = json.loads(result[0].text)
+            assert "error" in data
+
+        # Verify neither the parent nor the inline write survived
+        @sync_to_async
+        def reload():
+            author.refresh_from_db()
+            article.refresh_from_db()
+            return author.name, article.title
+
+        assert await reload() == (original_name, f"Original {uid}")
+        assert await get_log_count() == initial_log_count
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_update_locks_row_inside_transaction(self):
+        """Test that the row is fetched for update inside the update's transaction."""
+        uid = unique_id()
+        author = await create_author(uid)
+        user = await create_superuser(uid)
+        request = create_mock_request(user=user)
+        outer_depth = await get_atomic_depth()
+        calls = []
+
+        with patch("django_admin_mcp.handlers.crud.select_for_update_self", side_effect=record_atomic_depth(calls)):
+            result = await handle_update("author", {"id": author.id, "data": {"name": "Locked"}}, request)
+
+        assert json.loads(result[0].text)["success"] is True
+        # The handler opened its own atomic block around the locking fetch
+        assert calls == [outer_depth + 1]
+
 
 class TestDeleteTransactionSafety:
     """Tests for transaction safety in delete operations."""
@@ -190,6 +274,24 @@ class TestDeleteTransactionSafety:
         final_log_count = await get_log_count()
         assert final_log_count == initial_log_count
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_delete_locks_row_inside_transaction(self):
+        """Test that the row is fetched for update inside the delete's transaction."""
+        uid = unique_id()
+        author = await create_author(uid)
+        user = await create_superuser(uid)
+        request = create_mock_request(user=user)
+        outer_depth = await get_atomic_depth()
+        calls = []
+
+        with patch("django_admin_mcp.handlers.crud.select_for_update_self", side_effect=record_atomic_depth(calls)):
+            result = await handle_delete("author", {"id": author.id}, request)
+
+        assert json.loads(result[0].text)["success"] is True
+        # The handler opened its own atomic block around the locking fetch
+        assert calls == [outer_depth + 1]
+
 
 class TestBulkCreateTransactionSafety:
     """Tests for transaction safety in bulk create operations."""
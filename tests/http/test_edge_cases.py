@@ -9,8 +9,9 @@ import django
 import pytest
 from asgiref.sync import sync_to_async
 from django.db import DEFAULT_DB_ALIAS
-from django.test import AsyncClient
+from django.test import AsyncClient, RequestFactory
 
+from django_admin_mcp.protocol.types import TextContent, ToolsCallResponse, ToolsCallResult
 from django_admin_mcp.views import MCPHTTPView, mcp_endpoint
 from tests.factories import MCPTokenFactory
 
@@ -156,6 +157,118 @@ class TestFunctionBasedViewEdgeCases:
         assert "content" in data["result"]
 
 
+@pytest.mark.django_db(transaction=True)
+class TestToolResultValidation:
+    """Test suite for the opt-in MCP_VALIDATE_TOOL_RESULTS check."""
+
+    async def _call_with_result(self, text):
+        token = await sync_to_async(MCPTokenFactory)()
+        with patch("django_admin_mcp.views.call_tool", new_callable=AsyncMock) as mock_handle:
+            mock_handle.return_value = [TextContent(type="text", text=text)]
+            return await AsyncClient().post(
+                "/api/",
+                data=json.dumps({"method": "tools/call", "params": {"name": "test_tool", "arguments": {}}}),
+                content_type="application/json",
+                headers={"Authorization": f"Bearer {token.plaintext_token}"},
+            )
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    async def test_result_passed_through_by_default(self):
+        """Test that tool results are sent without being parsed again."""
+        with patch("django_admin_mcp.views.dict_adapter") as mock_adapter:
+            response = await self._call_with_result('{"ok": true}')
+
+        assert response.status_code == 200
+        assert json.loads(response.content)["result"]["content"][0]["text"] == '{"ok": true}'
+        mock_adapter.validate_json.assert_not_called()
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    async def test_invalid_result_rejected_when_validation_enabled(self, settings):
+        """Test that MCP_VALIDATE_TOOL_RESULTS rejects results that are not JSON objects."""
+        settings.MCP_VALIDATE_TOOL_RESULTS = True
+
+        response = await self._call_with_result("not json")
+
+        assert response.status_code == 500
+        assert "Invalid JSON" in json.loads(response.content)["error"]["message"]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestToolCallEnvelope:
+    """Test suite for the tools/call response envelope."""
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_id", [None, 3, "call-1"])
+    async def test_envelope_matches_model_encoding(self, request_id):
+        """Test that the formatted response matches ToolsCallResponse.model_dump_json()."""
+        text = '{"name": "Zoë \\"Z\\"", "bio": "line\\nbreak"}'
+        token = await sync_to_async(MCPTokenFactory)()
+        with patch("django_admin_mcp.views.call_tool", new_callable=AsyncMock) as mock_handle:
+            mock_handle.return_value = [TextContent(type="text", text=text)]
+            response = await AsyncClient().post(
+                "/api/",
+                data=json.dumps(
+                    {"method": "tools/call", "id": request_id, "params": {"name": "test_tool", "arguments": {}}}
+                ),
+                content_type="application/json",
+                headers={"Authorization": f"Bearer {token.plaintext_token}"},
+            )
+
+        expected = ToolsCallResponse(
+            id=request_id, result=ToolsCallResult(content=[TextContent(text=text)])
+        ).model_dump_json()
+        assert response.status_code == 200
+        assert response.content.decode() == expected
+
+
+@pytest.mark.django_db(transaction=True)
+class TestClassBasedViewBody:
+    """Test suite for request body parsing in MCPHTTPView."""
+
+    async def _post(self, body):
+        token = await sync_to_async(MCPTokenFactory)()
+        request = RequestFactory().post(
+            "/api/",
+            data=body,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}",
+        )
+        return await MCPHTTPView.as_view()(request)
+
+    @pytest.mark.asyncio
+    async def test_tools_call_reads_top_level_fields(self):
+        """Test that tools/call takes name and arguments from the decoded body."""
+        with patch("django_admin_mcp.views.call_tool", new_callable=AsyncMock) as mock_handle:
+            mock_handle.return_value = [TextContent(type="text", text='{"ok": true}')]
+            body = json.dumps({"method": "tools/call", "name": "test_tool", "arguments": {"a": 1}})
+            response = await self._post(body)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"ok": True}
+        assert mock_handle.call_args.args[:2] == ("test_tool", {"a": 1})
+
+    @pytest.mark.asyncio
+    async def test_tools_list_returns_json(self):
+        """Test that tools/list returns the tool definitions as JSON."""
+        response = await self._post(json.dumps({"method": "tools/list"}))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        names = [tool["name"] for tool in json.loads(response.content)["tools"]]
+        assert "find_models" in names
+
+    @pytest.mark.asyncio
+    async def test_non_object_body_rejected(self):
+        """Test that a JSON body that is not an object is rejected."""
+        response = await self._post(json.dumps(["tools/list"]))
+
+        assert response.status_code == 400
+        assert json.loads(response.content)["error"] == "Invalid JSON in request body"
+
+
 class TestAtomicRequestsCompatibility:
     """Test that MCP views are marked as non-atomic for ATOMIC_REQUESTS compatibility."""
 
@@ -3,12 +3,25 @@ Tests for HTTP interface endpoints
 """
 
 import json
+from unittest.mock import patch
 
 import django
 import pytest
 from asgiref.sync import sync_to_async
 from django.test import AsyncClient, Client
 
+from django_admin_mcp import views
+from django_admin_mcp.mixin import MCPAdminMixin
+from django_admin_mcp.protocol import (
+    InitializeResponse,
+    InitializeResult,
+    NotificationsInitializedResponse,
+    ServerCapabilities,
+    ServerInfo,
+    ToolsListResponse,
+    ToolsListResult,
+)
+from django_admin_mcp.tools import get_tools
 from tests.factories import MCPTokenFactory
 
 # AsyncClient headers= parameter requires Django 4.2+
@@ -78,6 +91,7 @@ class TestHTTPInterface:
         )
 
         assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
         data = json.loads(response.content)
         assert "result" in data
         assert "tools" in data["result"]
@@ -130,3 +144,86 @@ class TestHTTPInterface:
         # Reload token and check last_used_at is set
         await sync_to_async(token.refresh_from_db)()
         assert token.last_used_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+class TestToolsListCache:
+    """Test suite for the cached tools/list payload."""
+
+    async def _list_tools(self, request_id):
+        token = await sync_to_async(MCPTokenFactory)()
+        return await AsyncClient().post(
+            "/api/",
+            data=json.dumps({"method": "tools/list", "id": request_id}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {token.plaintext_token}"},
+        )
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_id", [None, 7, "req-é"])
+    async def test_response_matches_model_encoding(self, request_id):
+        """Test that the formatted envelope matches ToolsListResponse.model_dump_json()."""
+        response = await self._list_tools(request_id)
+
+        expected = ToolsListResponse(id=request_id, result=ToolsListResult(tools=get_tools())).model_dump_json()
+        assert response.status_code == 200
+        assert response.content.decode() == expected
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    async def test_tools_built_once_per_registry_version(self):
+        """Test that repeated tools/list calls reuse the encoded payload."""
+        views._TOOLS_LIST_CACHE.clear()
+        with patch("django_admin_mcp.views.get_tools", wraps=get_tools) as mock_get_tools:
+            await self._list_tools(1)
+            await self._list_tools(2)
+            assert mock_get_tools.call_count == 1
+
+            MCPAdminMixin._registry_version += 1
+            try:
+                await self._list_tools(3)
+            finally:
+                MCPAdminMixin._registry_version -= 1
+            assert mock_get_tools.call_count == 2
+
+
+@pytest.mark.django_db(transaction=True)
+class TestInitialize:
+    """Test suite for the initialize handshake."""
+
+    async def _post(self, payload):
+        token = await sync_to_async(MCPTokenFactory)()
+        return await AsyncClient().post(
+            "/api/",
+            data=json.dumps(payload),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {token.plaintext_token}"},
+        )
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_id", [None, 1, "init"])
+    async def test_initialize_matches_model_encoding(self, request_id):
+        """Test that the cached initialize result is sent in an InitializeResponse envelope."""
+        response = await self._post({"method": "initialize", "id": request_id})
+
+        expected = InitializeResponse(
+            id=request_id,
+            result=InitializeResult(
+                protocolVersion="2025-11-25",
+                serverInfo=ServerInfo(name="django-admin-mcp", version="0.2.1"),
+                capabilities=ServerCapabilities(),
+            ),
+        ).model_dump_json()
+        assert response.status_code == 200
+        assert response.content.decode() == expected
+
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    async def test_notifications_initialized_matches_model_encoding(self):
+        """Test that notifications/initialized is acknowledged with an empty result."""
+        response = await self._post({"method": "notifications/initialized", "id": 2})
+
+        assert response.status_code == 200
+        assert response.content.decode() == NotificationsInitializedResponse(id=2).model_dump_json()
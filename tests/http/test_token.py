@@ -4,14 +4,17 @@ Tests for MCPToken model and mcp_expose behavior
 
 import json
 from datetime import timedelta
+from unittest.mock import AsyncMock, patch
 
 import django
 import pytest
 from asgiref.sync import sync_to_async
 from django.contrib import admin
-from django.test import AsyncClient
+from django.test import AsyncClient, RequestFactory
 from django.utils import timezone
 
+from django_admin_mcp.models import MCPToken
+from django_admin_mcp.views import _TOKEN_CACHE, authenticate_token
 from tests.factories import MCPTokenFactory
 from tests.models import Author
 
@@ -56,6 +59,20 @@ class TestMCPToken:
         time_diff = abs((token.expires_at - expected_expiry).total_seconds())
         assert time_diff < 60  # Allow 1 minute tolerance
 
+    def test_token_default_expiry_setting(self, settings):
+        """Test that MCP_TOKEN_DEFAULT_EXPIRY_DAYS sets the default expiry period."""
+        settings.MCP_TOKEN_DEFAULT_EXPIRY_DAYS = 7
+        token = MCPTokenFactory()
+
+        expected_expiry = timezone.now() + timedelta(days=7)
+        assert abs((token.expires_at - expected_expiry).total_seconds()) < 60
+
+    def test_token_default_expiry_disabled(self, settings):
+        """Test that MCP_TOKEN_DEFAULT_EXPIRY_DAYS = None creates tokens that never expire."""
+        settings.MCP_TOKEN_DEFAULT_EXPIRY_DAYS = None
+
+        assert MCPTokenFactory().expires_at is None
+
     def test_token_indefinite_expiry(self):
         """Test creating token with no expiry."""
         token = MCPTokenFactory(expires_at=None)
@@ -63,6 +80,12 @@ class TestMCPToken:
         assert not token.is_expired()
         assert token.is_valid()
 
+    def test_indefinite_expiry_survives_reload(self):
+        """Test that a stored empty expiry isn't replaced by the default when loaded."""
+        token = MCPTokenFactory(expires_at=None)
+
+        assert MCPToken.objects.get(pk=token.pk).expires_at is None
+
     def test_token_custom_expiry(self):
         """Test creating token with custom expiry."""
         custom_expiry = timezone.now() + timedelta(days=30)
@@ -70,6 +93,15 @@ class TestMCPToken:
         assert token.expires_at == custom_expiry
         assert not token.is_expired()
 
+    def test_token_validity_at_given_time(self):
+        """Test that is_expired() and is_valid() check against a passed-in time."""
+        now = timezone.now()
+        token = MCPTokenFactory(expires_at=now + timedelta(days=1))
+
+        assert token.is_valid(now)
+        assert token.is_expired(now + timedelta(days=2))
+        assert not token.is_valid(now + timedelta(days=2))
+
     def test_token_expired(self):
         """Test that expired tokens are detected."""
         past_date = timezone.now() - timedelta(days=1)
@@ -77,6 +109,17 @@ class TestMCPToken:
         assert token.is_expired()
         assert not token.is_valid()
 
+    def test_mark_used_skips_save(self):
+        """Test that mark_used writes last_used_at without going through save()."""
+        token = MCPTokenFactory()
+
+        with patch.object(type(token), "save") as mock_save:
+            token.mark_used()
+
+        mock_save.assert_not_called()
+        token.refresh_from_db()
+        assert token.last_used_at is not None
+
     @skip_if_django_lt_42
     @pytest.mark.asyncio
     async def test_expired_token_rejected(self):
@@ -97,6 +140,87 @@ class TestMCPToken:
         assert "error" in data
 
 
+@pytest.mark.django_db(transaction=True)
+class TestLastUsedThrottle:
+    """Test suite for throttled last_used_at updates."""
+
+    @pytest.mark.asyncio
+    async def test_recent_use_is_not_rewritten(self):
+        """Test that last_used_at is written on first use and not again within the interval."""
+        token = await sync_to_async(MCPTokenFactory)()
+        request = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}")
+
+        with patch.object(MCPToken, "mark_used", autospec=True, side_effect=MCPToken.mark_used) as mock_mark_used:
+            await authenticate_token(request)
+            await authenticate_token(request)
+
+        assert mock_mark_used.call_count == 1
+        await sync_to_async(token.refresh_from_db)()
+        assert token.last_used_at is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_use_is_rewritten(self):
+        """Test that last_used_at is refreshed once the interval has passed."""
+        stale = timezone.now() - timedelta(hours=1)
+        token = await sync_to_async(MCPTokenFactory)(last_used_at=stale)
+        request = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}")
+
+        await authenticate_token(request)
+
+        await sync_to_async(token.refresh_from_db)()
+        assert token.last_used_at > stale
+
+
+@pytest.mark.django_db(transaction=True)
+class TestTokenCache:
+    """Test suite for the opt-in MCP_TOKEN_CACHE_TTL token cache."""
+
+    @pytest.fixture(autouse=True)
+    def token_cache(self, settings):
+        settings.MCP_TOKEN_CACHE_TTL = 60
+        _TOKEN_CACHE.clear()
+        yield
+        _TOKEN_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_cached_token_skips_lookup(self):
+        """Test that a cached token is reused without a lookup but its secret is still checked."""
+        token = await sync_to_async(MCPTokenFactory)()
+        request = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}")
+        wrong = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer mcp_{token.token_key}.wrong")
+        assert (await authenticate_token(request)).pk == token.pk
+
+        with patch.object(MCPToken, "get_by_key") as mock_get_by_key:
+            assert (await authenticate_token(request)).pk == token.pk
+            assert await authenticate_token(wrong) is None
+
+        mock_get_by_key.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_token_skips_worker_thread(self):
+        """Test that a cached token with a recent last_used_at is authenticated on the event loop."""
+        token = await sync_to_async(MCPTokenFactory)()
+        request = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}")
+        assert await authenticate_token(request) is not None
+
+        with patch("django_admin_mcp.views._authenticate_token", new_callable=AsyncMock) as mock_authenticate:
+            assert (await authenticate_token(request)).pk == token.pk
+
+        mock_authenticate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_saving_token_drops_cache_entry(self):
+        """Test that deactivating a token takes effect immediately."""
+        token = await sync_to_async(MCPTokenFactory)()
+        request = RequestFactory().post("/api/", HTTP_AUTHORIZATION=f"Bearer {token.plaintext_token}")
+        assert await authenticate_token(request) is not None
+
+        token.is_active = False
+        await sync_to_async(token.save)()
+
+        assert await authenticate_token(request) is None
+
+
 @pytest.mark.django_db(transaction=True)
 class TestMCPExpose:
     """Test suite for mcp_expose opt-in behavior."""
@@ -64,6 +64,25 @@ class TestPydanticValidation:
         assert isinstance(data["details"], list)
         assert len(data["details"]) > 0
 
+    @skip_if_django_lt_42
+    @pytest.mark.asyncio
+    async def test_tools_call_non_object_arguments(self):
+        """Test that tools/call with arguments that aren't an object is rejected with details."""
+        token = await sync_to_async(MCPTokenFactory)()
+
+        client = AsyncClient()
+        response = await client.post(
+            "/api/",
+            data=json.dumps({"method": "tools/call", "params": {"name": "find_models", "arguments": ["query"]}}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {token.plaintext_token}"},
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.content)
+        assert data["error"] == "Invalid request"
+        assert data["details"]
+
     @skip_if_django_lt_42
     @pytest.mark.asyncio
     async def test_tools_call_with_valid_arguments(self):
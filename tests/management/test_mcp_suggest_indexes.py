@@ -0,0 +1,71 @@
+"""
+Tests for the mcp_suggest_indexes management command.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from django_admin_mcp.management.commands.mcp_suggest_indexes import suggest_indexes
+from tests.models import Article, Author
+
+
+class TestSuggestIndexes:
+    """Tests for suggest_indexes helper."""
+
+    def test_suggests_admin_ordering(self):
+        """Test that the admin ordering becomes one composite index."""
+
+        class OrderedAdmin:
+            ordering = ["-published_date", "title"]
+
+        assert suggest_indexes(Article, OrderedAdmin()) == [["-published_date", "title"]]
+
+    def test_skips_indexed_fields(self):
+        """Test that unique fields and ForeignKeys are treated as indexed."""
+
+        class IndexedAdmin:
+            ordering = ["email"]
+            list_filter = ["author"]
+
+        assert suggest_indexes(Author, IndexedAdmin()) == []
+        assert suggest_indexes(Article, IndexedAdmin()) == []
+
+    def test_list_filter_fields(self):
+        """Test that list_filter fields get single-column suggestions once."""
+
+        class FilteredAdmin:
+            ordering = ["is_published"]
+            list_filter = ["is_published", ("published_date", object), "author__name"]
+
+        assert suggest_indexes(Article, FilteredAdmin()) == [["is_published"], ["published_date"]]
+
+    def test_ignores_unsupported_ordering(self):
+        """Test that ordering stops at expressions, random order and related lookups."""
+
+        class LookupAdmin:
+            ordering = ["title", "author__name", "content"]
+
+        assert suggest_indexes(Article, LookupAdmin()) == [["title"]]
+
+
+@pytest.mark.django_db
+class TestMcpSuggestIndexesCommand:
+    """Tests for the mcp_suggest_indexes command output."""
+
+    def test_prints_index_snippets(self):
+        """Test that registered models get models.Index snippets."""
+        out = StringIO()
+
+        call_command("mcp_suggest_indexes", "article", stdout=out)
+
+        output = out.getvalue()
+        assert "# tests.Article: add to Meta.indexes" in output
+        assert "models.Index(fields=['-published_date', 'title'])," in output
+        assert "AddIndexConcurrently" in output
+
+    def test_unknown_model(self):
+        """Test that unregistered model names are rejected."""
+        with pytest.raises(CommandError):
+            call_command("mcp_suggest_indexes", "nonexistent", stdout=StringIO())
@@ -3,8 +3,9 @@ Tests for MCPAdminMixin functionality
 """
 
 import pytest
+from django.apps import apps
 
-from django_admin_mcp import MCPAdminMixin
+from django_admin_mcp import MCPAdminMixin, get_registered_models
 from tests.models import Article
 
 
@@ -18,6 +19,25 @@ class TestMCPAdminMixin:
         assert "article" in registered, "Article model should be registered"
         assert "author" in registered, "Author model should be registered"
 
+    def test_get_registered_models_is_read_only_view(self):
+        """Test that get_registered_models() exposes the registry without copying it."""
+        registered = get_registered_models()
+
+        assert registered["article"]["model"] is Article
+        assert dict(registered) == MCPAdminMixin._registered_models
+        with pytest.raises(TypeError):
+            registered["article"] = {}  # type: ignore[index]
+
+    def test_app_ready_is_idempotent(self):
+        """Test that re-running AppConfig.ready() keeps existing registrations."""
+        registered = dict(MCPAdminMixin._registered_models)
+        version = MCPAdminMixin._registry_version
+
+        apps.get_app_config("django_admin_mcp").ready()
+
+        assert MCPAdminMixin._registered_models == registered
+        assert MCPAdminMixin._registry_version == version
+
     def test_tools_generated_for_model(self):
         """Test that correct tools are generated for Article model."""
         article_tools = MCPAdminMixin.get_mcp_tools(Article)
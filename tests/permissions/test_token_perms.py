@@ -132,6 +132,32 @@ class TestTokenPermissions:
         assert "tests.change_article" in all_perms  # from group
         assert "tests.add_article" in all_perms  # direct
 
+    def test_has_perm_uses_one_query(self, django_assert_num_queries):
+        """Test that a group permission is found with a single query."""
+        content_type = ContentType.objects.get_for_model(Article)
+        group = Group.objects.create(name="Article Editors")
+        group.permissions.add(Permission.objects.get(content_type=content_type, codename="change_article"))
+        token = MCPTokenFactory()
+        token.groups.add(group)
+
+        with django_assert_num_queries(1):
+            assert token.has_perm("tests.change_article")
+
+    def test_get_all_permissions_uses_one_query(self, django_assert_num_queries):
+        """Test that direct and group permissions are read together, without duplicates."""
+        content_type = ContentType.objects.get_for_model(Article)
+        change_perm = Permission.objects.get(content_type=content_type, codename="change_article")
+        group = Group.objects.create(name="Article Editors")
+        group.permissions.add(change_perm)
+        token = MCPTokenFactory()
+        token.groups.add(group)
+        token.permissions.add(change_perm)
+
+        with django_assert_num_queries(1):
+            all_perms = token.get_all_permissions()
+
+        assert all_perms == {"tests.change_article"}
+
     def test_has_perms_checks_multiple_permissions(self):
         """Test has_perms checks all given permissions."""
         token = MCPTokenFactory()
@@ -146,3 +172,26 @@ class TestTokenPermissions:
         assert token.has_perms(["tests.view_article", "tests.add_article"])
         # Should fail when any permission is missing
         assert not token.has_perms(["tests.view_article", "tests.change_article"])
+
+    def test_has_perms_uses_one_query(self, django_assert_num_queries):
+        """Test that direct and group permissions are checked together in one query."""
+        token = MCPTokenFactory()
+        content_type = ContentType.objects.get_for_model(Article)
+        # Join the content type up front; has_perms() reads it from Permission objects
+        view_perm = Permission.objects.select_related("content_type").get(
+            content_type=content_type, codename="view_article"
+        )
+        group = Group.objects.create(name="Article Editors")
+        group.permissions.add(Permission.objects.get(content_type=content_type, codename="change_article"))
+        token.permissions.add(view_perm)
+        token.groups.add(group)
+
+        with django_assert_num_queries(1):
+            assert token.has_perms(["tests.view_article", view_perm, "tests.change_article"])
+
+    def test_has_perms_rejects_permission_without_app_label(self):
+        """Test that has_perms fails when any permission string lacks an app label."""
+        token = MCPTokenFactory()
+
+        assert not token.has_perms(["view_article"])
+        assert token.has_perms([])
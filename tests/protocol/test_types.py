@@ -193,6 +193,11 @@ class TestJsonRpcResponse:
         # Verify error is excluded when None
         assert "error" not in data
 
+    def test_response_json_serialization_excludes_none(self):
+        """Test JsonRpcResponse JSON output leaves out None values like model_dump()."""
+        response = JsonRpcResponse(id=1, result=["tool1", "tool2"])
+        assert response.model_dump_json() == '{"jsonrpc":"2.0","id":1,"result":["tool1","tool2"]}'
+
     def test_response_with_nested_error(self):
         """Test JsonRpcResponse with error serializes correctly."""
         response = JsonRpcResponse(id=1, error=JsonRpcError(code=-32601, message="Method not found"))
@@ -2,6 +2,8 @@
 Tests for token security (hashing and salt)
 """
 
+import hashlib
+
 import pytest
 from django.db import IntegrityError
 
@@ -129,6 +131,25 @@ class TestTokenSecurity:
         hash3 = MCPToken._hash_token(token_str, "different_salt")
         assert hash1 != hash3
 
+    def test_hash_matches_salted_sha256(self):
+        """Test that the hash stays SHA-256 of salt + secret, so existing tokens keep verifying."""
+        expected = hashlib.sha256(b"test_salttest_token_12345").hexdigest()
+
+        assert MCPToken._hash_token("test_token_12345", "test_salt") == expected
+
+    def test_verify_many_matches_verify_secret(self):
+        """Test that batch verification agrees with verifying each secret alone."""
+        first = MCPTokenFactory()
+        second = MCPTokenFactory()
+        _, first_secret = MCPToken.parse_token(first.plaintext_token)
+        _, second_secret = MCPToken.parse_token(second.plaintext_token)
+
+        results = MCPToken.verify_many(
+            [(first, first_secret), (second, second_secret), (first, second_secret), (first, "wrong")]
+        )
+
+        assert results == [True, True, False, False]
+
     def test_token_verification_after_reload(self):
         """Test that token can be verified after reloading from database."""
         token = MCPTokenFactory()
@@ -235,6 +256,12 @@ class TestTokenFormat:
         result = MCPToken.parse_token("mcp_keyonly")
         assert result is None
 
+    def test_parse_token_rejects_wrong_key_length(self):
+        """Test parse_token rejects keys that can't match a generated key."""
+        assert MCPToken.parse_token("mcp_short.secret") is None
+        assert MCPToken.parse_token(f"mcp_{'k' * 17}.secret") is None
+        assert MCPToken.parse_token(f"mcp_{'k' * 16}.secret") == ("k" * 16, "secret")
+
     def test_parse_token_empty(self):
         """Test parse_token rejects empty tokens."""
         assert MCPToken.parse_token("") is None
@@ -249,6 +276,19 @@ class TestTokenFormat:
         assert found is not None
         assert found.id == token.id
 
+    def test_get_by_key_loads_only_auth_fields(self, django_assert_num_queries):
+        """Test get_by_key defers columns authentication doesn't read."""
+        token = MCPTokenFactory()
+        _key, secret = MCPToken.parse_token(token.plaintext_token)
+
+        with django_assert_num_queries(1):
+            found = MCPToken.get_by_key(token.token_key)
+            assert found.verify_secret(secret)
+            assert found.is_valid()
+            assert found.user.username == token.user.username
+
+        assert found.get_deferred_fields() == {"name", "created_at"}
+
     def test_get_by_key_ignores_inactive_token(self):
         """Test get_by_key ignores inactive tokens."""
         token = MCPTokenFactory(is_active=False)
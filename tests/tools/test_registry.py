@@ -5,6 +5,7 @@ Tests tool registration, routing, and schema generation.
 """
 
 import json
+from unittest.mock import patch
 
 import pytest
 from asgiref.sync import sync_to_async
@@ -15,6 +16,7 @@ from django_admin_mcp.protocol.types import TextContent, Tool
 from django_admin_mcp.tools import (
     HANDLERS,
     call_tool,
+    get_batch_execute_tool,
     get_find_models_tool,
     get_model_tools,
     get_tools,
@@ -22,8 +24,9 @@ from django_admin_mcp.tools import (
 from django_admin_mcp.tools.registry import (
     _format_fields_doc,
     _get_field_info,
+    _get_fields_doc,
 )
-from tests.models import Author
+from tests.models import Article, Author
 
 
 class TestHandlersRegistry:
@@ -116,6 +119,74 @@ class TestCallTool:
         assert "Unknown operation" in data["error"]
 
 
+class TestBatchExecute:
+    """Test the batch_execute tool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_batch_returns_results_in_call_order(self, django_setup_with_admin):
+        """batch_execute should run each call and return the results in order."""
+        request = RequestFactory().get("/")
+        request.user = None
+
+        result = await call_tool(
+            "batch_execute",
+            {"operations": [{"name": "find_models", "arguments": {"query": "author"}}, {"name": "invalidformat"}]},
+            request,
+        )
+
+        data = json.loads(result[0].text)
+        assert data["count"] == 2
+        assert [entry["name"] for entry in data["results"]] == ["find_models", "invalidformat"]
+        assert "models" in data["results"][0]["result"]
+        assert "Invalid tool name format" in data["results"][1]["result"]["error"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_batch_stop_on_error_skips_remaining(self, django_setup_with_admin):
+        """batch_execute should skip calls that haven't started once one fails with stop_on_error."""
+        request = RequestFactory().get("/")
+        request.user = None
+
+        result = await call_tool(
+            "batch_execute",
+            {
+                "operations": [{"name": "invalidformat"}, {"name": "find_models"}],
+                "max_concurrent": 1,
+                "stop_on_error": True,
+            },
+            request,
+        )
+
+        data = json.loads(result[0].text)
+        assert "error" in data["results"][0]["result"]
+        assert data["results"][1] == {"name": "find_models", "skipped": True}
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_batch_rejects_nesting_and_bad_input(self, django_setup_with_admin):
+        """batch_execute should reject nested batches and malformed operations."""
+        request = RequestFactory().get("/")
+        request.user = None
+
+        result = await call_tool(
+            "batch_execute", {"operations": [{"name": "batch_execute"}, {"arguments": {}}]}, request
+        )
+        data = json.loads(result[0].text)
+        assert "nested" in data["results"][0]["result"]["error"]
+        assert "name" in data["results"][1]["result"]["error"]
+
+        result = await call_tool("batch_execute", {"operations": []}, request)
+        assert "error" in json.loads(result[0].text)
+
+    def test_get_batch_execute_tool_returns_tool(self):
+        """get_batch_execute_tool should return a Tool requiring operations."""
+        tool = get_batch_execute_tool()
+
+        assert tool.name == "batch_execute"
+        assert tool.inputSchema["required"] == ["operations"]
+
+
 class TestGetFieldInfo:
     """Test _get_field_info function."""
 
@@ -140,6 +211,32 @@ class TestGetFieldInfo:
         assert "required" in name_field
         assert "type" in name_field
 
+    @pytest.mark.django_db
+    def test_get_field_info_skips_reverse_relations(self, django_setup_with_admin):
+        """_get_field_info should only list forward fields."""
+
+        field_names = [f["name"] for f in _get_field_info(Author)]
+
+        assert field_names == ["id", "name", "email", "bio"]
+
+
+class TestGetFieldsDoc:
+    """Test _get_fields_doc function."""
+
+    @pytest.mark.django_db
+    def test_get_fields_doc_matches_field_info(self, django_setup_with_admin):
+        """_get_fields_doc should format the model's field info."""
+
+        assert _get_fields_doc(Author) == _format_fields_doc(_get_field_info(Author))
+
+    @pytest.mark.django_db
+    def test_get_fields_doc_is_cached(self, django_setup_with_admin):
+        """_get_fields_doc should only walk the model fields once."""
+        _get_fields_doc(Author)
+        with patch("django_admin_mcp.tools.registry._get_field_info") as mock_field_info:
+            _get_fields_doc(Author)
+        mock_field_info.assert_not_called()
+
 
 class TestFormatFieldsDoc:
     """Test _format_fields_doc function."""
@@ -216,6 +313,32 @@ class TestGetModelTools:
         assert "required" in get_tool.inputSchema
         assert "id" in get_tool.inputSchema["required"]
 
+    @pytest.mark.django_db
+    def test_get_model_tools_is_cached(self, django_setup_with_admin):
+        """get_model_tools should build tools once and return fresh lists of the same Tools."""
+        first = get_model_tools(Author)
+        with patch("django_admin_mcp.tools.registry._build_model_tools") as mock_build:
+            second = get_model_tools(Author)
+        mock_build.assert_not_called()
+
+        assert second is not first
+        assert [t.name for t in second] == [t.name for t in first]
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    @pytest.mark.django_db
+    def test_model_tools_share_constant_schemas(self, django_setup_with_admin):
+        """Model-independent schema parts should be shared between models, not copied."""
+        author_tools = {t.name.split("_", 1)[0]: t for t in get_model_tools(Author)}
+        article_tools = {t.name.split("_", 1)[0]: t for t in get_model_tools(Article)}
+
+        for operation in ("list", "action", "bulk", "autocomplete"):
+            author_props = author_tools[operation].inputSchema["properties"]
+            assert author_props is article_tools[operation].inputSchema["properties"]
+        author_get = author_tools["get"].inputSchema["properties"]
+        article_get = article_tools["get"].inputSchema["properties"]
+        assert author_get["pretty"] is article_get["pretty"]
+        assert author_get["id"]["description"] != article_get["id"]["description"]
+
 
 class TestGetFindModelsTool:
     """Test get_find_models_tool function."""
@@ -242,6 +365,12 @@ class TestGetTools:
         tool_names = [t.name for t in tools]
         assert "find_models" in tool_names
 
+    @pytest.mark.django_db
+    def test_get_tools_includes_batch_execute(self, django_setup_with_admin):
+        """get_tools should include the batch_execute tool."""
+        tool_names = [t.name for t in get_tools()]
+        assert "batch_execute" in tool_names
+
     @pytest.mark.django_db
     def test_get_tools_includes_model_tools(self, django_setup_with_admin):
         """get_tools should include tools for exposed models."""